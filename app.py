@@ -1,16 +1,24 @@
 from flask import Flask
 
-from blueprint import job_bp, test_bp
+from blueprint import job_bp, test_bp, metrics_bp
+from config import JobConfig, TestCaseConfig
 
 # 초기화 시에 필수 입력 매개변수는 import_name 으로, Flask 애플리케이션의 패키지나 모듈(소스 파일) 이름을 지정한다.
 # Flask(__name__)는 현재 파일(app.py)을 기준으로 경로를 설정하도록 함
 # 이 초기화 방식은 Flask는 현재 모듈이 어디에서 실행되는지 자동으로 파악할 수 있음
 app = Flask(__name__)
+# Content-Length 없이 전송되는 본문도 읽는 도중 최대 크기를 넘으면 413 응답
+# (/job/batch 요청만 블루프린트에서 요청 단위로 MAX_BATCH_REQUEST_BODY_BYTES를 적용)
+app.config["MAX_CONTENT_LENGTH"] = JobConfig.MAX_REQUEST_BODY_BYTES
+
+# 재시작 없이 테스트 케이스, 시간/메모리 제한 설정 변경을 반영 (설정 파일 주기적 확인 또는 시그널 수신 시 다시 로드)
+TestCaseConfig.start_auto_reload()
 
 
 if __name__ == '__main__':
     app.register_blueprint(job_bp, url_prefix='/job')
     app.register_blueprint(test_bp, url_prefix='/test')
+    app.register_blueprint(metrics_bp, url_prefix='/metrics')
 
     app.run()
     #app.run(host="0.0.0.0", port=5000)
@@ -0,0 +1,46 @@
+import logging
+
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from quart import Quart, Response
+
+from blueprint.async_job import async_job_bp, JobApiRequest
+from config import JobConfig, TestCaseConfig
+from redisutil import RedisConnectionError
+from redisutil.repository import async_redis_connection
+
+# 비동기(ASGI) 배포 모드 진입점
+# app.py(Flask, WSGI)와 동일한 /job API를 제공하며, ASGI 서버로 실행한다.
+# ex) hypercorn async_app:app --bind 0.0.0.0:5000
+app = Quart(__name__)
+# Content-Length 없이 전송되는 본문도 읽는 도중 최대 크기를 넘으면 413 응답
+# (/job/batch 요청만 JobApiRequest가 요청 단위로 MAX_BATCH_REQUEST_BODY_BYTES를 적용)
+app.config["MAX_CONTENT_LENGTH"] = JobConfig.MAX_REQUEST_BODY_BYTES
+app.request_class = JobApiRequest
+
+# 재시작 없이 테스트 케이스, 시간/메모리 제한 설정 변경을 반영 (설정 파일 주기적 확인 또는 시그널 수신 시 다시 로드)
+TestCaseConfig.start_auto_reload()
+app.register_blueprint(async_job_bp, url_prefix='/job')
+
+
+# Prometheus 수집(scrape)용 메트릭 엔드포인트
+@app.route('/metrics', methods=['GET'])
+async def metrics():
+    return Response(generate_latest(), status=200, content_type=CONTENT_TYPE_LATEST)
+
+
+@app.before_serving
+async def connect_redis():
+    try:
+        await async_redis_connection.ping()
+    except RedisConnectionError as ex:
+        logging.error(ex)
+        raise
+
+
+@app.after_serving
+async def close_redis():
+    await async_redis_connection.close()
+
+
+if __name__ == '__main__':
+    app.run()
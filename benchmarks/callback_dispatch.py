@@ -0,0 +1,112 @@
+# 콜백 전송 벤치마크: python -m benchmarks.callback_dispatch
+# 로컬 수신기(blueprint.test의 test_bp)를 띄우고, 워커 여러 개가 작업마다 테스트 케이스 별 평가 결과와 채점 완료 이벤트를 보낼 때
+# 이벤트마다 요청을 보내는 기존 방식과 CallbackDispatcher(실패 주입 포함)의 HTTP 요청 수, 묶음 크기, 수신 지연 시간,
+# 워커가 콜백 전송에 쓰는 시간을 비교
+import logging
+import statistics
+import threading
+import time
+
+import flask
+import requests
+from werkzeug.serving import make_server
+
+from blueprint.helper import _generate_hmac_key
+from blueprint.test import test_bp
+from common import CallbackEventType
+from config import WebhookConfig
+from webhookutil import CallbackDispatcher, CallbackOutbox, callback_outbox
+
+
+WORKERS = 8
+JOBS_PER_WORKER = 25
+TEST_CASES = 20
+TEST_CASE_SECONDS = 0.002 # 테스트 케이스 하나의 실행 시간
+
+# 수신 기록 조회, 실패 주입 요청에 사용하는 API 키
+HEADERS = {"X-Api-Key": _generate_hmac_key("benchmark"), "X-Client-Id": "benchmark"}
+
+PATHS = {
+    CallbackEventType.TEST_CASE_RESULT: WebhookConfig.TEST_CASE_RESULTS_PATH,
+    CallbackEventType.JUDGMENT_PASSED: WebhookConfig.JUDGMENT_PASSED_PATH,
+    CallbackEventType.JUDGMENT_UNPASSED: WebhookConfig.JUDGMENT_UNPASSED_PATH,
+    CallbackEventType.ERROR: WebhookConfig.ERROR_PATH,
+}
+
+
+def _per_event_post(base_url: str):
+    def _post(event_type: CallbackEventType, payload: dict):
+        path = "/test-case-result" if event_type == CallbackEventType.TEST_CASE_RESULT else PATHS[event_type]
+        requests.post(base_url + path, json=payload, timeout=(2.0, 5.0))
+    return _post
+
+
+def _stand_in_worker(worker_id: int, send, send_seconds: list):
+    for job_index in range(JOBS_PER_WORKER):
+        job_id = f"{worker_id}-{job_index}"
+        for test_case_index in range(TEST_CASES):
+            time.sleep(TEST_CASE_SECONDS)
+            start = time.perf_counter()
+            send(CallbackEventType.TEST_CASE_RESULT, {
+                "jobId": job_id, "testCaseIndex": test_case_index, "passed": True, "sentAt": time.time()
+            })
+            send_seconds.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        send(CallbackEventType.JUDGMENT_PASSED, {"jobId": job_id, "sentAt": time.time()})
+        send_seconds.append(time.perf_counter() - start)
+
+
+def _measure(base_url: str, name: str, send, wait_delivered, failure_rate: float = 0.0):
+    requests.delete(f"{base_url}/callback-stats", headers=HEADERS)
+    requests.post(f"{base_url}/callback-faults", json={"failureRate": failure_rate}, headers=HEADERS)
+    send_seconds = []
+    workers = [threading.Thread(target=_stand_in_worker, args=(i, send, send_seconds)) for i in range(WORKERS)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wait_delivered()
+    stats = requests.get(f"{base_url}/callback-stats", headers=HEADERS).json()
+    quantiles = statistics.quantiles(send_seconds, n=100)
+    print(f"[{name}]")
+    print(
+        f"  delivered {stats['events']}/{WORKERS * JOBS_PER_WORKER * (TEST_CASES + 1)} events in {stats['requests']} requests "
+        f"({stats['failedRequests']} failed, {stats['duplicates']} duplicates), "
+        f"batch mean {stats['meanBatchSize']:.1f} / max {stats['maxBatchSize']}"
+    )
+    print(f"  receive latency p50 {stats['latencyP50Ms']:.1f} ms, p99 {stats['latencyP99Ms']:.1f} ms")
+    print(f"  worker time per event p50 {quantiles[49] * 1000:.3f} ms, p99 {quantiles[98] * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    app = flask.Flask(__name__)
+    app.register_blueprint(test_bp, url_prefix="/test")
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/test"
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    logging.getLogger().setLevel(logging.CRITICAL) # 실패 주입으로 발생하는 전송 실패 로그 생략
+
+    _measure(base_url, "one POST per event (new connection)", _per_event_post(base_url), lambda: None)
+
+    outbox = CallbackOutbox(callback_outbox._redis_client, "callback-outbox-benchmark")
+    dispatcher = CallbackDispatcher(
+        outbox, base_url, PATHS,
+        batch_window_seconds=WebhookConfig.BATCH_WINDOW_SECONDS, max_batch_size=WebhookConfig.MAX_BATCH_SIZE,
+        buffer_size=WebhookConfig.BUFFER_SIZE, connect_timeout=2.0, read_timeout=5.0, pool_maxsize=WebhookConfig.POOL_MAXSIZE,
+        max_attempts=20, retry_base_seconds=0.05, retry_max_seconds=1.0, retry_poll_interval=0.05
+    )
+
+    def _wait_dispatcher_delivered():
+        dispatcher.flush()
+        while outbox.pending_count():
+            time.sleep(0.05)
+
+    _measure(
+        base_url, f"CallbackDispatcher (window {WebhookConfig.BATCH_WINDOW_SECONDS * 1000:.0f} ms)",
+        dispatcher.dispatch, _wait_dispatcher_delivered
+    )
+    _measure(
+        base_url, "CallbackDispatcher (20% of requests fail)", dispatcher.dispatch, _wait_dispatcher_delivered, failure_rate=0.2
+    )
+    server.shutdown()
@@ -0,0 +1,41 @@
+# 저장 형식별 크기 비교 벤치마크: python -m benchmarks.code_compression
+# 제출 코드와 비슷한 형태의 코드 묶음을 none/zlib/zstd로 저장했을 때의 크기를 base64 문자열 크기와 비교
+import base64
+import random
+
+from common import CodeCompressor
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    lines = [
+        "import sys",
+        "input = sys.stdin.readline",
+        "n = int(input())",
+        "arr = list(map(int, input().split()))",
+        "for i in range(n):",
+        "    if arr[i] % 2 == 0:",
+        "        print(arr[i])",
+        "def solve(a, b):",
+        "    return (a * b) % 1_000_000_007",
+        "#include <stdio.h>",
+        "int main(void) { int n; scanf(\"%d\", &n); printf(\"%d\\n\", n); return 0; }",
+    ]
+    corpus = [
+        base64.b64encode("\n".join(random.choice(lines) for _ in range(line_count)).encode("utf-8")).decode("ascii")
+        for line_count in [5, 20, 50, 100, 300, 1000, 5000, 30000] for _ in range(10)
+    ]
+    base64_size = sum(len(code) for code in corpus)
+
+    for algorithm in ("none", "zlib", "zstd"):
+        try:
+            compressor = CodeCompressor(algorithm, min_size=1024)
+        except ImportError:
+            print(f"{algorithm}: zstandard 패키지가 설치되어 있지 않음")
+            continue
+        stored_size = 0
+        for code in corpus:
+            encoding, stored = compressor.compress(code)
+            assert compressor.decompress(encoding, stored) == code
+            stored_size += len(stored)
+        print(f"{algorithm}: {stored_size} bytes ({stored_size / base64_size * 100:.1f}% of base64)")
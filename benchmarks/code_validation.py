@@ -0,0 +1,23 @@
+# 코드 검증 메모리 벤치마크: python -m benchmarks.code_validation
+# 1MB 코드 검증 시 최대 추가 메모리 사용량을 코드 전체를 한 번에 디코딩하는 방식과 validate_code()로 비교
+# (코드 문자열 자체는 측정 대상에서 제외)
+import base64
+import tracemalloc
+
+from blueprint.helper import validate_code
+from config import JobConfig
+
+
+def _validate_code_at_once(code_base64: str) -> bool:
+    return bool(base64.b64decode(code_base64, validate=True).decode("utf-8").strip())
+
+
+if __name__ == "__main__":
+    code = base64.b64encode(("print('가나다')\n" * (JobConfig.MAX_CODE_BYTES // 20)).encode("utf-8")).decode("ascii")
+
+    for validate in (_validate_code_at_once, validate_code):
+        tracemalloc.start()
+        validate(code)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{validate.__name__}: peak {peak / 1024:.1f} KiB")
@@ -0,0 +1,75 @@
+# 작업 중지 전달 벤치마크: python -m benchmarks.job_cancel
+# 대체 워커(테스트 케이스 실행 대신 짧게 대기하며 중지 여부를 확인)로 중지 요청(/job/cancel과 같은 update 호출)부터
+# 워커가 작업을 멈출 때까지의 지연 시간과, 중지 여부 확인에 사용한 Redis 명령 수를 비교
+import statistics
+import threading
+import time
+
+from common import CodeLanguage
+from redisutil.repository import job_repository
+from redisutil.repository.job_cancel_listener import JobCancelListener
+from schema.job import CodeChallengeJudgmentJob as Job
+
+
+JOBS = 200
+RUN_SECONDS = 0.05 # 중지 요청 전 작업 실행 시간
+POLL_INTERVAL = 0.1 # 이전 방식(중지 플래그 주기적 조회)의 조회 간격
+
+
+def _stand_in_worker(should_stop, stopped_at: list, redis_calls: list):
+    while not should_stop(redis_calls):
+        time.sleep(0.0005) # 테스트 케이스 실행 단위
+    stopped_at.append(time.perf_counter())
+
+
+def _measure(name: str, create_should_stop):
+    latencies, total_redis_calls = [], 0
+    for _ in range(JOBS):
+        job = Job.create(code_language=CodeLanguage.PYTHON3, code="cHJpbnQoMSk=", challenge_id=1, total_test_cases=1)
+        job_repository.save(1, job, 60)
+        stopped_at, redis_calls = [], []
+        should_stop, cleanup = create_should_stop(job.job_id, redis_calls)
+        worker = threading.Thread(target=_stand_in_worker, args=(should_stop, stopped_at, redis_calls))
+        worker.start()
+        time.sleep(RUN_SECONDS)
+        cancelled_at = time.perf_counter()
+        job_repository.update(job_id=job.job_id, user_id=1, stop_flag=True)
+        worker.join()
+        cleanup()
+        job_repository.delete(job.job_id, 1)
+        latencies.append(stopped_at[0] - cancelled_at)
+        total_redis_calls += len(redis_calls)
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name}: cancel-to-stop p50 {quantiles[49] * 1000:.2f} ms, p99 {quantiles[98] * 1000:.2f} ms, "
+        f"Redis calls per job {total_redis_calls / JOBS:.1f}"
+    )
+
+
+def _polling(job_id: str, redis_calls: list):
+    next_poll = [0.0]
+
+    def _should_stop(redis_calls: list) -> bool:
+        if time.perf_counter() < next_poll[0]:
+            return False
+        next_poll[0] = time.perf_counter() + POLL_INTERVAL
+        redis_calls.append(1)
+        return bool(job_repository.find_stop_flag(job_id, 1))
+    return _should_stop, lambda: None
+
+
+def _push(listener: JobCancelListener):
+    def _create_should_stop(job_id: str, redis_calls: list):
+        redis_calls.append(1) # watch()의 중지 요청 키 확인
+        event = listener.watch(job_id)
+        return lambda redis_calls: event.is_set(), lambda: listener.unwatch(job_id)
+    return _create_should_stop
+
+
+if __name__ == "__main__":
+    listener = JobCancelListener(job_repository._redis_client)
+    listener.start()
+
+    _measure(f"polling stop flag every {POLL_INTERVAL * 1000:.0f} ms", _polling)
+    _measure("pub/sub (JobCancelListener)", _push(listener))
+    listener.close()
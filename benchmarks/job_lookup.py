@@ -0,0 +1,89 @@
+# 작업 조회 벤치마크: python -m benchmarks.job_lookup [작업 수 ...] (기본: 10000 100000 1000000)
+# 키스페이스의 작업 수를 늘려 가며 이전 방식(SCAN)과 인덱스 방식의 조회 시간을 비교 (Redis 서버 필요)
+# - 작업 소유자 조회: SCAN "*:{job_id}" (첫 번째 키) vs GET "job-owner:{job_id}" (find_user_id_by_job_id)
+# - 유저의 작업 개수 조회: SCAN "{user_id}:*" vs 인덱스 ZCARD (count_by_user_id)
+# - 벤치마크 데이터는 BENCHMARK_REDIS_DB(기본 15)에 기록하고, 측정 전후로 해당 DB를 비움 (서비스 DB와 분리)
+import os
+import statistics
+import sys
+import time
+import uuid
+
+from config import RedisConfig
+from redisutil import RedisConnection
+from redisutil.repository.code_challenge_judgment_job_repository import CodeChallengeJudgmentJobRepository
+
+
+JOBS_PER_USER = 10
+FILL_BATCH_SIZE = 10_000
+# 이전 방식은 키스페이스 전체를 순회하므로, 작업 수가 많을수록 측정 횟수를 줄임
+SCAN_SAMPLES = {10_000: 20, 100_000: 5, 1_000_000: 2}
+INDEX_SAMPLES = 1000
+
+
+def _fill(client, job_count: int) -> list[tuple[int, str]]:
+    """작업 hash, 유저별 인덱스, 소유자 역매핑을 job_count개 기록하고 (user_id, job_id) 목록을 반환한다."""
+    now = int(time.time())
+    user_jobs = [(index // JOBS_PER_USER, uuid.uuid4().hex) for index in range(job_count)]
+    for start in range(0, job_count, FILL_BATCH_SIZE):
+        pipeline = client.pipeline(transaction=False)
+        for user_id, job_id in user_jobs[start:start + FILL_BATCH_SIZE]:
+            pipeline.hset(f"{user_id}:{job_id}", mapping={"meta": "{}", "stopFlag": "0", "code": ""})
+            pipeline.set(f"job-owner:{job_id}", user_id)
+            pipeline.zadd(f"job-index:{user_id}", {job_id: now + 3600})
+        pipeline.execute()
+    return user_jobs
+
+
+def _measure(func, arguments: list) -> tuple[float, float]:
+    """arguments 각각으로 func를 호출한 처리 시간의 (p50, p99)를 ms 단위로 반환한다."""
+    samples = []
+    for argument in arguments:
+        start = time.perf_counter()
+        func(argument)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def _print(job_count: int, name: str, baseline: tuple[float, float], indexed: tuple[float, float]):
+    print(
+        f"{job_count:>9,} jobs | {name:12}: SCAN p50 {baseline[0]:10.2f} ms, p99 {baseline[1]:10.2f} ms | "
+        f"index p50 {indexed[0]:6.3f} ms, p99 {indexed[1]:6.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    job_counts = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    repository = CodeChallengeJudgmentJobRepository(RedisConnection(
+        host=RedisConfig.HOST,
+        port=RedisConfig.PORT,
+        password=RedisConfig.PASSWORD,
+        db=int(os.getenv("BENCHMARK_REDIS_DB", "15")),
+        pool_name="benchmark"
+    ))
+    client = repository._redis_client
+
+    for job_count in job_counts:
+        client.flushdb()
+        user_jobs = _fill(client, job_count)
+        scan_samples = SCAN_SAMPLES.get(job_count, 2)
+        step = max(1, job_count // INDEX_SAMPLES)
+
+        _print(
+            job_count, "owner",
+            _measure(
+                lambda job_id: next(client.scan_iter(f"*:{job_id}"), None),
+                [job_id for _, job_id in user_jobs[::max(1, job_count // scan_samples)]]
+            ),
+            _measure(repository.find_user_id_by_job_id, [job_id for _, job_id in user_jobs[::step]])
+        )
+        _print(
+            job_count, "count(user)",
+            _measure(
+                lambda user_id: sum(1 for _ in client.scan_iter(f"{user_id}:*")),
+                [user_id for user_id, _ in user_jobs[::max(1, job_count // scan_samples)]]
+            ),
+            _measure(repository.count_by_user_id, [user_id for user_id, _ in user_jobs[::step]])
+        )
+    client.flushdb()
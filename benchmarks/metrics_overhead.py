@@ -0,0 +1,82 @@
+# 계측 오버헤드 벤치마크: python -m benchmarks.metrics_overhead
+# 같은 요청 흐름(/job/create -> /job -> /job/verdicts)을 METRICS_ENABLED=false(계측 없음), true로 각각 별도 프로세스에서 실행하여
+# 요청 한 건당 처리 시간과 API 서버 프로세스의 CPU 시간(Redis 서버 처리 시간 제외)을 비교 (Redis 서버 필요)
+# - 설정은 import 시점에 읽으므로 프로세스를 나누어 실행
+# - 실행할수록 Redis 서버 상태 등에 따라 처리 시간이 달라지므로, 짧은 실행을 false/true 순서를 번갈아(ABBA) 반복하고
+#   나란히 실행한 두 결과의 차이의 중앙값을 오버헤드로 사용
+import base64
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+REQUEST_COUNT = 300 # 실행 한 번의 요청 흐름 수
+ROUNDS = 12 # false/true 실행 쌍의 수
+
+
+def _run_requests() -> dict[str, list[tuple[float, float]]]:
+    # 설정(METRICS_ENABLED)을 읽는 모듈은 실행 프로세스(--worker)에서만 import
+    import flask
+
+    from blueprint.helper import _generate_hmac_key
+    from blueprint.job import job_bp
+    from redisutil.repository import job_repository
+
+    app = flask.Flask(__name__)
+    app.register_blueprint(job_bp, url_prefix='/job')
+    client = app.test_client()
+    headers = {"X-Api-Key": _generate_hmac_key("benchmark"), "X-Client-Id": "benchmark"}
+    code = base64.b64encode(b"import sys\nprint(sum(map(int, sys.stdin.read().split())))\n" * 20).decode("ascii")
+
+    # 경로별 (처리 시간, CPU 시간)
+    samples: dict[str, list[tuple[float, float]]] = {"/job/create": [], "/job": [], "/job/verdicts": []}
+
+    def _post(path: str, body: dict) -> dict:
+        start, cpu_start = time.perf_counter(), time.process_time()
+        response = client.post(path, json=body, headers=headers)
+        samples[path].append((time.perf_counter() - start, time.process_time() - cpu_start))
+        if response.status_code >= 300:
+            raise RuntimeError(f"{path} failed: {response.status_code} {response.get_data(as_text=True)}")
+        return response.get_json()
+
+    user_id_offset = int(time.time() * 1000)
+    for sequence in range(REQUEST_COUNT):
+        user_id = user_id_offset + sequence
+        job_id = _post("/job/create", {"userId": user_id, "challengeId": 1, "codeLanguage": "python3", "code": code})["jobId"]
+        _post("/job", {"userId": user_id, "jobId": job_id})
+        _post("/job/verdicts", {"userId": user_id, "jobId": job_id})
+        job_repository.delete(job_id, user_id)
+    return samples
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--worker"]:
+        print(json.dumps(_run_requests()))
+        sys.exit(0)
+
+    # 설정 -> 경로 -> 실행별 (처리 시간 중앙값, 평균 CPU 시간)
+    rounds: dict[str, dict[str, list[tuple[float, float]]]] = {"false": {}, "true": {}}
+    for round_index in range(ROUNDS):
+        for enabled in (("false", "true") if round_index % 2 == 0 else ("true", "false")):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.metrics_overhead", "--worker"],
+                env={**os.environ, "METRICS_ENABLED": enabled}, capture_output=True, text=True, check=True
+            ).stdout
+            for path, samples in json.loads(output.splitlines()[-1]).items():
+                rounds[enabled].setdefault(path, []).append((
+                    statistics.median(wall for wall, _ in samples), statistics.mean(cpu for _, cpu in samples)
+                ))
+
+    for path, baseline_rounds in rounds["false"].items():
+        pairs = list(zip(baseline_rounds, rounds["true"][path]))
+        wall_baseline = statistics.median(wall for (wall, _), _ in pairs) * 1e6
+        cpu_baseline = statistics.median(cpu for (_, cpu), _ in pairs) * 1e6
+        wall_overhead = statistics.median(on_wall - off_wall for (off_wall, _), (on_wall, _) in pairs) * 1e6
+        cpu_overhead = statistics.median(on_cpu - off_cpu for (_, off_cpu), (_, on_cpu) in pairs) * 1e6
+        print(
+            f"{path:14}: p50 {wall_baseline:7.1f} us, overhead {wall_overhead:+6.1f} us | "
+            f"CPU {cpu_baseline:7.1f} us, overhead {cpu_overhead:+6.1f} us ({cpu_overhead / cpu_baseline * 100:+.1f}%)"
+        )
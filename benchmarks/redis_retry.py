@@ -0,0 +1,160 @@
+# Redis 장애 주입 벤치마크: python -m benchmarks.redis_retry
+# 로컬 대체 프록시(Redis 앞단 TCP 중계)로 장애 조치(failover)처럼 일정 시간 응답이 없는 구간을 만든 뒤,
+# 일정한 비율로 들어오는 요청(요청마다 스레드 하나, 저장소 호출 3번)의 처리 시간 분포와 동시에 처리 중인 요청 수(쌓인 스레드 수)를
+# 이전 재시도 방식(모든 예외 재시도, 0.5초부터 2배씩 대기, 호출마다 별도 예산)과 RetryPolicy(+ CircuitBreaker)로 비교
+import logging
+import socket
+import statistics
+import threading
+import time
+from typing import Callable, Optional
+
+import redis
+
+from config import RedisConfig
+from redisutil import RetryPolicy, CircuitBreaker, start_retry_deadline, clear_retry_deadline
+
+
+REQUEST_RATE = 100 # 초당 요청 수
+DURATION = 6.0 # 초
+FAULT_START, FAULT_END = 1.0, 4.0 # 응답이 없는 구간 (초)
+SOCKET_TIMEOUT = 0.25 # 벤치마크용 명령 응답 대기 시간 (초)
+CIRCUIT_RESET_TIMEOUT = 1.0 # 벤치마크용 서킷 open 유지 시간 (초)
+
+
+class _FaultInjectingProxy:
+    """Redis 앞단 TCP 중계. blackhole이 설정되면 연결은 받되 응답을 전달하지 않음 (응답 없는 장애)"""
+
+    def __init__(self, upstream: tuple[str, int]):
+        self._upstream = upstream
+        self.blackhole = False
+        self._listener = socket.create_server(("127.0.0.1", 0), backlog=512)
+        self.port = self._listener.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            client, _ = self._listener.accept()
+            threading.Thread(target=self._relay, args=(client,), daemon=True).start()
+
+    def _relay(self, client: socket.socket):
+        try:
+            upstream = socket.create_connection(self._upstream)
+        except OSError:
+            client.close()
+            return
+        threading.Thread(target=self._pump, args=(upstream, client), daemon=True).start()
+        self._pump(client, upstream)
+
+    def _pump(self, source: socket.socket, target: socket.socket):
+        try:
+            while data := source.recv(65536):
+                if not self.blackhole:
+                    target.sendall(data)
+        except OSError:
+            pass
+        finally:
+            # 반대 방향 중계 스레드의 recv()도 끝나도록 양쪽 소켓을 shutdown 후 close
+            for sock in (source, target):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                sock.close()
+
+
+def _legacy_retry(func: Callable, *args, **kwargs):
+    retry_interval = 0.5
+    for attempt in range(1, 4):
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            if attempt == 3:
+                raise
+            time.sleep(retry_interval)
+            retry_interval *= 2
+
+
+def _describe(latencies: list[float]) -> str:
+    quantiles = statistics.quantiles(latencies, n=100)
+    return f"p50 {quantiles[49] * 1000:5.0f} ms, p99 {quantiles[98] * 1000:5.0f} ms, max {max(latencies) * 1000:5.0f} ms"
+
+
+def _run(name: str, call: Callable, request_deadline: Optional[float]):
+    proxy = _FaultInjectingProxy((RedisConfig.HOST, RedisConfig.PORT))
+    # RedisConnection과 같이 커넥션 풀을 직접 구성 (풀의 커넥션은 redis-py 자체 재시도를 하지 않음)
+    client = redis.StrictRedis(connection_pool=redis.ConnectionPool(
+        host="127.0.0.1", port=proxy.port, password=RedisConfig.PASSWORD, db=RedisConfig.DB,
+        socket_timeout=SOCKET_TIMEOUT, socket_connect_timeout=SOCKET_TIMEOUT
+    ))
+    client.set("retry-benchmark", "1")
+    results = [] # (요청 시작 시각, 처리 시간, 실패 여부)
+    in_flight, max_in_flight = [0], [0]
+    lock = threading.Lock()
+    started_at = time.monotonic()
+
+    def _request():
+        start = time.monotonic()
+        failed = False
+        if request_deadline is not None:
+            start_retry_deadline(request_deadline)
+        try:
+            for _ in range(3):
+                call(client.get, "retry-benchmark")
+        except Exception:
+            failed = True
+        finally:
+            clear_retry_deadline()
+            with lock:
+                in_flight[0] -= 1
+                results.append((start - started_at, time.monotonic() - start, failed))
+
+    def _inject_fault():
+        time.sleep(FAULT_START)
+        proxy.blackhole = True
+        time.sleep(FAULT_END - FAULT_START)
+        proxy.blackhole = False
+
+    threading.Thread(target=_inject_fault, daemon=True).start()
+    threads = []
+    for sequence in range(int(DURATION * REQUEST_RATE)):
+        time.sleep(max(0.0, started_at + sequence / REQUEST_RATE - time.monotonic()))
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        thread = threading.Thread(target=_request)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+
+    fault_results = [result for result in results if FAULT_START <= result[0] < FAULT_END]
+    print(f"[{name}]")
+    print(f"  all requests     : {_describe([latency for _, latency, _ in results])}, max in-flight {max_in_flight[0]}")
+    print(
+        f"  during the fault : {_describe([latency for _, latency, _ in fault_results])}, "
+        f"failed {sum(failed for _, _, failed in fault_results)}/{len(fault_results)}"
+    )
+    print(f"  outside the fault: failed {sum(failed for _, _, failed in results) - sum(failed for _, _, failed in fault_results)}")
+    # 장애 종료 후 처음으로 성공한 요청의 시작 시각 (서킷이 open이면 reset_timeout만큼 늦어질 수 있음)
+    recovered_at = min((start for start, _, failed in results if start >= FAULT_END and not failed), default=None)
+    print(f"  recovered after  : {(recovered_at - FAULT_END) * 1000:.0f} ms" if recovered_at is not None else "  recovered after  : -")
+
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.CRITICAL) # 장애 구간의 재시도 로그 생략
+    _run("legacy (retry all, 0.5s x2 backoff, budget per call)", _legacy_retry, None)
+    retry_options = dict(
+        max_attempts=RedisConfig.RETRY_MAX_ATTEMPTS,
+        base_delay=RedisConfig.RETRY_BASE_DELAY,
+        max_delay=RedisConfig.RETRY_MAX_DELAY,
+        deadline_seconds=RedisConfig.RETRY_DEADLINE
+    )
+    _run("RetryPolicy (transient only, jitter, request deadline)", RetryPolicy("benchmark", **retry_options).call, RedisConfig.RETRY_DEADLINE)
+    circuit_breaker = CircuitBreaker(
+        "benchmark-circuit", failure_threshold=RedisConfig.CIRCUIT_FAILURE_THRESHOLD, reset_timeout=CIRCUIT_RESET_TIMEOUT
+    )
+    _run(
+        "RetryPolicy + CircuitBreaker",
+        RetryPolicy("benchmark-circuit", circuit_breaker=circuit_breaker, **retry_options).call, RedisConfig.RETRY_DEADLINE
+    )
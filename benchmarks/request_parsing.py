@@ -0,0 +1,37 @@
+# 요청 본문 검증/변환 벤치마크: python -m benchmarks.request_parsing
+# /job/create 요청 한 건당 요청 본문 검증 + 라우트 변환 CPU 시간 비교
+# (이전 방식: before_request에서 검증 시 변환한 값을 버리고 라우트에서 다시 변환, 테스트 케이스도 두 번 조회)
+import base64
+import timeit
+
+from blueprint.helper import parse_endpoint_request_body, validate_code
+from common import CodeLanguage
+from config import TestCaseConfig
+
+
+REQUEST_COUNT = 100000
+
+
+def _validate_then_convert_again(body: dict) -> tuple:
+    for key in ("userId", "challengeId"):
+        int(body[key])
+    if body["codeLanguage"].upper() not in [code_language.value for code_language in CodeLanguage]:
+        raise ValueError
+    TestCaseConfig.get_test_case_count(body["challengeId"])
+    validate_code(body["code"])
+    return (int(body["userId"]), CodeLanguage[body["codeLanguage"].upper()], int(body["challengeId"]),
+            TestCaseConfig.get_test_case_count(body["challengeId"]),
+            TestCaseConfig.get_time_limit(int(body["challengeId"]), CodeLanguage[body["codeLanguage"].upper()]))
+
+
+def _parse_once(body: dict) -> tuple:
+    return parse_endpoint_request_body(body, "/job/create")
+
+
+if __name__ == "__main__":
+    request_body = {"userId": "1", "challengeId": "1", "codeLanguage": "python3",
+                    "code": base64.b64encode(b"print(1)\n" * 10).decode("ascii")}
+
+    for parse in (_validate_then_convert_again, _parse_once):
+        elapsed = timeit.timeit(lambda: parse(request_body), number=REQUEST_COUNT)
+        print(f"{parse.__name__}: {elapsed / REQUEST_COUNT * 1e6:.2f} us/request")
@@ -0,0 +1,33 @@
+# 직렬화/역직렬화 마이크로 벤치마크: python -m benchmarks.schema_serialization
+# verdicts 100개를 가진 작업의 as_dict(), verdict 100개의 create_from_dict() 처리 시간 측정
+import timeit
+
+from common import CodeLanguage, FailureCause
+from schema import Verdict
+from schema.job import CodeChallengeJudgmentJob
+
+
+REPEAT = 2000
+
+
+if __name__ == "__main__":
+    job = CodeChallengeJudgmentJob.create_from_dict({
+        "jobId": "123-456",
+        "stopFlag": False,
+        "codeLanguage": CodeLanguage.JAVA17,
+        "code": "hi",
+        "challengeId": 1,
+        "totalTestCases": 100,
+        "verdicts": [
+            Verdict(False, i, 15.2, 54, FailureCause.WRONG_ANSWER, "expected 1 but got 2").as_dict() for i in range(100)
+        ],
+        "submittedAt": "1234",
+    })
+    job.verdicts = [Verdict.create_from_dict(verdict) for verdict in job.verdicts]
+    job_dict = job.as_dict()
+
+    as_dict_sec = timeit.timeit(job.as_dict, number=REPEAT)
+    create_sec = timeit.timeit(
+        lambda: [Verdict.create_from_dict(verdict) for verdict in job_dict["verdicts"]], number=REPEAT
+    )
+    print(f"as_dict: {as_dict_sec / REPEAT * 1e6:.1f}us/op, create_from_dict(verdicts x100): {create_sec / REPEAT * 1e6:.1f}us/op")
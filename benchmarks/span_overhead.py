@@ -0,0 +1,32 @@
+# 스팬 오버헤드 벤치마크: python -m benchmarks.span_overhead
+# 저장소 메서드 하나(중첩 스팬 없음)에 해당하는 스팬을 기록할 때의 추가 시간을 exporter별로 비교
+import os
+import tempfile
+import timeit
+
+from traceutil import Tracer, SpanKind, SpanStatusCode, InMemorySpanExporter, FileSpanExporter
+
+
+SPAN_COUNT = 100000
+
+
+def _record_span(tracer: Tracer):
+    with tracer.start_as_current_span(
+        "JobRepository.save", SpanKind.CLIENT, {"db.system": "redis", "db.operation": "save"}
+    ) as span:
+        span.set_status(SpanStatusCode.OK)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tracers = {
+            "disabled": Tracer("benchmark"),
+            "memory": Tracer("benchmark", InMemorySpanExporter(max_spans=SPAN_COUNT)),
+            "file": Tracer("benchmark", FileSpanExporter(os.path.join(temp_dir, "traces.jsonl"))),
+            "file, 10% sampled": Tracer("benchmark", FileSpanExporter(os.path.join(temp_dir, "sampled.jsonl")), 0.1),
+        }
+        for name, tracer in tracers.items():
+            elapsed = timeit.timeit(lambda: _record_span(tracer), number=SPAN_COUNT)
+            print(f"{name:18}: {elapsed / SPAN_COUNT * 1e6:6.2f} us/span")
+            if tracer.exporter is not None:
+                tracer.exporter.shutdown()
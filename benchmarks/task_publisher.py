@@ -0,0 +1,65 @@
+# 태스크 등록 벤치마크: python -m benchmarks.task_publisher [브로커 URL, 기본값 memory://]
+# 요청 처리 중 태스크 등록에 걸리는 시간(p50/p99)과 태스크 하나의 메시지 본문 크기를 등록 방식별로 비교
+# (memory:// 브로커는 네트워크 왕복이 없으므로, 실제 브로커 URL로 실행해야 커넥션 재사용 효과가 드러남)
+import base64
+import json
+import random
+import statistics
+import string
+import sys
+import time
+
+from celery import Celery
+from celery.signals import before_task_publish
+
+from celeryutil.publisher import TaskPublisher
+from common import CodeLanguage
+from schema.job import CodeChallengeJudgmentJob as Job
+
+
+def _percentile(samples: list[float], p: int) -> float:
+    return statistics.quantiles(samples, n=100)[p - 1] * 1000
+
+
+def _run(name: str, publish, publisher: TaskPublisher, message_bytes: list[int], count: int = 2000):
+    message_bytes.clear()
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        publish()
+        samples.append(time.perf_counter() - start)
+    flush_start = time.perf_counter()
+    publisher.flush()
+    print(
+        f"{name}: p50 {_percentile(samples, 50):.3f} ms, p99 {_percentile(samples, 99):.3f} ms, "
+        f"flush {(time.perf_counter() - flush_start) * 1000:.0f} ms, "
+        f"message {statistics.mean(message_bytes):.0f} bytes/task"
+    )
+
+
+if __name__ == "__main__":
+    broker_url = sys.argv[1] if len(sys.argv) > 1 else "memory://"
+    app = Celery("publisher-benchmark", broker=broker_url)
+
+    random.seed(0)
+    code = "".join(random.choices(string.ascii_letters + string.digits + " \n", k=16 * 1024))
+    job = Job.create(
+        code_language=CodeLanguage.PYTHON3, code=base64.b64encode(code.encode()).decode(), challenge_id=1, total_test_cases=10
+    )
+
+    message_bytes = []
+    before_task_publish.connect(lambda body, **kwargs: message_bytes.append(len(json.dumps(body))), weak=False)
+
+    publisher = TaskPublisher(app, max_buffer_size=10000, batch_size=100)
+    _run(
+        "send_task (full payload)", lambda: app.send_task("worker.tasks.execute_code", args=[1, job.as_dict()]),
+        publisher, message_bytes
+    )
+    _run(
+        "publisher (full payload)", lambda: publisher.submit("worker.tasks.execute_code", [1, job.as_dict()], {"task_id": job.job_id}),
+        publisher, message_bytes
+    )
+    _run(
+        "publisher (job id only)", lambda: publisher.submit("worker.tasks.execute_code_by_job_id", [1, job.job_id], {"task_id": job.job_id}),
+        publisher, message_bytes
+    )
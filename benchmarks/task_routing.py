@@ -0,0 +1,100 @@
+# 태스크 라우팅 시뮬레이션 벤치마크: python -m benchmarks.task_routing
+# 워커 수가 고정된 상태에서 짧은 작업과 긴 작업, 몰아서 제출하는 유저가 섞인 부하를 흘려 보내고 큐 대기 시간 분포를 비교
+# (Redis 브로커처럼 우선순위가 높은 목록부터, 같은 우선순위 안에서는 먼저 등록된 순서로 가져간다고 가정)
+import heapq
+import random
+import statistics
+
+from celeryutil.routing import PRIORITY_LEVELS, CompositeRoutingPolicy, CostPriorityPolicy, FairSharePolicy
+from common import CodeLanguage
+from schema.job import CodeChallengeJudgmentJob as Job
+
+
+WORKERS = 8
+DURATION = 600.0 # 초
+ARRIVAL_RATE = 5.0 # 초당 제출 수 (평균 처리 시간 약 1.45초 x 5 = 워커 8개 기준 부하율 약 90%)
+TIME_LIMITS = {5: 0.5, 20: 2.0} # challenge_id: 테스트 케이스 별 시간 제한
+CONFIG_VERSION = "benchmark"
+
+
+class _SimulatedConfigSnapshot:
+    """시뮬레이션용 설정 스냅샷 (TIME_LIMITS의 시간 제한만 제공)"""
+
+    def get_time_limit(self, challenge_id: int, code_language: CodeLanguage) -> float:
+        return TIME_LIMITS[challenge_id]
+
+
+def _generate_submissions(seed: int) -> list[tuple[float, int, Job, float]]:
+    """(제출 시각, user_id, 작업, 실제 처리 시간) 목록"""
+    rng = random.Random(seed)
+    submissions = []
+    now = 0.0
+    while now < DURATION:
+        now += rng.expovariate(ARRIVAL_RATE)
+        # 제출의 30%는 유저 1명(user_id=0)이 몰아서 제출
+        user_id = 0 if rng.random() < 0.3 else rng.randint(1, 500)
+        if rng.random() < 0.9:
+            time_limit, total_test_cases = 0.5, 10 # 짧은 작업: 예상 비용 5초
+        else:
+            time_limit, total_test_cases = 2.0, 50 # 긴 작업: 예상 비용 100초
+        job = Job.create(
+            code_language=CodeLanguage.PYTHON3, code="", challenge_id=int(time_limit * 10),
+            total_test_cases=total_test_cases, test_case_config_version=CONFIG_VERSION
+        )
+        # 실제 처리 시간은 테스트 케이스 별 시간 제한의 5 ~ 15% 정도 사용한다고 가정
+        service_time = time_limit * total_test_cases * rng.uniform(0.05, 0.15)
+        submissions.append((now, user_id, job, service_time))
+    return submissions
+
+
+def _simulate(policy: CompositeRoutingPolicy, submissions: list, clock: list) -> list[tuple[int, Job, float]]:
+    """(user_id, 작업, 큐 대기 시간) 목록"""
+    waiting = [] # (priority, 등록 순서, 제출 시각, user_id, job, service_time)
+    worker_free_at = [0.0] * WORKERS
+    waits = []
+    for sequence, (submitted_at, user_id, job, service_time) in enumerate(submissions):
+        # 이번 제출 이전에 비는 워커가 있으면, 그 시점까지 대기 중인 작업을 먼저 처리
+        while waiting and min(worker_free_at) <= submitted_at:
+            free_at = heapq.heappop(worker_free_at)
+            priority, _, queued_at, queued_user_id, queued_job, queued_service_time = heapq.heappop(waiting)
+            start = max(free_at, queued_at)
+            waits.append((queued_user_id, queued_job, start - queued_at))
+            heapq.heappush(worker_free_at, start + queued_service_time)
+        clock[0] = submitted_at
+        task_route = policy.route(user_id, job)
+        priority = PRIORITY_LEVELS // 2 if task_route.priority is None else task_route.priority
+        heapq.heappush(waiting, (priority, sequence, submitted_at, user_id, job, service_time))
+    while waiting:
+        free_at = heapq.heappop(worker_free_at)
+        priority, _, queued_at, queued_user_id, queued_job, queued_service_time = heapq.heappop(waiting)
+        start = max(free_at, queued_at)
+        waits.append((queued_user_id, queued_job, start - queued_at))
+        heapq.heappush(worker_free_at, start + queued_service_time)
+    return waits
+
+
+def _describe(waits: list[float]) -> str:
+    quantiles = statistics.quantiles(waits, n=100)
+    return f"p50 {quantiles[49]:6.2f}s  p95 {quantiles[94]:6.2f}s  p99 {quantiles[98]:6.2f}s"
+
+
+if __name__ == "__main__":
+    snapshot = _SimulatedConfigSnapshot()
+    submissions = _generate_submissions(seed=0)
+    for name in ("fifo", "cost", "cost + fair_share"):
+        clock = [0.0]
+        policies = []
+        if "cost" in name:
+            policies.append(CostPriorityPolicy(
+                max_cost_seconds=200.0, snapshot_func=lambda version: snapshot if version == CONFIG_VERSION else None
+            ))
+        if "fair_share" in name:
+            policies.append(FairSharePolicy(
+                burst=5, refill_rate=0.5, penalty=3, default_priority=PRIORITY_LEVELS // 2, clock=lambda: clock[0]
+            ))
+        waits = _simulate(CompositeRoutingPolicy(policies), submissions, clock)
+        print(f"[{name}]")
+        print(f"  short jobs        : {_describe([w for _, job, w in waits if job.total_test_cases == 10])}")
+        print(f"  long jobs         : {_describe([w for _, job, w in waits if job.total_test_cases == 50])}")
+        print(f"  other users       : {_describe([w for user_id, _, w in waits if user_id != 0])}")
+        print(f"  flooding user (0) : {_describe([w for user_id, _, w in waits if user_id == 0])}")
@@ -0,0 +1,64 @@
+# 테스트 케이스 로드 벤치마크: python -m benchmarks.test_case_store
+# 챌린지 10,000개 카탈로그로 전체 테스트 케이스를 로드하는 이전 방식과 인덱스만 유지하는 TestCaseStore의
+# 시작 시간과 로드 후 유지 메모리 비교
+import importlib.util
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+
+_REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# config 패키지 초기화(환경 변수 로드, 테스트 케이스 설정 로드 등)를 제외하기 위해 모듈 파일을 직접 로드
+_STORE_MODULE_PATH = os.path.join(_REPO_DIR, "config", "test_case_store.py")
+_LOAD_STORE_MODULE = (
+    "import importlib.util; "
+    f"spec = importlib.util.spec_from_file_location('test_case_store', {_STORE_MODULE_PATH!r}); "
+    "module = importlib.util.module_from_spec(spec); spec.loader.exec_module(module)"
+)
+
+# 프로세스(워커)마다 새로 로드하는 상황과 같도록 별도 프로세스에서 측정
+# (fork 직후의 최대 RSS는 부모 프로세스 값을 물려받으므로, 현재 RSS(/proc/self/status의 VmRSS)로 측정 - Linux 전용)
+_MEASURE_CODE = """
+import sys, time
+sys.path.insert(0, {repo_dir!r})
+start = time.perf_counter()
+{load}
+elapsed = time.perf_counter() - start
+rss_kib = next(int(line.split()[1]) for line in open("/proc/self/status") if line.startswith("VmRSS:"))
+print(f"{{elapsed * 1000:.0f}} ms, RSS {{rss_kib / 1024:.1f}} MiB")
+"""
+
+
+if __name__ == "__main__":
+    spec = importlib.util.spec_from_file_location("test_case_store", _STORE_MODULE_PATH)
+    test_case_store = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(test_case_store)
+
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = os.path.join(tmp_dir, "test_cases_inputs_and_expected.json")
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            json.dump({
+                str(challenge_id): [
+                    {"input": " ".join(str(random.randint(0, 10 ** 6)) for _ in range(30)), "expected": str(random.randint(0, 10 ** 6))}
+                    for _ in range(10)
+                ]
+                for challenge_id in range(1, 10_001)
+            }, f)
+        split_dir = os.path.join(tmp_dir, "test_cases")
+        test_case_store.build_test_case_store(legacy_path, split_dir)
+
+        cases = {
+            "baseline (import only)": "from common.fileutils import load_json_file",
+            "full load (previous)": f"from common.fileutils import load_json_file; test_cases = load_json_file({legacy_path!r})",
+            "index only": f"{_LOAD_STORE_MODULE}; store = module.TestCaseStore({split_dir!r})",
+        }
+        for name, load in cases.items():
+            result = subprocess.run(
+                [sys.executable, "-c", _MEASURE_CODE.format(repo_dir=_REPO_DIR, load=load)],
+                capture_output=True, text=True, check=True
+            )
+            print(f"{name}: {result.stdout.strip()}")
@@ -1,2 +1,3 @@
 from .job import job_bp
-from .test import test_bp
\ No newline at end of file
+from .test import test_bp
+from .metrics import metrics_bp
@@ -0,0 +1,395 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import quart
+from werkzeug.exceptions import HTTPException
+
+from blueprint.helper import (
+    max_request_body_bytes, validate_content_length, validate_request_headers, validate_batch_request, parse_endpoint_request_body,
+    create_ndjson_reader, parse_batch_item, plan_batch_jobs, batch_item_result, to_response_json, BATCH_ENDPOINT,
+    is_verdict_stream_done, verdict_stream_summary, start_verdict_read_deadline, verdict_stream_data, to_sse_event, SSE_CONTENT_TYPE, observe_request,
+    start_request_span, end_request_span
+)
+from celeryutil import send_execute_tasks, revoke_execute_task, TaskPublishRejectedError
+from schema.job import CodeChallengeJudgmentJob as Job
+from schema import VerdictStreamBatch
+from schema.request import CreateJobRequest, JobRequest, VerdictStreamRequest
+from redisutil import RedisUnavailableError, start_retry_deadline, clear_retry_deadline
+from redisutil.repository import async_job_repository
+from webhookutil import callback_dispatcher
+from config import JobConfig, CeleryConfig, RedisConfig
+from traceutil import tracer
+
+
+# job_bp(Flask)와 동일한 API를 제공하는 비동기(Quart) 블루프린트
+# Redis 조회/저장은 redis.asyncio 기반 저장소를, Celery 태스크 등록은 별도 스레드를 사용하여 이벤트 루프를 블로킹하지 않음
+class JobApiRequest(quart.Request):
+    """
+    /job/batch 요청에만 앱 전체 MAX_CONTENT_LENGTH 대신 MAX_BATCH_REQUEST_BODY_BYTES를 적용하는 요청 클래스.
+    (Quart는 요청 객체 생성 시점의 제한으로 본문 버퍼를 만들므로, 요청 훅이 아닌 생성 시점에 제한을 정함)
+    앱에 등록하여 사용: app.request_class = JobApiRequest
+    """
+
+    def __init__(self, method: str, scheme: str, path: str, *args, max_content_length: Optional[int] = None, **kwargs):
+        if method == "POST" and path == BATCH_ENDPOINT:
+            max_content_length = max_request_body_bytes(BATCH_ENDPOINT)
+        super().__init__(method, scheme, path, *args, max_content_length=max_content_length, **kwargs)
+
+
+async_job_bp = quart.Blueprint('async_job_bp', __name__)
+
+
+def error_response(message: str, http_status: int=500) -> quart.Response:
+    response_data = {"error": message}
+    return _convert_data_to_json_content_type_response(response_data, http_status)
+
+
+def success_response(data: Optional[dict] = None, http_status: int=200) -> quart.Response:
+    response_data = {}
+    if data:
+        response_data.update(data)
+    return _convert_data_to_json_content_type_response(response_data, http_status)
+
+
+def _convert_data_to_json_content_type_response(data: dict, code: int) -> quart.Response:
+    return quart.Response(to_response_json(data), status=code, content_type="application/json")
+
+
+async def _send_execute_tasks(user_jobs: list[tuple[int, Job]]) -> list[Optional[Exception]]:
+    # 비동기 등록 모드는 등록 대기 버퍼에 넣기만 하므로 바로 호출하고,
+    # 그 외에는 Celery 클라이언트가 동기 방식이므로 별도 스레드에서 태스크 등록
+    if CeleryConfig.ASYNC_PUBLISH:
+        return send_execute_tasks(user_jobs)
+    return await asyncio.to_thread(send_execute_tasks, user_jobs)
+
+
+# -------------------------------------------------
+# bp Error Handler
+# -------------------------------------------------
+
+@async_job_bp.errorhandler(Exception)
+async def handle_exception(e):
+    # MAX_CONTENT_LENGTH 초과(413) 등 HTTP 예외는 해당 상태 코드로 응답
+    if isinstance(e, HTTPException):
+        return error_response(e.name, e.code)
+    # Redis 일시적 장애(재시도 예산 소진, 서킷 열림)는 잠시 후 다시 요청하도록 503 응답
+    if isinstance(e, RedisUnavailableError):
+        logging.warning(f"[Redis unavailable: {e}]")
+        return error_response("Storage is temporarily unavailable. Retry later", 503)
+    logging.error("[Unexpected exception occurred]", exc_info=True)
+    return error_response("Internal server error", 500)
+
+
+# -------------------------------------------------
+# Before Request Hook
+# -------------------------------------------------
+
+@async_job_bp.before_request
+async def start_request_timer():
+    quart.g.request_started_at = time.perf_counter()
+
+
+@async_job_bp.before_request
+async def start_request_trace():
+    url_rule = quart.request.url_rule
+    quart.g.request_span = start_request_span(quart.request.method, url_rule.rule if url_rule else None, quart.request.headers)
+    quart.g.request_span_token = tracer.attach(quart.g.request_span)
+
+
+@async_job_bp.before_request
+async def start_request_deadline():
+    # 요청 하나에서 호출하는 저장소 메서드들이 재시도 예산(RedisConfig.RETRY_DEADLINE)을 나눠 사용
+    start_retry_deadline(RedisConfig.RETRY_DEADLINE)
+
+
+@async_job_bp.teardown_request
+async def clear_request_deadline(exc):
+    clear_retry_deadline()
+
+
+@async_job_bp.teardown_request
+async def clear_request_trace(exc):
+    tracer.detach(quart.g.pop("request_span_token", None))
+
+
+@async_job_bp.after_request
+async def observe_request_metrics(response: quart.Response):
+    # 검증 실패, 예외 처리(errorhandler) 응답을 포함한 모든 응답의 처리 시간 기록
+    url_rule = quart.request.url_rule
+    observe_request(
+        endpoint=url_rule.rule if url_rule else None,
+        method=quart.request.method,
+        http_status=response.status_code,
+        started_at=quart.g.get("request_started_at"),
+        content_length=quart.request.content_length
+    )
+    end_request_span(quart.g.get("request_span"), response.status_code)
+    return response
+
+
+@async_job_bp.before_request
+async def validate_request():
+    request = quart.request
+
+    # EndPoint 전역 검증
+    # 본문을 읽기 전에 Content-Length로 크기 초과 요청 차단
+    error = validate_content_length(request.content_length, request.path)
+    if error:
+        return error_response(*error)
+
+    # /job/batch 요청 본문은 라우트에서 스트림으로 읽으므로 여기서 읽지 않음 (JSON 형식 검증 대신 NDJSON 형식 검증)
+    is_batch = request.method == 'POST' and request.path == BATCH_ENDPOINT
+    error = validate_request_headers(
+        api_key=request.headers.get("X-Api-Key"),
+        client_id=request.headers.get("X-Client-Id"),
+        method=request.method,
+        has_body=not is_batch and bool(await request.get_data()),
+        is_json=request.is_json
+    )
+    if error:
+        return error_response(*error)
+
+    if is_batch:
+        admin_mode, error = validate_batch_request(
+            mimetype=request.mimetype,
+            mode=request.args.get("mode"),
+            client_id=request.headers.get("X-Client-Id")
+        )
+        if error:
+            return error_response(*error)
+        quart.g.admin_mode = admin_mode
+
+    # 개별 EndPoint 검증 (검증하면서 변환한 요청 모델을 요청 컨텍스트(quart.g)에 저장하여 라우트에서 그대로 사용)
+    if request.method == 'POST' and request.path in ('/job/create', '/job/execute', '/job/cancel', '/job', '/job/verdicts'):
+        request_model, error = parse_endpoint_request_body(await request.get_json(), request.path)
+        if error:
+            return error_response(*error)
+        quart.g.request_model = request_model
+    return None
+
+
+# -------------------------------------------------
+# Route 처리
+# -------------------------------------------------
+
+# 1) /job/create
+@async_job_bp.route('/create', methods=['POST'])
+async def create_job():
+    job_request: CreateJobRequest = quart.g.request_model
+    user_id = job_request.user_id
+    code_language = job_request.code_language
+    code = job_request.code
+    challenge_id = job_request.challenge_id
+    total_test_cases = job_request.total_test_cases
+
+    job = Job.create(
+        code_language=code_language,
+        code=code,
+        challenge_id=challenge_id,
+        total_test_cases=total_test_cases,
+        test_case_config_version=job_request.test_case_config_version
+    )
+
+    test_case_time_limit = job_request.test_case_time_limit
+
+    job_ttl = round(test_case_time_limit * total_test_cases * 2) # job ttl은 정수형 값만 허용하므로 반올림
+
+    # 유저별 작업 수 제한은 저장과 함께 원자적으로 확인 (동시 요청이 모두 제한을 통과하지 않도록 함)
+    save_result = await async_job_repository.save(user_id, job, job_ttl, max_user_jobs=JobConfig.MAX_JOB_COUNT_PER_USER)
+    if save_result == -2:
+        return error_response(f"Max job count={JobConfig.MAX_JOB_COUNT_PER_USER} exceeded for userId:{user_id}", 422)
+    elif save_result == 0:
+        logging.error("[Handling \"/job/create\" request failed. No exception but job doesn't saved]")
+        return error_response("Internal server error", 500)
+
+    return success_response({"jobId": f"{job.job_id}"}, 201)
+
+
+# 2) /job/execute
+@async_job_bp.route('/execute', methods=['POST'])
+async def execute_job():
+    job_request: JobRequest = quart.g.request_model
+    user_id = job_request.user_id
+    job_id = job_request.job_id
+
+    job: Job = await async_job_repository.find_by_user_id_and_job_id(user_id, job_id)
+    if not job:
+        return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
+
+    # 같은 코드의 채점 결과가 캐시되어 있으면 워커에 태스크를 등록하지 않고 결과를 바로 기록한 뒤,
+    # 워커가 채점을 마쳤을 때와 같은 콜백을 보내 백엔드에 결과를 전달
+    cached_verdicts = await async_job_repository.find_cached_verdicts(job)
+    if cached_verdicts is not None:
+        if await async_job_repository.update(job_id=job_id, user_id=user_id, verdicts=cached_verdicts) == -1:
+            return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
+        callback_dispatcher.dispatch_judgment(job_id, cached_verdicts)
+        return success_response({"totalTestCases": job.total_test_cases}, 202)
+
+    send_error = (await _send_execute_tasks([(user_id, job)]))[0]
+    if isinstance(send_error, TaskPublishRejectedError):
+        return error_response("Task queue is busy. Retry later", 503)
+    elif send_error:
+        raise send_error
+    return success_response({"totalTestCases": job.total_test_cases}, 202)
+
+
+# 3) /job/cancel
+@async_job_bp.route('/cancel', methods=['POST'])
+async def cancel_job():
+    job_request: JobRequest = quart.g.request_model
+    user_id = job_request.user_id
+    job_id = job_request.job_id
+
+    update_res = await async_job_repository.update(job_id=job_id, user_id=user_id, stop_flag=True)
+
+    if update_res == -1:
+        return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
+
+    elif update_res == 0:
+        logging.error("[Handling \"/job/cancel\" request failed. No exception but job doesn't updated]")
+        return error_response("Internal server error", 500)
+
+    # 아직 시작되지 않은 태스크는 워커가 실행하지 않도록 취소 (Celery 클라이언트는 동기 방식이므로 별도 스레드에서 전송)
+    revoke_error = await asyncio.to_thread(revoke_execute_task, job_id)
+    if revoke_error:
+        logging.warning(f"[Revoking task failed for job_id={job_id}: {revoke_error}]")
+
+    return success_response(http_status=202)
+
+
+# 4) /job
+@async_job_bp.route('', methods=['POST'])
+async def check_job_exists():
+    job_request: JobRequest = quart.g.request_model
+    user_id = job_request.user_id
+    job_id = job_request.job_id
+
+    if not await async_job_repository.exists_by_user_id_and_job_id(user_id, job_id):
+        return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
+    else:
+        return success_response(http_status=200)
+
+
+# 5) /job/batch
+@async_job_bp.route('/batch', methods=['POST'])
+async def create_batch_jobs():
+    # 요청 본문(NDJSON)을 청크 단위로 읽으면서 완성된 줄을 바로 검증 (본문 전체를 메모리에 올리지 않음)
+    reader = create_ndjson_reader()
+    items = []
+    async for chunk in quart.request.body:
+        lines, error = reader.feed(chunk)
+        if error:
+            return error_response(*error)
+        items.extend(parse_batch_item(line) for line in lines)
+    lines, error = reader.close()
+    if error:
+        return error_response(*error)
+    items.extend(parse_batch_item(line) for line in lines)
+
+    if not items:
+        return error_response("Request body must contain at least one job", 400)
+
+    user_ids = list({job_request.user_id for job_request, _ in items if job_request})
+    active_job_counts = dict(zip(user_ids, await async_job_repository.count_by_user_ids(user_ids)))
+    results, jobs_to_save = plan_batch_jobs(items, active_job_counts, quart.g.admin_mode)
+
+    saved_jobs = []
+    # 앞서 조회한 작업 수는 다른 요청과 동시에 변할 수 있으므로, 관리자 모드가 아니면 저장 시 제한을 다시 확인
+    save_results = await async_job_repository.save_many(
+        [(user_id, job, job_ttl) for _, user_id, job, job_ttl in jobs_to_save],
+        max_user_jobs=0 if quart.g.admin_mode else JobConfig.MAX_JOB_COUNT_PER_USER
+    )
+    for (index, user_id, job, _), save_result in zip(jobs_to_save, save_results):
+        if save_result == -2:
+            results[index] = batch_item_result(
+                index, 422, error=f"Max job count={JobConfig.MAX_JOB_COUNT_PER_USER} exceeded for userId:{user_id}"
+            )
+        elif isinstance(save_result, Exception) or save_result == 0:
+            logging.error(f"[Handling \"/job/batch\" request failed. Job doesn't saved: {save_result}]")
+            results[index] = batch_item_result(index, 500, error="Internal server error")
+        else:
+            saved_jobs.append((index, user_id, job))
+
+    send_results = await _send_execute_tasks([(user_id, job) for _, user_id, job in saved_jobs])
+    for (index, _, job), send_error in zip(saved_jobs, send_results):
+        if isinstance(send_error, TaskPublishRejectedError):
+            results[index] = batch_item_result(index, 503, job_id=job.job_id, error="Task queue is busy. Retry later")
+        elif send_error:
+            logging.error(f"[Handling \"/job/batch\" request failed. Task doesn't sent: {send_error}]")
+            results[index] = batch_item_result(index, 500, job_id=job.job_id, error="Internal server error")
+        else:
+            results[index] = batch_item_result(index, 202, job_id=job.job_id)
+
+    return success_response({"results": results}, 200)
+
+
+# 6) /job/verdicts
+@async_job_bp.route('/verdicts', methods=['POST'])
+async def read_verdicts():
+    job_request: VerdictStreamRequest = quart.g.request_model
+    user_id = job_request.user_id
+    job_id = job_request.job_id
+    # 요청 공통 재시도 예산 대신 대기 시간(waitMs)을 포함한 마감 시각 사용
+    start_verdict_read_deadline(job_request.wait_ms)
+
+    job: Job = await async_job_repository.find_by_user_id_and_job_id(user_id, job_id, include_code=False, include_verdicts=False)
+    if not job:
+        return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
+
+    if SSE_CONTENT_TYPE in quart.request.headers.get("Accept", ""):
+        # 응답을 모두 전송할 때까지 요청 컨텍스트를 유지
+        response = quart.Response(quart.stream_with_context(_generate_verdict_events)(job_request), content_type=SSE_CONTENT_TYPE)
+        response.timeout = None # 응답 전송 시간 제한은 VERDICT_STREAM_SSE_TIMEOUT으로 관리
+        return response
+
+    batch = await async_job_repository.read_verdict_stream(
+        user_id, job_id, job_request.cursor, job_request.limit, job_request.wait_ms
+    )
+    if not batch.verdicts:
+        # 대기하는 동안 중지 요청, 삭제된 경우를 반영하기 위해 다시 조회
+        job = await async_job_repository.find_by_user_id_and_job_id(user_id, job_id, include_code=False, include_verdicts=False)
+        if not job:
+            return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
+    summary = await _find_verdict_stream_summary(user_id, job_id, job, batch)
+    return success_response(verdict_stream_data(batch, summary), 200)
+
+
+async def _find_verdict_stream_summary(user_id: int, job_id: str, job: Job, batch: VerdictStreamBatch) -> Optional[dict]:
+    """스트림의 끝까지 읽었으면 채점 결과 요약을, 아니면 None을 반환한다."""
+    if not is_verdict_stream_done(job, batch):
+        return None
+    job = await async_job_repository.find_by_user_id_and_job_id(user_id, job_id, include_code=False, include_verdicts=True) or job
+    return verdict_stream_summary(job)
+
+
+async def _generate_verdict_events(job_request: VerdictStreamRequest):
+    user_id, job_id, cursor = job_request.user_id, job_request.job_id, job_request.cursor
+    deadline = time.monotonic() + JobConfig.VERDICT_STREAM_SSE_TIMEOUT
+    while time.monotonic() < deadline:
+        # 응답 상태 코드를 이미 전송했으므로, Redis 장애는 에러 이벤트로 알리고 스트림을 종료
+        try:
+            # 스트림 전체가 아닌 읽기(대기 포함)마다 재시도 예산 적용
+            start_verdict_read_deadline(JobConfig.VERDICT_STREAM_MAX_WAIT_MS)
+            batch = await async_job_repository.read_verdict_stream(
+                user_id, job_id, cursor, job_request.limit, JobConfig.VERDICT_STREAM_MAX_WAIT_MS
+            )
+            job = await async_job_repository.find_by_user_id_and_job_id(user_id, job_id, include_code=False, include_verdicts=False)
+            summary = await _find_verdict_stream_summary(user_id, job_id, job, batch) if job else None
+        except RedisUnavailableError as ex:
+            logging.warning(f"[Redis unavailable: {ex}]")
+            yield to_sse_event("error", {"error": "Storage is temporarily unavailable. Retry later"})
+            return
+
+        cursor = batch.cursor
+        if batch.verdicts:
+            yield to_sse_event("verdicts", verdict_stream_data(batch), event_id=cursor)
+        if not job:
+            yield to_sse_event("error", {"error": f"Job not found for user_id={user_id} with job_id={job_id}"})
+            return
+        if summary is not None:
+            yield to_sse_event("summary", summary, event_id=cursor)
+            return
+        if not batch.verdicts:
+            yield ": keep-alive\n\n" # 프록시가 유휴 연결을 끊지 않도록 주석 행 전송
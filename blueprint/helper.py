@@ -1,48 +1,459 @@
-import json
-from typing import Optional
+from typing import Optional, Union
 import flask
 import hmac
 import hashlib
 import base64
+import codecs
+import functools
+import json
+import time
+
+from common import get_codec
+from config import SecurityConfig, TestCaseConfig, CodecConfig, JobConfig, MetricsConfig, RedisConfig
+from redisutil import start_retry_deadline
+from schema import Verdict, VerdictStreamBatch
+from schema.job import CodeChallengeJudgmentJob as Job
+from schema.request import CreateJobRequest, JobRequest, VerdictStreamRequest
+from traceutil import tracer, Span, SpanKind, SpanStatusCode
+from .metrics import (
+    HTTP_REQUEST_DURATION_SECONDS, HTTP_REQUEST_BODY_BYTES, HMAC_VALIDATION_SECONDS, CODE_VALIDATION_SECONDS, CODE_PAYLOAD_BYTES
+)
+
+
+# HTTP 응답 본문 코덱 (응답은 항상 JSON 형식이어야 하므로 JSON 텍스트 형식 코덱만 허용)
+_RESPONSE_CODEC = get_codec(CodecConfig.RESPONSE_CODEC)
+if _RESPONSE_CODEC.format_version is not None:
+    raise ValueError(f"RESPONSE_CODEC must be a JSON codec, got '{CodecConfig.RESPONSE_CODEC}'")
+
+# EndPoint별 요청 모델과 요청 본문 검증 실패 시 에러 메시지
+_ENDPOINT_REQUEST_MODELS = {
+    "/job/create": (
+        CreateJobRequest,
+        "Request body must contain valid 'userId'(integer), 'challengeId'(integer), 'code' and 'codeLanguage'"
+    ),
+    "/job/execute": (JobRequest, "Request body must contain 'userId'(integer) and 'jobId'"),
+    "/job/cancel": (JobRequest, "Request body must contain 'userId'(integer) and 'jobId'"),
+    "/job": (JobRequest, "Request body must contain 'userId'(integer) and 'jobId'"),
+    "/job/verdicts": (
+        VerdictStreamRequest,
+        "Request body must contain 'userId'(integer) and 'jobId', with optional 'cursor', 'limit'(integer) and 'waitMs'(integer)"
+    ),
+}
+
+# /job/verdicts 요청을 SSE(Server-Sent Events)로 응답할 때의 Accept 헤더 값
+SSE_CONTENT_TYPE = "text/event-stream"
+
+# /job/batch 요청 본문 형식 (한 줄에 /job/create 요청 본문 하나)
+BATCH_ENDPOINT = "/job/batch"
+BATCH_CONTENT_TYPE = "application/x-ndjson"
+BATCH_READ_CHUNK_SIZE = 64 * 1024 # 요청 본문을 한 번에 읽을 크기
 
-from common import CodeLanguage
-from config import SecurityConfig
+# 제출 코드 검증 시 한 번에 디코딩할 base64 문자 수 (4의 배수, 디코딩 결과 48KB)
+_CODE_VALIDATION_CHUNK_SIZE = 64 * 1024
 
 
-def validate_request_body(request_body: dict, endpoint: str) -> bool:
+def max_request_body_bytes(endpoint: str = None) -> int:
     """
-    요청 JSON 데이터에 필수 필드가 모두 존재하는지 검증합니다.
-    :param
-        json_data: 요청 JSON 데이터
-        url: 요청 URL
-    :return: 필수 필드가 모두 존재하고 값이 유효하면 True, 아니면 False
+    엔드포인트별 요청 본문 최대 크기를 반환합니다.
+    앱 전체 MAX_CONTENT_LENGTH는 MAX_REQUEST_BODY_BYTES이며, /job/batch 요청에만 요청 단위로 MAX_BATCH_REQUEST_BODY_BYTES를 적용합니다.
     """
-    if not request_body:
-        return False
+    return JobConfig.MAX_BATCH_REQUEST_BODY_BYTES if endpoint == BATCH_ENDPOINT else JobConfig.MAX_REQUEST_BODY_BYTES
+
+
+def validate_content_length(content_length: Optional[int], endpoint: str = None) -> Optional[tuple[str, int]]:
+    """
+    요청 본문을 읽기 전에 Content-Length 헤더로 본문 크기를 검증합니다.
+    (Content-Length가 없는 chunked 요청은 본문을 읽는 도중 요청의 최대 크기(max_request_body_bytes)를 넘으면 413으로 차단)
+
+    Returns:
+        Optional[tuple[str, int]]: 검증 실패 시 (에러 메시지, HTTP 상태 코드), 성공 시 None
+    """
+    if content_length is not None and content_length > max_request_body_bytes(endpoint):
+        return "Request body too large", 413
+    return None
+
+
+def validate_request_headers(
+    api_key: Optional[str],
+    client_id: Optional[str],
+    method: str,
+    has_body: bool,
+    is_json: bool
+) -> Optional[tuple[str, int]]:
+    """
+    EndPoint 전역 검증(API 키, JSON 본문 형식)을 수행합니다.
+    동기(Flask)/비동기(Quart) 블루프린트가 공유할 수 있도록 프레임워크 객체에 의존하지 않습니다.
+
+    Returns:
+        Optional[tuple[str, int]]: 검증 실패 시 (에러 메시지, HTTP 상태 코드), 성공 시 None
+    """
+    # 1) 키 검증
+    with tracer.start_as_current_span("validate_api_key"):
+        is_valid_key = bool(api_key and client_id) and _validate_hmac_key_timed(api_key, client_id)
+    if not is_valid_key:
+        return "Access denied", 403
+
+    # 2) JSON 본문 구조 검증
+    if method not in ("GET", "HEAD") and has_body and not is_json:
+        return "Request must be in JSON format", 400
+
+    return None
+
+
+def validate_batch_request(
+    mimetype: str,
+    mode: Optional[str],
+    client_id: Optional[str]
+) -> tuple[bool, Optional[tuple[str, int]]]:
+    """
+    /job/batch 요청의 본문 형식(NDJSON)과 관리자 모드(?mode=admin) 사용 권한을 검증합니다.
+    관리자 모드는 ADMIN_CLIENT_IDS에 등록된 클라이언트만 사용할 수 있으며, 유저별 작업 수 제한을 적용하지 않습니다.
+
+    Returns:
+        tuple: (관리자 모드 여부, 검증 실패 시 (에러 메시지, HTTP 상태 코드))
+    """
+    if mimetype != BATCH_CONTENT_TYPE:
+        return False, (f"Request must be in {BATCH_CONTENT_TYPE} format", 415)
+
+    if mode is None:
+        return False, None
+    if mode != "admin":
+        return False, (f"Unsupported mode: {mode}", 400)
+    if client_id not in SecurityConfig.ADMIN_CLIENT_IDS:
+        return False, ("Admin mode is not allowed for this client", 403)
+    return True, None
+
+
+def parse_endpoint_request_body(
+    request_body: dict,
+    endpoint: str
+) -> tuple[Union[CreateJobRequest, JobRequest, VerdictStreamRequest, None], Optional[tuple[str, int]]]:
+    """
+    개별 EndPoint의 요청 본문을 검증하고, 변환된 값으로 요청 모델을 생성합니다.
+    검증과 변환을 한 번에 수행하므로, 라우트에서는 요청 본문을 다시 파싱하지 않고 요청 모델을 사용합니다.
+    동기(Flask)/비동기(Quart) 블루프린트가 공유할 수 있도록 프레임워크 객체에 의존하지 않습니다.
+
+    Returns:
+        tuple: 검증 성공 시 (요청 모델, None), 실패 시 (None, (에러 메시지, HTTP 상태 코드))
+    """
+    request_model_class, invalid_body_message = _ENDPOINT_REQUEST_MODELS[endpoint]
+    try:
+        request_model = request_model_class.parse(request_body)
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return None, (invalid_body_message, 400)
+
+    # 1) /job/create
+    if endpoint == '/job/create':
+        # 요청 처리 도중 설정이 다시 로드되어도 같은 스냅샷의 값을 사용하도록 필요한 값을 한 번에 조회
+        test_case_config = TestCaseConfig.current()
+        total_test_cases = test_case_config.get_test_case_count(request_model.challenge_id)
+        if not total_test_cases:
+            return None, (f"No test cases found for the provided 'challengeId'={request_model.challenge_id}", 404)
+        request_model.total_test_cases = total_test_cases
+        request_model.test_case_time_limit = test_case_config.get_time_limit(
+            request_model.challenge_id, request_model.code_language
+        )
+        request_model.test_case_config_version = test_case_config.version
+
+        # 제출된 코드 유효성(크기 및 형식) 검사
+        # 코드 검증(base64 디코딩, utf-8 디코딩, 파일 크기 검사 등) 자체는 보안 이슈를 발생시키지 않음
+        with tracer.start_as_current_span("validate_code"):
+            error = _validate_code_timed(request_model.code)
+        if error:
+            return None, error
+
+    # 2) /job/verdicts
+    elif endpoint == '/job/verdicts':
+        # 한 번에 읽을 평가 결과 수와 대기 시간은 서버 설정 값 이하로 제한
+        request_model.limit = min(request_model.limit or JobConfig.VERDICT_STREAM_BATCH_SIZE, JobConfig.VERDICT_STREAM_BATCH_SIZE)
+        request_model.wait_ms = min(request_model.wait_ms, JobConfig.VERDICT_STREAM_MAX_WAIT_MS)
+
+    return request_model, None
+
+
+def observe_request(
+    endpoint: Optional[str],
+    method: str,
+    http_status: int,
+    started_at: Optional[float],
+    content_length: Optional[int]
+):
+    """
+    요청 처리 시간(started_at: time.perf_counter() 값)과 요청 본문 크기를 기록합니다.
+    동기(Flask)/비동기(Quart) 블루프린트의 after_request 훅에서 호출합니다.
+    """
+    if not MetricsConfig.ENABLED or started_at is None:
+        return
+    elapsed = time.perf_counter() - started_at
+    endpoint = endpoint or "unmatched"
+    # 레이블 조회(labels())는 잠금을 사용하므로, 레이블 조합별로 한 번만 조회하여 재사용
+    histograms = _request_histograms.get((endpoint, method, http_status))
+    if histograms is None:
+        histograms = _request_histograms.setdefault((endpoint, method, http_status), (
+            HTTP_REQUEST_DURATION_SECONDS.labels(endpoint=endpoint, method=method, status=http_status),
+            HTTP_REQUEST_BODY_BYTES.labels(endpoint=endpoint)
+        ))
+    histograms[0].observe(elapsed)
+    if content_length:
+        histograms[1].observe(content_length)
+
+
+# (endpoint, method, status) -> (처리 시간, 본문 크기 히스토그램)
+_request_histograms: dict[tuple[str, str, int], tuple] = {}
+_HMAC_VALIDATION_HISTOGRAMS = {True: HMAC_VALIDATION_SECONDS.labels(result="valid"), False: HMAC_VALIDATION_SECONDS.labels(result="invalid")}
+_CODE_VALIDATION_HISTOGRAMS = {True: CODE_VALIDATION_SECONDS.labels(result="valid"), False: CODE_VALIDATION_SECONDS.labels(result="invalid")}
+
+
+def start_request_span(method: str, route: Optional[str], headers) -> Span:
+    """
+    요청 처리 스팬을 시작합니다. 요청 헤더에 traceparent(Spring Boot 백엔드의 트레이스)가 있으면 같은 트레이스로 이어갑니다.
+    before_request 훅에서 호출하며, 반환된 스팬을 tracer.attach()로 현재 스팬으로 설정해야 하위 스팬(검증, 저장소, 태스크 등록)이 연결됩니다.
+    """
+    route = route or "unmatched"
+    return tracer.start_span(
+        f"{method} {route}", SpanKind.SERVER, {"http.request.method": method, "http.route": route}, parent=tracer.extract(headers)
+    )
+
+
+def end_request_span(span: Optional[Span], http_status: int):
+    """응답 상태 코드를 기록하고 요청 처리 스팬을 종료합니다. (5xx 응답은 오류로 기록)"""
+    if span is None:
+        return
+    span.set_attribute("http.response.status_code", http_status)
+    if http_status >= 500:
+        span.set_status(SpanStatusCode.ERROR)
+    span.end()
+
+
+def _validate_hmac_key_timed(api_key: str, client_id: str) -> bool:
+    if not MetricsConfig.ENABLED:
+        return validate_hmac_key(api_key, client_id)
+    start = time.perf_counter()
+    is_valid = validate_hmac_key(api_key, client_id)
+    _HMAC_VALIDATION_HISTOGRAMS[is_valid].observe(time.perf_counter() - start)
+    return is_valid
+
+
+def _validate_code_timed(code_base64: str) -> Optional[tuple[str, int]]:
+    if not MetricsConfig.ENABLED:
+        return validate_code(code_base64)
+    start = time.perf_counter()
+    error = validate_code(code_base64)
+    _CODE_VALIDATION_HISTOGRAMS[error is None].observe(time.perf_counter() - start)
+    if not error:
+        CODE_PAYLOAD_BYTES.observe(_decoded_base64_size(code_base64))
+    return error
+
 
-    required_fields = {
-        "/job/create": ["code", "codeLanguage", "challengeId", "userId"],
-        "/job/execute": ["jobId", "userId"],
-        "/job/cancel": ["jobId", "userId"],
-        "/job": ["jobId", "userId"],
+def _decoded_base64_size(code_base64: str) -> int:
+    # 패딩('=')은 마지막 두 글자에만 올 수 있으므로 마지막 두 글자만 확인 (코드 전체를 복사하지 않음)
+    tail = code_base64[-2:]
+    return len(code_base64) // 4 * 3 - (len(tail) - len(tail.rstrip("=")))
+
+
+def validate_code(code_base64: str) -> Optional[tuple[str, int]]:
+    """
+    제출된 코드(base64)의 형식, 크기, 공백 여부를 검증합니다.
+    코드 전체를 한 번에 디코딩하지 않고 _CODE_VALIDATION_CHUNK_SIZE 단위로 base64, UTF-8 디코딩하여
+    요청당 추가 메모리 사용량을 청크 크기로 제한합니다.
+
+    Returns:
+        Optional[tuple[str, int]]: 검증 실패 시 (에러 메시지, HTTP 상태 코드), 성공 시 None
+    """
+    format_error = ("'code' field is not in a valid format", 400)
+    if not isinstance(code_base64, str) or len(code_base64) % 4 != 0:
+        return format_error
+
+    # 코드 크기 1MB 초과 여부 검증 (디코딩 없이 base64 길이로 계산)
+    if _decoded_base64_size(code_base64) > JobConfig.MAX_CODE_BYTES:
+        return "Source code size exceeds 1MB", 400
+
+    utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+    has_content = False
+    try:
+        for start in range(0, len(code_base64), _CODE_VALIDATION_CHUNK_SIZE):
+            chunk = code_base64[start:start + _CODE_VALIDATION_CHUNK_SIZE]
+            is_last_chunk = start + _CODE_VALIDATION_CHUNK_SIZE >= len(code_base64)
+            # 패딩('=')은 코드 전체의 마지막에만 허용
+            if not is_last_chunk and "=" in chunk:
+                return format_error
+
+            # base64 디코딩 (validate=True를 사용하면 유효하지 않은 문자가 포함된 경우 예외 발생)
+            # UTF-8 디코딩 (청크 경계에서 잘린 멀티바이트 문자는 다음 청크와 이어서 디코딩)
+            code_str = utf8_decoder.decode(base64.b64decode(chunk, validate=True), final=is_last_chunk)
+
+            # 공백 검사 (공백이 아닌 문자를 찾은 이후에는 검사 생략)
+            if not has_content and code_str.strip():
+                has_content = True
+    except ValueError:
+        # binascii.Error, UnicodeDecodeError, ASCII 이외의 문자 포함 모두 ValueError의 하위 예외
+        return format_error
+
+    if not has_content:
+        return "Empty source file", 400
+
+    return None
+
+
+class NdjsonReader:
+    """
+    Description:
+        청크 단위로 읽은 NDJSON 요청 본문을 줄 단위로 분리하는 클래스. (빈 줄은 무시)
+        요청 본문 전체를 메모리에 올리지 않고, 완성된 줄만 바로 처리할 수 있도록 반환한다.
+    """
+
+    def __init__(self, max_line_bytes: int, max_lines: int, max_total_bytes: int):
+        self._max_line_bytes = max_line_bytes
+        self._max_lines = max_lines
+        self._max_total_bytes = max_total_bytes
+        self._buffer = b""
+        self._line_count = 0
+        self._total_bytes = 0
+
+    def feed(self, chunk: bytes) -> tuple[list[bytes], Optional[tuple[str, int]]]:
+        """
+        Returns:
+            tuple: (이번 청크로 완성된 줄 목록, 제한 초과 시 (에러 메시지, HTTP 상태 코드))
+        """
+        self._total_bytes += len(chunk)
+        if self._total_bytes > self._max_total_bytes:
+            return [], ("Request body too large", 413)
+
+        *lines, self._buffer = (self._buffer + chunk).split(b"\n")
+        if len(self._buffer) > self._max_line_bytes:
+            return [], (f"Batch item exceeds {self._max_line_bytes} bytes", 413)
+        return self._count_lines(lines)
+
+    def close(self) -> tuple[list[bytes], Optional[tuple[str, int]]]:
+        """마지막 줄(줄바꿈 없이 끝난 줄)을 반환합니다."""
+        lines, self._buffer = [self._buffer], b""
+        return self._count_lines(lines)
+
+    def _count_lines(self, lines: list[bytes]) -> tuple[list[bytes], Optional[tuple[str, int]]]:
+        lines = [line for line in lines if line.strip()]
+        self._line_count += len(lines)
+        if self._line_count > self._max_lines:
+            return [], (f"Batch size exceeds {self._max_lines}", 413)
+        return lines, None
+
+
+def create_ndjson_reader() -> NdjsonReader:
+    return NdjsonReader(
+        max_line_bytes=JobConfig.MAX_REQUEST_BODY_BYTES,
+        max_lines=JobConfig.MAX_BATCH_SIZE,
+        max_total_bytes=JobConfig.MAX_BATCH_REQUEST_BODY_BYTES
+    )
+
+
+def parse_batch_item(line: bytes) -> tuple[Optional[CreateJobRequest], Optional[tuple[str, int]]]:
+    """
+    /job/batch 요청 본문의 한 줄을 /job/create 요청 본문과 같은 방식으로 검증하고 요청 모델을 생성합니다.
+    """
+    try:
+        request_body = json.loads(line)
+    except ValueError:
+        return None, ("Batch item must be in JSON format", 400)
+    return parse_endpoint_request_body(request_body, "/job/create")
+
+
+def plan_batch_jobs(
+    items: list[tuple[Optional[CreateJobRequest], Optional[tuple[str, int]]]],
+    active_job_counts: dict[int, int],
+    admin_mode: bool
+) -> tuple[list[Optional[dict]], list[tuple[int, int, Job, int]]]:
+    """
+    검증된 /job/batch 항목으로 저장할 작업을 생성합니다.
+    관리자 모드가 아니면 유저별 작업 수 제한(MAX_JOB_COUNT_PER_USER)을 기존 작업 수와 같은 요청의 앞선 항목을 합산하여 적용합니다.
+
+    Returns:
+        tuple: (항목별 결과 목록 - 저장 대상 항목은 None, 저장할 작업 목록 [(항목 인덱스, user_id, 작업, TTL)])
+    """
+    results: list[Optional[dict]] = [None] * len(items)
+    jobs_to_save: list[tuple[int, int, Job, int]] = []
+    job_counts = dict(active_job_counts)
+    for index, (job_request, error) in enumerate(items):
+        if error:
+            results[index] = batch_item_result(index, error[1], error=error[0])
+            continue
+
+        user_id = job_request.user_id
+        if not admin_mode and job_counts.get(user_id, 0) >= JobConfig.MAX_JOB_COUNT_PER_USER:
+            results[index] = batch_item_result(
+                index, 422, error=f"Max job count={JobConfig.MAX_JOB_COUNT_PER_USER} exceeded for userId:{user_id}"
+            )
+            continue
+        job_counts[user_id] = job_counts.get(user_id, 0) + 1
+
+        job = Job.create(
+            code_language=job_request.code_language,
+            code=job_request.code,
+            challenge_id=job_request.challenge_id,
+            total_test_cases=job_request.total_test_cases,
+            test_case_config_version=job_request.test_case_config_version
+        )
+        job_ttl = round(job_request.test_case_time_limit * job_request.total_test_cases * 2) # job ttl은 정수형 값만 허용하므로 반올림
+        jobs_to_save.append((index, user_id, job, job_ttl))
+    return results, jobs_to_save
+
+
+def batch_item_result(index: int, http_status: int, job_id: str = None, error: str = None) -> dict:
+    result = {"index": index, "status": http_status}
+    if job_id:
+        result["jobId"] = job_id
+    if error:
+        result["error"] = error
+    return result
+
+
+def start_verdict_read_deadline(wait_ms: int):
+    """
+    평가 결과 스트림 읽기는 최대 wait_ms 동안 기다리므로, 요청 공통 재시도 예산(RETRY_DEADLINE)에 대기 시간을 더해 재시도 마감 시각을 다시 설정합니다.
+    (SSE 응답은 읽기마다 다시 설정)
+    """
+    start_retry_deadline(RedisConfig.RETRY_DEADLINE + wait_ms / 1000)
+
+
+def is_verdict_stream_done(job: Job, batch: VerdictStreamBatch) -> bool:
+    """
+    평가 결과 스트림을 끝까지 읽었는지 확인합니다.
+    모든 테스트 케이스의 결과를 읽었거나 중지 항목을 읽은 경우, 또는 중지 요청된 작업에 더 읽을 결과가 없는 경우 끝으로 판단합니다.
+    (job은 스트림을 읽은 뒤 조회한 작업이어야 중지 요청 여부가 최신 상태)
+    """
+    return (
+        batch.stopped
+        or batch.cursor.endswith("-1") # 이전 조회에서 중지 항목까지 읽은 커서
+        or batch.read_count >= job.total_test_cases
+        or (job.stop_flag and not batch.verdicts)
+    )
+
+
+def verdict_stream_summary(job: Job) -> dict:
+    """평가 결과 스트림의 마지막에 전달할 채점 결과 요약 (job은 verdicts를 포함하여 조회한 작업)"""
+    return {
+        "totalTestCases": job.total_test_cases,
+        "completedTestCases": len(job.verdicts),
+        "passedTestCases": sum(
+            1 for verdict in job.verdicts if (verdict.passed if isinstance(verdict, Verdict) else verdict.get("passed"))
+        ),
+        "stopped": job.stop_flag
     }
 
-    missing_fields = [field for field in required_fields[endpoint] if request_body.get(field) is None]
-    if missing_fields:
-        return False
 
-    for key in request_body.keys():
-        if key in ['userId', 'challengeId']:
-            try:
-                int(request_body[key])
-            except (ValueError, TypeError):
-                return False
-        elif key == 'codeLanguage':
-            # 허용된 codeLanguage 값 목록
-            if request_body[key].upper() not in [code_language.value for code_language in CodeLanguage]:
-                return False
+def verdict_stream_data(batch: VerdictStreamBatch, summary: Optional[dict] = None) -> dict:
+    """/job/verdicts 응답 본문 (summary가 있으면 스트림의 끝)"""
+    data = {"cursor": batch.cursor, "verdicts": [verdict.as_dict() for verdict in batch.verdicts], "done": summary is not None}
+    if summary is not None:
+        data["summary"] = summary
+    return data
 
-    return True
+
+def to_sse_event(event: str, data: dict, event_id: str = None) -> str:
+    """SSE(Server-Sent Events) 이벤트 문자열 (event_id: 다음 요청에 cursor로 사용할 값)"""
+    lines = [f"event: {event}"]
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {to_response_json(data).decode('utf-8')}")
+    return "\n".join(lines) + "\n\n"
 
 
 def error_response(message: str, http_status: int=500) -> flask.Response:
@@ -58,14 +469,19 @@ def success_response(data: Optional[dict] = None, http_status: int=200) -> flask
 
 
 def _convert_data_to_json_content_type_response(data: dict, code: int) -> flask.Response:
-    response_json = json.dumps(data, ensure_ascii=False)
+    response_json = to_response_json(data)
     response = flask.Response(response_json, status=code, content_type="application/json")
     return response
 
 
+def to_response_json(data: dict) -> bytes:
+    return _RESPONSE_CODEC.encode(data)
+
+
 def validate_hmac_key(received_key: str, received_client_id: str) -> bool:
     """
     요청에 포함된 HMAC 키의 유효성을 검증합니다.
+    키 교체 기간에는 활성화된 비밀 키(SecurityConfig.ACTIVE_SECRET_KEYS) 중 하나로 생성된 키이면 유효합니다.
 
     Args:
         received_key (str): 요청 헤더에서 받은 API 키
@@ -74,16 +490,31 @@ def validate_hmac_key(received_key: str, received_client_id: str) -> bool:
     Returns:
         bool: 키가 유효하면 True, 아니면 False
     """
-    expected_key = _generate_hmac_key(received_client_id)
-    return hmac.compare_digest(expected_key, received_key)
+    expected_keys = _get_hmac_keys(received_client_id, SecurityConfig.ACTIVE_SECRET_KEYS)
+    # 어떤 비밀 키와 일치하는지에 따라 처리 시간이 달라지지 않도록 모든 키와 비교
+    is_valid = False
+    for expected_key in expected_keys:
+        if expected_key is not None and hmac.compare_digest(expected_key, received_key):
+            is_valid = True
+    return is_valid
+
+
+@functools.lru_cache(maxsize=SecurityConfig.HMAC_KEY_CACHE_SIZE)
+def _get_hmac_keys(_client_id: str, secret_keys: tuple[str, ...]) -> tuple[Optional[str], ...]:
+    """
+    클라이언트 식별자와 비밀 키 목록으로 생성한 API 키 목록을 반환합니다.
+    비밀 키 목록이 캐시 키에 포함되므로, 비밀 키가 교체되면 이전 키로 계산된 항목은 사용되지 않고 LRU로 제거됩니다.
+    """
+    return tuple(_generate_hmac_key(_client_id, secret_key) for secret_key in secret_keys)
 
 
-def _generate_hmac_key(_client_id: str) -> Optional[str]:
+def _generate_hmac_key(_client_id: str, secret_key: str = None) -> Optional[str]:
     """
     HMAC-SHA256 기반으로 API 키를 생성합니다.
 
     Args:
         _client_id (str): 사전에 합의된 클라이언트 식별자
+        secret_key (str): 비밀 키 (기본값: SecurityConfig.API_SECRET_KEY)
 
     Returns:
         Optional[str]: 생성된 API 키, 실패 시 None
@@ -91,7 +522,7 @@ def _generate_hmac_key(_client_id: str) -> Optional[str]:
 
     try:
         message = _client_id.encode('utf-8')
-        secret_key = SecurityConfig.API_SECRET_KEY.encode('utf-8')
+        secret_key = (secret_key or SecurityConfig.API_SECRET_KEY).encode('utf-8')
         hashed = hmac.new(secret_key, message, hashlib.sha256)
         api_key = base64.urlsafe_b64encode(hashed.digest()).decode('utf-8')
     except Exception as e:
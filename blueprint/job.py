@@ -1,29 +1,37 @@
 import logging
-import binascii
-from celery import Celery
+import time
+from typing import Optional
+
+from werkzeug.exceptions import HTTPException
 
 from blueprint.helper import *
+from celeryutil import send_execute_tasks, revoke_execute_task, TaskPublishRejectedError
 from common import *
 from schema.job import CodeChallengeJudgmentJob as Job
+from schema import VerdictStreamBatch
+from schema.request import CreateJobRequest, JobRequest, VerdictStreamRequest
+from redisutil import RedisUnavailableError, start_retry_deadline, clear_retry_deadline
 from redisutil.repository import job_repository
-from config import RedisConfig, JobConfig, TestCaseConfig
+from webhookutil import callback_dispatcher
+from config import JobConfig, RedisConfig
+from traceutil import tracer
 
 
 job_bp = flask.Blueprint('job_bp', __name__)
 
-# celery 태스크큐에 작업을 등록하는 API를 사용하기 위한 클라이언트 객체 생성
-celery_client = Celery(
-    "task-sender",
-    broker=RedisConfig.REDIS_URI,
-    backend=RedisConfig.REDIS_URI
-)
-
 # -------------------------------------------------
 # bp Error Handler
 # -------------------------------------------------
 
 @job_bp.errorhandler(Exception)
 def handle_exception(e):
+    # MAX_CONTENT_LENGTH 초과(413) 등 HTTP 예외는 해당 상태 코드로 응답
+    if isinstance(e, HTTPException):
+        return error_response(e.name, e.code)
+    # Redis 일시적 장애(재시도 예산 소진, 서킷 열림)는 잠시 후 다시 요청하도록 503 응답
+    if isinstance(e, RedisUnavailableError):
+        logging.warning(f"[Redis unavailable: {e}]")
+        return error_response("Storage is temporarily unavailable. Retry later", 503)
     logging.error("[Unexpected exception occurred]", exc_info=True)
     return error_response("Internal server error", 500)
 
@@ -32,89 +40,93 @@ def handle_exception(e):
 # Before Request Hook
 # -------------------------------------------------
 
+@job_bp.before_request
+def start_request_timer():
+    flask.g.request_started_at = time.perf_counter()
+
+
+@job_bp.before_request
+def start_request_trace():
+    url_rule = flask.request.url_rule
+    flask.g.request_span = start_request_span(flask.request.method, url_rule.rule if url_rule else None, flask.request.headers)
+    flask.g.request_span_token = tracer.attach(flask.g.request_span)
+
+
+@job_bp.before_request
+def start_request_deadline():
+    # 요청 하나에서 호출하는 저장소 메서드들이 재시도 예산(RedisConfig.RETRY_DEADLINE)을 나눠 사용
+    start_retry_deadline(RedisConfig.RETRY_DEADLINE)
+
+
+@job_bp.teardown_request
+def clear_request_deadline(exc):
+    clear_retry_deadline()
+
+
+@job_bp.teardown_request
+def clear_request_trace(exc):
+    tracer.detach(flask.g.pop("request_span_token", None))
+
+
+@job_bp.after_request
+def observe_request_metrics(response: flask.Response):
+    # 검증 실패, 예외 처리(errorhandler) 응답을 포함한 모든 응답의 처리 시간 기록
+    url_rule = flask.request.url_rule
+    observe_request(
+        endpoint=url_rule.rule if url_rule else None,
+        method=flask.request.method,
+        http_status=response.status_code,
+        started_at=flask.g.get("request_started_at"),
+        content_length=flask.request.content_length
+    )
+    end_request_span(flask.g.get("request_span"), response.status_code)
+    return response
+
+
 @job_bp.before_request
 def validate_request():
     # -------------------------------------------------
     # EndPoint 전역 검증
     # -------------------------------------------------
-    # 1) 키 검증
-    api_key = flask.request.headers.get("X-Api-Key")
-    client_id = flask.request.headers.get("X-Client-Id")
-    if not (api_key and client_id) or not validate_hmac_key(api_key, client_id):
-        return error_response("Access denied", 403)
-
-    # 2) JSON 본문 구조 검증
-    if flask.request.method not in ("GET", "HEAD") and flask.request.get_data() and not flask.request.is_json:
-        return error_response("Request must be in JSON format", 400)
-
+    # 본문을 읽기 전에 Content-Length로 크기 초과 요청 차단
+    error = validate_content_length(flask.request.content_length, flask.request.path)
+    if error:
+        return error_response(*error)
+
+    # /job/batch 요청 본문은 라우트에서 스트림으로 읽으므로 여기서 읽지 않음 (JSON 형식 검증 대신 NDJSON 형식 검증)
+    is_batch = flask.request.method == 'POST' and flask.request.path == BATCH_ENDPOINT
+    if is_batch:
+        # 앱 전체 MAX_CONTENT_LENGTH 대신 /job/batch 요청에만 더 큰 제한을 적용 (스트림을 읽기 전에 설정해야 함)
+        flask.request.max_content_length = max_request_body_bytes(BATCH_ENDPOINT)
+    error = validate_request_headers(
+        api_key=flask.request.headers.get("X-Api-Key"),
+        client_id=flask.request.headers.get("X-Client-Id"),
+        method=flask.request.method,
+        has_body=not is_batch and bool(flask.request.get_data()),
+        is_json=flask.request.is_json
+    )
+    if error:
+        return error_response(*error)
+
+    if is_batch:
+        admin_mode, error = validate_batch_request(
+            mimetype=flask.request.mimetype,
+            mode=flask.request.args.get("mode"),
+            client_id=flask.request.headers.get("X-Client-Id")
+        )
+        if error:
+            return error_response(*error)
+        flask.g.admin_mode = admin_mode
 
     # -------------------------------------------------
     # 개별 EndPoint 검증
     # -------------------------------------------------
-    # 1) /job/create
-    if flask.request.path == '/job/create' and flask.request.method == 'POST':
-        request_body = flask.request.get_json()
-        if not validate_request_body(request_body, '/job/create'):
-            return error_response(
-                "Request body must contain valid 'userId'(integer), 'challengeId'(integer), 'code' and 'codeLanguage'",
-                400
-            )
-        test_cases = TestCaseConfig.get_test_cases(request_body["challengeId"])
-        if not test_cases:
-            return error_response(f"No test cases found for the provided 'challengeId'={request_body["challengeId"]}", 404)
-
-        # 제출된 코드 유효성(크기 및 형식) 검사
-        # 코드 검증(base64 디코딩, utf-8 디코딩, 파일 크기 검사 등) 자체는 보안 이슈를 발생시키지 않음
-        code_base64 = request_body.get("code")
-        try:
-            # base64 디코딩 (validate=True를 사용하면 유효하지 않은 문자가 포함된 경우 예외 발생)
-            decoded_bytes = base64.b64decode(code_base64, validate=True)
-        except binascii.Error as e:
-            return error_response("'code' field is not in a valid format", 400)
-        except Exception as e:
-            logging.error("Unexpected exception occurred", exc_info=True)
-            return error_response("Internal server error", 500)
-
-        # 코드 크기 1MB 초과 여부 검증
-        if len(decoded_bytes) > 1 * 1024 * 1024:  # 1MB = 1,048,576 바이트
-            return error_response("Source code size exceeds 1MB", 400)
-
-        # UTF-8 디코딩 처리
-        try:
-            code_str = decoded_bytes.decode("utf-8")
-        except UnicodeDecodeError as e:
-            return error_response("'code' field is not in a valid format", 400)
-
-        # 공백 검사
-        if not code_str.strip():
-            return error_response("Empty source file", 400)
-
-    # 2) /job/execute
-    elif flask.request.path == '/job/execute' and flask.request.method == 'POST':
-        request_body = flask.request.get_json()
-        if not validate_request_body(request_body, '/job/execute'):
-            return error_response(
-                "Request body must contain 'userId'(integer) and 'jobId'",
-                400
-            )
-
-    # 3) /job/cancel
-    elif flask.request.path == '/job/cancel' and flask.request.method == 'POST':
-        request_body = flask.request.get_json()
-        if not validate_request_body(request_body, '/job/cancel'):
-            return error_response(
-                "Request body must contain 'userId'(integer) and 'jobId'",
-                400
-            )
-
-    # 4) /job
-    elif flask.request.path == '/job' and flask.request.method == 'POST':
-        request_body = flask.request.get_json()
-        if not validate_request_body(request_body, '/job'):
-            return error_response(
-                "Request body must contain 'userId'(integer) and 'jobId'",
-                400
-            )
+    # 검증하면서 변환한 요청 모델을 요청 컨텍스트(flask.g)에 저장하여 라우트에서 그대로 사용
+    if flask.request.method == 'POST' and flask.request.path in ('/job/create', '/job/execute', '/job/cancel', '/job', '/job/verdicts'):
+        request_model, error = parse_endpoint_request_body(flask.request.get_json(), flask.request.path)
+        if error:
+            return error_response(*error)
+        flask.g.request_model = request_model
     return None
 
 
@@ -125,31 +137,32 @@ def validate_request():
 # 1) /job/create
 @job_bp.route('/create', methods=['POST'])
 def create_job() :
-    # request body 파싱
-    request_data = flask.request.get_json()
-    user_id = int(request_data['userId'])
-    code_language = CodeLanguage[request_data['codeLanguage'].upper()]
-    code = request_data['code']
-    challenge_id = int(request_data['challengeId'])
-    total_test_cases = len(TestCaseConfig.get_test_cases(request_data["challengeId"]))
-
-    user_active_jobs: list[Job] = job_repository.find_by_user_id(user_id)
-    if len(user_active_jobs) >= JobConfig.MAX_JOB_COUNT_PER_USER:
-        return error_response(f"Max job count={JobConfig.MAX_JOB_COUNT_PER_USER} exceeded for userId:{user_id}", 422)
+    # before_request에서 검증, 변환된 요청 모델
+    job_request: CreateJobRequest = flask.g.request_model
+    user_id = job_request.user_id
+    code_language = job_request.code_language
+    code = job_request.code
+    challenge_id = job_request.challenge_id
+    total_test_cases = job_request.total_test_cases
 
     job = Job.create(
         code_language=code_language,
         code=code,
         challenge_id=challenge_id,
-        total_test_cases=total_test_cases
+        total_test_cases=total_test_cases,
+        test_case_config_version=job_request.test_case_config_version
     )
 
-    # 테스트 케이스 별 시간 제한
-    test_case_time_limit = TestCaseConfig.get_time_limit(challenge_id, job.code_language)
+    # 테스트 케이스 별 시간 제한 (요청 검증 시 테스트 케이스 수와 같은 설정 스냅샷에서 조회)
+    test_case_time_limit = job_request.test_case_time_limit
 
     job_ttl = round(test_case_time_limit * total_test_cases * 2) # job ttl은 정수형 값만 허용하므로 반올림
 
-    if job_repository.save(user_id, job, job_ttl) == 0:
+    # 유저별 작업 수 제한은 저장과 함께 원자적으로 확인 (동시 요청이 모두 제한을 통과하지 않도록 함)
+    save_result = job_repository.save(user_id, job, job_ttl, max_user_jobs=JobConfig.MAX_JOB_COUNT_PER_USER)
+    if save_result == -2:
+        return error_response(f"Max job count={JobConfig.MAX_JOB_COUNT_PER_USER} exceeded for userId:{user_id}", 422)
+    elif save_result == 0:
         logging.error("[Handling \"/job/create\" request failed. No exception but job doesn't saved]")
         return error_response("Internal server error", 500)
 
@@ -159,27 +172,40 @@ def create_job() :
 # 2) /job/execute
 @job_bp.route('/execute', methods=['POST'])
 def execute_job():
-    request_data = flask.request.get_json()
-    user_id = int(request_data['userId'])
-    job_id = request_data['jobId']
+    job_request: JobRequest = flask.g.request_model
+    user_id = job_request.user_id
+    job_id = job_request.job_id
 
     job: Job = job_repository.find_by_user_id_and_job_id(user_id, job_id)
     if not job:
         return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
 
-    # Celery task queue에 task를 등록
-    # 매개변수 전달 시 python 기본 타입으로 전달
-    celery_client.send_task('worker.tasks.execute_code', args=[user_id, job.as_dict()])
+    # 같은 코드의 채점 결과가 캐시되어 있으면 워커에 태스크를 등록하지 않고 결과를 바로 기록한 뒤,
+    # 워커가 채점을 마쳤을 때와 같은 콜백을 보내 백엔드에 결과를 전달
+    cached_verdicts = job_repository.find_cached_verdicts(job)
+    if cached_verdicts is not None:
+        if job_repository.update(job_id=job_id, user_id=user_id, verdicts=cached_verdicts) == -1:
+            return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
+        callback_dispatcher.dispatch_judgment(job_id, cached_verdicts)
+        return success_response({"totalTestCases": job.total_test_cases}, 202)
+
+    # Celery task queue에 task를 등록 (비동기 등록 모드에서 등록 대기 버퍼가 가득 차면 503 응답)
+    send_error = send_execute_tasks([(user_id, job)])[0]
+    if isinstance(send_error, TaskPublishRejectedError):
+        return error_response("Task queue is busy. Retry later", 503)
+    elif send_error:
+        raise send_error
     return success_response({"totalTestCases": job.total_test_cases}, 202) # Accepted, 실제 요청에 대한 작업은 비동기 처리
 
 
 # 3) /job/cancel
 @job_bp.route('/cancel', methods=['POST'])
 def cancel_job():
-    request_data = flask.request.get_json()
-    user_id = int(request_data['userId'])
-    job_id = request_data['jobId']
+    job_request: JobRequest = flask.g.request_model
+    user_id = job_request.user_id
+    job_id = job_request.job_id
 
+    # 중지 플래그와 함께 중지 요청 키를 기록하고, 실행 중인 워커에 중지 요청을 발행(Pub/Sub)
     update_res = job_repository.update(job_id=job_id, user_id=user_id, stop_flag=True)
 
     if update_res == -1:
@@ -189,18 +215,146 @@ def cancel_job():
         logging.error("[Handling \"/job/cancel\" request failed. No exception but job doesn't updated]")
         return error_response("Internal server error", 500)
 
+    # 아직 시작되지 않은 태스크는 워커가 실행하지 않도록 취소 (실패해도 워커가 실행 시작 시 중지 요청 키를 확인)
+    revoke_error = revoke_execute_task(job_id)
+    if revoke_error:
+        logging.warning(f"[Revoking task failed for job_id={job_id}: {revoke_error}]")
+
     return success_response(http_status=202)
 
 
 #4) /job
 @job_bp.route('', methods=['POST'])
 def check_job_exists():
-    request_data = flask.request.get_json()
-    user_id = int(request_data['userId'])
-    job_id = request_data['jobId']
+    job_request: JobRequest = flask.g.request_model
+    user_id = job_request.user_id
+    job_id = job_request.job_id
 
-    job: Job = job_repository.find_by_user_id_and_job_id(user_id, job_id)
-    if not job:
+    if not job_repository.exists_by_user_id_and_job_id(user_id, job_id):
         return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
     else:
         return success_response(http_status=200)
+
+
+# 5) /job/batch
+@job_bp.route('/batch', methods=['POST'])
+def create_batch_jobs():
+    # 요청 본문(NDJSON)을 청크 단위로 읽으면서 완성된 줄을 바로 검증 (본문 전체를 메모리에 올리지 않음)
+    reader = create_ndjson_reader()
+    items = []
+    while True:
+        chunk = flask.request.stream.read(BATCH_READ_CHUNK_SIZE)
+        lines, error = reader.feed(chunk) if chunk else reader.close()
+        if error:
+            return error_response(*error)
+        items.extend(parse_batch_item(line) for line in lines)
+        if not chunk:
+            break
+
+    if not items:
+        return error_response("Request body must contain at least one job", 400)
+
+    user_ids = list({job_request.user_id for job_request, _ in items if job_request})
+    active_job_counts = dict(zip(user_ids, job_repository.count_by_user_ids(user_ids)))
+    results, jobs_to_save = plan_batch_jobs(items, active_job_counts, flask.g.admin_mode)
+
+    # 작업 저장(파이프라인 하나), 저장에 성공한 작업만 태스크 등록(프로듀서 하나)
+    saved_jobs = []
+    # 앞서 조회한 작업 수는 다른 요청과 동시에 변할 수 있으므로, 관리자 모드가 아니면 저장 시 제한을 다시 확인
+    save_results = job_repository.save_many(
+        [(user_id, job, job_ttl) for _, user_id, job, job_ttl in jobs_to_save],
+        max_user_jobs=0 if flask.g.admin_mode else JobConfig.MAX_JOB_COUNT_PER_USER
+    )
+    for (index, user_id, job, _), save_result in zip(jobs_to_save, save_results):
+        if save_result == -2:
+            results[index] = batch_item_result(
+                index, 422, error=f"Max job count={JobConfig.MAX_JOB_COUNT_PER_USER} exceeded for userId:{user_id}"
+            )
+        elif isinstance(save_result, Exception) or save_result == 0:
+            logging.error(f"[Handling \"/job/batch\" request failed. Job doesn't saved: {save_result}]")
+            results[index] = batch_item_result(index, 500, error="Internal server error")
+        else:
+            saved_jobs.append((index, user_id, job))
+
+    send_results = send_execute_tasks([(user_id, job) for _, user_id, job in saved_jobs])
+    for (index, _, job), send_error in zip(saved_jobs, send_results):
+        if isinstance(send_error, TaskPublishRejectedError):
+            results[index] = batch_item_result(index, 503, job_id=job.job_id, error="Task queue is busy. Retry later")
+        elif send_error:
+            # 작업은 저장되었으므로 jobId와 함께 응답하여 /job/execute로 다시 실행할 수 있도록 함
+            logging.error(f"[Handling \"/job/batch\" request failed. Task doesn't sent: {send_error}]")
+            results[index] = batch_item_result(index, 500, job_id=job.job_id, error="Internal server error")
+        else:
+            results[index] = batch_item_result(index, 202, job_id=job.job_id)
+
+    return success_response({"results": results}, 200)
+
+
+# 6) /job/verdicts
+@job_bp.route('/verdicts', methods=['POST'])
+def read_verdicts():
+    # 평가 결과 스트림을 커서 이후부터 읽어 응답
+    # - 기본: 새 평가 결과가 없으면 최대 waitMs 동안 기다린 뒤 응답 (long-poll)
+    # - Accept: text/event-stream: 스트림의 끝(채점 완료, 중지)까지 평가 결과를 SSE 이벤트로 연속 전송
+    job_request: VerdictStreamRequest = flask.g.request_model
+    user_id = job_request.user_id
+    job_id = job_request.job_id
+    # 요청 공통 재시도 예산 대신 대기 시간(waitMs)을 포함한 마감 시각 사용
+    start_verdict_read_deadline(job_request.wait_ms)
+
+    job: Job = job_repository.find_by_user_id_and_job_id(user_id, job_id, include_code=False, include_verdicts=False)
+    if not job:
+        return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
+
+    if SSE_CONTENT_TYPE in flask.request.headers.get("Accept", ""):
+        # 응답을 모두 전송할 때까지 요청 컨텍스트를 유지 (요청 종료 처리(teardown)는 스트림이 끝난 뒤 실행)
+        return flask.Response(flask.stream_with_context(_generate_verdict_events(job_request)), content_type=SSE_CONTENT_TYPE)
+
+    batch = job_repository.read_verdict_stream(user_id, job_id, job_request.cursor, job_request.limit, job_request.wait_ms)
+    if not batch.verdicts:
+        # 대기하는 동안 중지 요청, 삭제된 경우를 반영하기 위해 다시 조회
+        job = job_repository.find_by_user_id_and_job_id(user_id, job_id, include_code=False, include_verdicts=False)
+        if not job:
+            return error_response(f"Job not found for user_id={user_id} with job_id={job_id}", 404)
+    summary = _find_verdict_stream_summary(user_id, job_id, job, batch)
+    return success_response(verdict_stream_data(batch, summary), 200)
+
+
+def _find_verdict_stream_summary(user_id: int, job_id: str, job: Job, batch: VerdictStreamBatch) -> Optional[dict]:
+    """스트림의 끝까지 읽었으면 채점 결과 요약을, 아니면 None을 반환한다."""
+    if not is_verdict_stream_done(job, batch):
+        return None
+    job = job_repository.find_by_user_id_and_job_id(user_id, job_id, include_code=False, include_verdicts=True) or job
+    return verdict_stream_summary(job)
+
+
+def _generate_verdict_events(job_request: VerdictStreamRequest):
+    # 응답 생성 중에는 요청 컨텍스트(flask.g)를 사용하지 않음
+    user_id, job_id, cursor = job_request.user_id, job_request.job_id, job_request.cursor
+    deadline = time.monotonic() + JobConfig.VERDICT_STREAM_SSE_TIMEOUT
+    while time.monotonic() < deadline:
+        # 응답 상태 코드를 이미 전송했으므로, Redis 장애는 에러 이벤트로 알리고 스트림을 종료
+        try:
+            # 스트림 전체가 아닌 읽기(대기 포함)마다 재시도 예산 적용
+            start_verdict_read_deadline(JobConfig.VERDICT_STREAM_MAX_WAIT_MS)
+            batch = job_repository.read_verdict_stream(
+                user_id, job_id, cursor, job_request.limit, JobConfig.VERDICT_STREAM_MAX_WAIT_MS
+            )
+            job = job_repository.find_by_user_id_and_job_id(user_id, job_id, include_code=False, include_verdicts=False)
+            summary = _find_verdict_stream_summary(user_id, job_id, job, batch) if job else None
+        except RedisUnavailableError as ex:
+            logging.warning(f"[Redis unavailable: {ex}]")
+            yield to_sse_event("error", {"error": "Storage is temporarily unavailable. Retry later"})
+            return
+
+        cursor = batch.cursor
+        if batch.verdicts:
+            yield to_sse_event("verdicts", verdict_stream_data(batch), event_id=cursor)
+        if not job:
+            yield to_sse_event("error", {"error": f"Job not found for user_id={user_id} with job_id={job_id}"})
+            return
+        if summary is not None:
+            yield to_sse_event("summary", summary, event_id=cursor)
+            return
+        if not batch.verdicts:
+            yield ": keep-alive\n\n" # 프록시가 유휴 연결을 끊지 않도록 주석 행 전송
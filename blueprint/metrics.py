@@ -0,0 +1,35 @@
+import flask
+from prometheus_client import CONTENT_TYPE_LATEST, Histogram, generate_latest
+
+metrics_bp = flask.Blueprint('metrics_bp', __name__)
+
+
+# 요청 처리 경로(hot path) 계측 메트릭 (MetricsConfig.ENABLED가 false이면 기록하지 않음)
+# - endpoint 레이블: 라우트 규칙 (ex. /job/create), 일치하는 라우트가 없으면 unmatched
+# - SSE 응답은 응답 객체를 반환한 시점까지의 시간 (스트림 전송 시간 제외)
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds", "Time spent handling a /job API request", ["endpoint", "method", "status"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+HTTP_REQUEST_BODY_BYTES = Histogram(
+    "http_request_body_bytes", "Content-Length of /job API requests", ["endpoint"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+)
+HMAC_VALIDATION_SECONDS = Histogram(
+    "hmac_validation_seconds", "Time spent validating the X-Api-Key header", ["result"],
+    buckets=(0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.001)
+)
+CODE_VALIDATION_SECONDS = Histogram(
+    "code_validation_seconds", "Time spent validating submitted code (base64, UTF-8 decoding and blank check)", ["result"],
+    buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05)
+)
+CODE_PAYLOAD_BYTES = Histogram(
+    "code_payload_bytes", "Decoded size of submitted code",
+    buckets=(128, 512, 1024, 4096, 16384, 65536, 262144, 1048576)
+)
+
+
+# Prometheus 수집(scrape)용 메트릭 엔드포인트
+@metrics_bp.route('', methods=['GET'])
+def metrics():
+    return flask.Response(generate_latest(), status=200, content_type=CONTENT_TYPE_LATEST)
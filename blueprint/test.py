@@ -1,29 +1,144 @@
+import random
+import statistics
+import threading
+import time
+
 from flask import Blueprint, request
 
+from blueprint.helper import validate_hmac_key
+from traceutil import tracer, InMemorySpanExporter
+
 test_bp = Blueprint('test_bp', __name__)
 
+
+class _CallbackRecorder:
+    """
+    채점 결과 콜백 수신 기록 (Spring Boot 백엔드 대신 콜백을 받는 로컬 수신기)
+    - 요청별 이벤트 수(묶음 크기), 이벤트의 sentAt(Unix timestamp, 있는 경우)부터 수신까지의 지연 시간을 기록
+    - failure_rate 비율의 요청은 기록하지 않고 503으로 응답 (재전송 확인용)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.failure_rate = 0.0
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._started_at = time.time()
+            self._requests = 0
+            self._failed_requests = 0
+            self._batch_sizes: list[int] = []
+            self._latencies: list[float] = []
+            self._delivery_ids: set[str] = set()
+            self._duplicates = 0
+
+    def record(self, events: list[dict]) -> bool:
+        """요청을 기록한다. (실패를 주입한 요청이면 False)"""
+        received_at = time.time()
+        with self._lock:
+            self._requests += 1
+            if random.random() < self.failure_rate:
+                self._failed_requests += 1
+                return False
+            delivery_id = request.headers.get("X-Callback-Delivery-Id")
+            if delivery_id in self._delivery_ids:
+                self._duplicates += 1
+                return True
+            if delivery_id:
+                self._delivery_ids.add(delivery_id)
+            self._batch_sizes.append(len(events))
+            self._latencies.extend(received_at - event["sentAt"] for event in events if "sentAt" in event)
+            return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "failedRequests": self._failed_requests,
+                "duplicates": self._duplicates,
+                "events": sum(self._batch_sizes),
+                "meanBatchSize": statistics.mean(self._batch_sizes) if self._batch_sizes else 0,
+                "maxBatchSize": max(self._batch_sizes, default=0),
+                "latencyP50Ms": self._percentile_ms(50),
+                "latencyP99Ms": self._percentile_ms(99),
+                "elapsedSeconds": time.time() - self._started_at,
+            }
+
+    def _percentile_ms(self, p: int) -> float:
+        if len(self._latencies) < 2:
+            return self._latencies[0] * 1000 if self._latencies else 0.0
+        return statistics.quantiles(self._latencies, n=100)[p - 1] * 1000
+
+
+_callback_recorder = _CallbackRecorder()
+
+
+def _record_response(events: list[dict]):
+    return ("", 200) if _callback_recorder.record(events) else ("", 503)
+
+
+def _has_valid_api_key() -> bool:
+    api_key, client_id = request.headers.get("X-Api-Key"), request.headers.get("X-Client-Id")
+    return bool(api_key and client_id and validate_hmac_key(api_key, client_id))
+
+
 # 단위 테스트
-# Celery JOB 실행 및 결과 수신
+# Celery JOB 실행 및 결과 수신 (webhookutil.CallbackDispatcher 전송 대상)
+# 테스트 케이스 별 평가 결과를 하나씩 전송하는 기존 클라이언트용
 @test_bp.route('/test-case-result', methods=['POST'])
 def test_case_result() :
     request_data = request.get_json()
-    print(request_data)
-    return "", 200
+    return _record_response([request_data])
+
+# 테스트 케이스 별 평가 결과는 묶어서 전송됨: {"results": [...]}
+@test_bp.route('/test-case-results', methods=['POST'])
+def test_case_results() :
+    request_data = request.get_json()
+    return _record_response(request_data.get("results", []))
 
 @test_bp.route('/judgment-passed', methods=['POST'])
 def judgment_passed() :
     request_data = request.get_json()
-    print(request_data)
-    return "", 200
+    return _record_response([request_data])
 
 @test_bp.route('/judgment-unpassed', methods=['POST'])
 def judgment_unpassed() :
     request_data = request.get_json()
-    print(request_data)
-    return "", 200
+    return _record_response([request_data])
 
 @test_bp.route('/error', methods=['POST'])
 def error() :
     request_data = request.get_json()
-    print(request_data)
-    return "", 200
\ No newline at end of file
+    return _record_response([request_data])
+
+# 수신 기록 조회(GET), 초기화(DELETE) (/job API와 같은 API 키 필요)
+@test_bp.route('/callback-stats', methods=['GET', 'DELETE'])
+def callback_stats() :
+    if not _has_valid_api_key():
+        return {"error": "Access denied"}, 403
+    if request.method == 'DELETE':
+        _callback_recorder.reset()
+        return "", 204
+    return _callback_recorder.stats(), 200
+
+# 실패 주입 비율 설정: {"failureRate": 0.2} (/job API와 같은 API 키 필요)
+@test_bp.route('/callback-faults', methods=['POST'])
+def callback_faults() :
+    if not _has_valid_api_key():
+        return {"error": "Access denied"}, 403
+    _callback_recorder.failure_rate = float(request.get_json().get("failureRate", 0.0))
+    return "", 204
+
+# 기록된 트레이스 스팬 조회(GET, ?traceId=로 트레이스 하나만 조회), 초기화(DELETE)
+# (TRACING_EXPORTER=memory인 경우에만 사용 가능, 스팬에 요청 경로, 예외 메시지 등 내부 정보가 포함되므로 /job API와 같은 API 키 필요)
+@test_bp.route('/traces', methods=['GET', 'DELETE'])
+def traces() :
+    if not _has_valid_api_key():
+        return {"error": "Access denied"}, 403
+    if not isinstance(tracer.exporter, InMemorySpanExporter):
+        return {"error": "Tracing exporter is not 'memory'"}, 404
+    if request.method == 'DELETE':
+        tracer.exporter.clear()
+        return "", 204
+    return {"spans": tracer.exporter.get_finished_spans(request.args.get("traceId"))}, 200
@@ -0,0 +1,3 @@
+from .publisher import TaskPublisher, TaskPublishRejectedError
+from .routing import TaskRoute, RoutingPolicy, LanguageQueuePolicy, CostPriorityPolicy, FairSharePolicy, CompositeRoutingPolicy
+from .client import celery_client, task_publisher, routing_policy, execute_task_message, send_execute_tasks, revoke_execute_task
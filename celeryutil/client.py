@@ -0,0 +1,136 @@
+import contextlib
+import time
+from typing import Optional
+
+from celery import Celery
+
+from config import RedisConfig, CeleryConfig, MetricsConfig
+from schema.job import CodeChallengeJudgmentJob as Job
+from traceutil import tracer, SpanKind
+from .metrics import CELERY_SEND_TASK_SECONDS
+from .publisher import TaskPublisher, TaskPublishRejectedError
+from .routing import PRIORITY_LEVELS, create_routing_policy
+
+
+# celery 태스크큐에 작업을 등록하는 API를 사용하기 위한 클라이언트 객체 생성
+# 동기(Flask)/비동기(Quart) 블루프린트가 하나의 클라이언트를 공유
+celery_client = Celery(
+    "task-sender",
+    broker=RedisConfig.REDIS_URI,
+    backend=RedisConfig.REDIS_URI
+)
+
+# 브로커/결과 백엔드 커넥션 풀을 작업 저장소(RedisConnection)와 같은 설정으로 구성
+# (kombu는 채널 종료 시 자신의 풀을 disconnect 하므로 redis-py 풀 객체 자체를 공유하지 않고 크기와 타임아웃 설정을 공유)
+celery_client.conf.update(
+    broker_pool_limit=RedisConfig.MAX_CONNECTIONS,
+    broker_transport_options={
+        "max_connections": RedisConfig.MAX_CONNECTIONS,
+        "socket_timeout": RedisConfig.SOCKET_TIMEOUT,
+        "socket_connect_timeout": RedisConfig.SOCKET_CONNECT_TIMEOUT,
+        "socket_keepalive": RedisConfig.SOCKET_KEEPALIVE,
+        "health_check_interval": RedisConfig.HEALTH_CHECK_INTERVAL,
+        # 우선순위별 목록에 등록 (워커도 같은 설정이어야 우선순위가 높은 목록부터 가져감)
+        "priority_steps": list(range(PRIORITY_LEVELS)),
+        "queue_order_strategy": "priority",
+    },
+    redis_max_connections=RedisConfig.MAX_CONNECTIONS,
+    redis_socket_timeout=RedisConfig.SOCKET_TIMEOUT,
+    redis_socket_connect_timeout=RedisConfig.SOCKET_CONNECT_TIMEOUT,
+    redis_socket_keepalive=RedisConfig.SOCKET_KEEPALIVE,
+    redis_backend_health_check_interval=RedisConfig.HEALTH_CHECK_INTERVAL,
+)
+
+
+if CeleryConfig.TASK_PAYLOAD not in ("full", "job_id"):
+    raise ValueError(f"CELERY_TASK_PAYLOAD must be 'full' or 'job_id', got '{CeleryConfig.TASK_PAYLOAD}'")
+
+# 비동기 등록 모드(CELERY_ASYNC_PUBLISH)에서 사용하는 태스크 등록기 (등록 스레드는 첫 등록 시점에 시작)
+task_publisher = TaskPublisher(
+    celery_client,
+    max_buffer_size=CeleryConfig.PUBLISH_BUFFER_SIZE,
+    batch_size=CeleryConfig.PUBLISH_BATCH_SIZE,
+    linger_seconds=CeleryConfig.PUBLISH_LINGER_SECONDS
+)
+
+# 채점 태스크의 큐와 우선순위를 정하는 정책 (CELERY_ROUTING_POLICIES)
+routing_policy = create_routing_policy(CeleryConfig.ROUTING_POLICIES)
+
+
+def execute_task_message(user_id: int, job: Job) -> tuple[str, list, dict]:
+    """
+    작업의 채점 태스크 (태스크 이름, 인자, 등록 옵션)를 구성한다. (태스크 ID는 작업 ID, 큐와 우선순위는 routing_policy로 결정)
+    TASK_PAYLOAD가 job_id이면 코드를 포함한 작업 전체 대신 작업 ID만 전달하여, 코드가 브로커를 다시 거치지 않도록 한다.
+    (매개변수 전달 시 python 기본 타입으로 전달)
+    테스트 케이스 설정 스냅샷 버전은 API 서버에서만 사용하는 값이므로 Redis에만 저장하고 태스크 인자에는 포함하지 않는다.
+    """
+    options = {"task_id": job.job_id, **routing_policy.route(user_id, job).as_options()}
+    if CeleryConfig.TASK_PAYLOAD == "job_id":
+        return CeleryConfig.EXECUTE_BY_JOB_ID_TASK_NAME, [user_id, job.job_id], options
+    job_dict = job.as_dict()
+    job_dict.pop("testCaseConfigVersion", None)
+    return CeleryConfig.EXECUTE_TASK_NAME, [user_id, job_dict], options
+
+
+def send_execute_tasks(user_jobs: list[tuple[int, Job]]) -> list[Optional[Exception]]:
+    """
+    (user_id, 작업) 목록으로 채점 태스크를 등록한다.
+    - 비동기 등록 모드: 등록 대기 버퍼에 넣고 바로 반환 (버퍼가 가득 차면 TaskPublishRejectedError)
+    - 그 외: 태스크마다 브로커 커넥션을 풀에서 다시 가져오지 않도록 하나의 프로듀서(커넥션, 채널)로 연속 등록
+    반환 리스트는 입력 순서를 따르며, 각 항목은 등록 성공 시 None, 실패 시 발생한 예외 객체가 된다.
+    트레이싱 사용 시 태스크마다 등록 스팬을 기록하고, 태스크 메시지 헤더에 traceparent를 추가하여 워커가 같은 트레이스를 이어가도록 한다.
+    """
+    messages = [execute_task_message(user_id, job) for user_id, job in user_jobs]
+    results: list[Optional[Exception]] = []
+    if CeleryConfig.ASYNC_PUBLISH:
+        for task_name, args, options in messages:
+            with _publish_span(task_name, options):
+                try:
+                    task_publisher.submit(task_name, args, options)
+                    results.append(None)
+                except TaskPublishRejectedError as e:
+                    results.append(e)
+        return results
+
+    with celery_client.producer_or_acquire() as producer:
+        for task_name, args, options in messages:
+            start = time.perf_counter()
+            try:
+                with _publish_span(task_name, options):
+                    celery_client.send_task(task_name, args=args, producer=producer, **options)
+                results.append(None)
+            except Exception as e:
+                results.append(e)
+                continue
+            if MetricsConfig.ENABLED:
+                CELERY_SEND_TASK_SECONDS.labels(mode="direct").observe(time.perf_counter() - start)
+    return results
+
+
+@contextlib.contextmanager
+def _publish_span(task_name: str, options: dict):
+    """태스크 등록 스팬을 현재 스팬으로 시작하고, 등록 옵션의 메시지 헤더에 traceparent를 추가한다. (트레이싱 미사용 시 헤더 추가 없음)"""
+    with tracer.start_as_current_span(f"{task_name} publish", SpanKind.PRODUCER, {
+        "messaging.system": "celery",
+        "messaging.destination.name": options.get("queue"),
+        "messaging.message.id": options.get("task_id"),
+    }) as span:
+        headers = tracer.inject({})
+        if headers:
+            options["headers"] = {**options.get("headers", {}), **headers}
+        yield span
+
+
+def revoke_execute_task(job_id: str) -> Optional[Exception]:
+    """
+    작업의 채점 태스크(태스크 ID = 작업 ID)를 취소한다.
+    아직 시작되지 않은 태스크는 워커가 실행하지 않고 버리며, 실행 중인 태스크는 중지 요청(Pub/Sub)으로 중지된다.
+
+    Returns:
+        Optional[Exception]: 취소 요청 전송 실패 시 발생한 예외 객체
+    """
+    try:
+        celery_client.control.revoke(job_id)
+        return None
+    except Exception as e:
+        return e
@@ -0,0 +1,22 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# 비동기 태스크 등록 메트릭
+CELERY_PUBLISH_BUFFER_SIZE = Gauge(
+    "celery_publish_buffer_size", "Number of tasks waiting in the in-process publish buffer"
+)
+CELERY_PUBLISH_TOTAL = Counter(
+    "celery_publish_total", "Number of tasks handed to the publisher by result", ["result"]
+)
+CELERY_PUBLISH_LATENCY_SECONDS = Histogram(
+    "celery_publish_latency_seconds", "Time from submitting a task to the publisher until it is sent to the broker",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+)
+CELERY_PUBLISH_BATCH_SIZE = Histogram(
+    "celery_publish_batch_size", "Number of tasks sent to the broker in one batch",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500)
+)
+CELERY_SEND_TASK_SECONDS = Histogram(
+    "celery_send_task_seconds", "Time spent in one send_task call (direct: request thread, buffered: publisher thread)", ["mode"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)
+)
@@ -0,0 +1,135 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Optional
+
+from celery import Celery
+
+from .metrics import (
+    CELERY_PUBLISH_BUFFER_SIZE, CELERY_PUBLISH_TOTAL, CELERY_PUBLISH_LATENCY_SECONDS, CELERY_PUBLISH_BATCH_SIZE,
+    CELERY_SEND_TASK_SECONDS
+)
+from traceutil import tracer, SpanKind
+
+
+class TaskPublishRejectedError(Exception):
+    """
+    Description:
+        등록 대기 버퍼가 가득 차 태스크 등록 요청을 거절한 경우의 예외. (브로커 등록이 밀리고 있으므로 잠시 후 다시 요청해야 함)
+    """
+    pass
+
+
+class TaskPublisher:
+    """
+    Description:
+        Celery 태스크를 요청 스레드에서 바로 등록하지 않고, 크기가 제한된 버퍼에 넣은 뒤 별도 스레드에서 묶어서 등록하는 클래스.
+        - 묶음 하나는 하나의 프로듀서(브로커 커넥션, 채널)로 연속 등록하므로, 태스크마다 커넥션을 풀에서 다시 가져오지 않음
+        - 버퍼가 가득 차면 submit()이 TaskPublishRejectedError를 발생시켜 호출자에게 백프레셔를 전달함
+        - 등록 스레드는 첫 submit() 시점에 프로세스마다 시작 (fork 이후 자식 프로세스에는 부모의 스레드가 없음)
+    """
+
+    def __init__(self,
+        celery_app: Celery,
+        max_buffer_size: int,
+        batch_size: int,
+        linger_seconds: float = 0.0
+    ):
+        self._celery_app = celery_app
+        self._max_buffer_size = max_buffer_size
+        self._batch_size = batch_size
+        self._linger_seconds = linger_seconds
+
+        self._buffer: queue.Queue = queue.Queue(maxsize=max_buffer_size)
+        self._start_lock = threading.Lock()
+        self._pid: Optional[int] = None
+        CELERY_PUBLISH_BUFFER_SIZE.set_function(lambda: self._buffer.qsize())
+
+    def submit(self, task_name: str, args: list, options: dict = None):
+        """
+        태스크를 등록 대기 버퍼에 넣는다. (브로커 등록 완료를 기다리지 않음, options: send_task()의 task_id, queue, priority 등)
+
+        Raises:
+            TaskPublishRejectedError: 버퍼가 가득 찬 경우
+        """
+        self._ensure_started()
+        try:
+            self._buffer.put_nowait((task_name, args, options or {}, time.perf_counter()))
+        except queue.Full:
+            CELERY_PUBLISH_TOTAL.labels(result="rejected").inc()
+            raise TaskPublishRejectedError(f"Task publish buffer is full (size={self._max_buffer_size})")
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        버퍼에 있는 태스크가 모두 등록(또는 등록 실패 처리)될 때까지 기다린다.
+
+        Returns:
+            bool: timeout 이내에 모두 처리되었으면 True
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self._buffer.unfinished_tasks:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def _ensure_started(self):
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                # fork 이전 부모 프로세스의 버퍼(잠금 상태 포함)는 자식 프로세스에서 사용하지 않음
+                self._buffer = queue.Queue(maxsize=self._max_buffer_size)
+            threading.Thread(target=self._run, name="celery-task-publisher", daemon=True).start()
+            atexit.register(self.flush, 5.0) # 종료 시 버퍼에 남은 태스크 등록
+            self._pid = os.getpid()
+
+    def _run(self):
+        while True:
+            batch = [self._buffer.get()]
+            linger_deadline = time.perf_counter() + self._linger_seconds
+            while len(batch) < self._batch_size:
+                try:
+                    remaining = linger_deadline - time.perf_counter()
+                    batch.append(self._buffer.get(timeout=remaining) if remaining > 0 else self._buffer.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._publish_batch(batch)
+            finally:
+                for _ in batch:
+                    self._buffer.task_done()
+
+    def _publish_batch(self, batch: list[tuple]):
+        CELERY_PUBLISH_BATCH_SIZE.observe(len(batch))
+        sent_count = 0
+        try:
+            with self._celery_app.producer_or_acquire() as producer:
+                for task_name, args, options, submitted_at in batch:
+                    start = time.perf_counter()
+                    try:
+                        # 요청 스레드의 등록 스팬(메시지 헤더의 traceparent)을 부모로 실제 브로커 전송 구간을 기록
+                        with tracer.start_as_current_span(f"{task_name} send", SpanKind.PRODUCER, {
+                            "messaging.system": "celery",
+                            "messaging.destination.name": options.get("queue"),
+                            "messaging.message.id": options.get("task_id"),
+                            "messaging.batch.message_count": len(batch),
+                        }, parent=tracer.extract(options.get("headers"))):
+                            self._celery_app.send_task(task_name, args=args, producer=producer, **options)
+                    except Exception:
+                        CELERY_PUBLISH_TOTAL.labels(result="failed").inc()
+                        logging.error(f"[Publishing task failed. task={task_name}, task_id={options.get('task_id')}]", exc_info=True)
+                        continue
+                    sent_count += 1
+                    CELERY_SEND_TASK_SECONDS.labels(mode="buffered").observe(time.perf_counter() - start)
+                    CELERY_PUBLISH_TOTAL.labels(result="sent").inc()
+                    CELERY_PUBLISH_LATENCY_SECONDS.observe(time.perf_counter() - submitted_at)
+        except Exception:
+            # 브로커 커넥션을 가져오지 못한 경우 묶음 전체 실패
+            CELERY_PUBLISH_TOTAL.labels(result="failed").inc(len(batch) - sent_count)
+            logging.error(f"[Publishing task batch failed. {len(batch) - sent_count} tasks not sent]", exc_info=True)
@@ -0,0 +1,182 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, Optional
+
+from common import CodeLanguage
+from config import CeleryConfig, TestCaseConfig
+from config.test_case_config import TestCaseConfigSnapshot
+from schema.job import CodeChallengeJudgmentJob as Job
+
+
+# Redis 브로커의 메시지 우선순위 범위 (0: 가장 높음 ~ PRIORITY_LEVELS - 1: 가장 낮음, AMQP 브로커와 반대)
+# 워커도 같은 broker_transport_options(priority_steps, queue_order_strategy)로 구성해야 우선순위 순서로 가져감
+PRIORITY_LEVELS = 10
+
+
+@dataclass(frozen=True)
+class TaskRoute:
+    """
+    Description:
+        채점 태스크를 등록할 큐와 우선순위.
+
+    Attributes:
+        queue (Optional[str]): 큐 이름 (None: Celery 기본 큐)
+        priority (Optional[int]): 우선순위 (0 ~ PRIORITY_LEVELS - 1, None: 우선순위 미지정)
+    """
+    queue: Optional[str] = None
+    priority: Optional[int] = None
+
+    def as_options(self) -> dict:
+        """send_task()에 전달할 옵션 (지정하지 않은 값은 제외)"""
+        options = {}
+        if self.queue is not None:
+            options["queue"] = self.queue
+        if self.priority is not None:
+            options["priority"] = self.priority
+        return options
+
+
+class RoutingPolicy:
+    """
+    Description:
+        채점 태스크의 큐와 우선순위를 정하는 정책의 공통 인터페이스.
+        여러 정책을 순서대로 적용할 수 있도록, 앞선 정책이 정한 경로를 받아 변경한 경로를 반환한다.
+
+    Attributes:
+        name (str): 설정 값으로 사용하는 정책 이름
+    """
+    name: str = ""
+
+    def route(self, user_id: int, job: Job, task_route: TaskRoute) -> TaskRoute:
+        raise NotImplementedError
+
+
+class LanguageQueuePolicy(RoutingPolicy):
+    """
+    언어별 큐({queue_prefix}.{언어}, ex. judge.python3)로 등록하는 정책.
+    언어별로 워커 수를 따로 두어, 한 언어의 작업이 몰려도 다른 언어의 작업이 기다리지 않도록 한다.
+    """
+    name = "language"
+
+    def __init__(self, queue_prefix: str):
+        self._queue_prefix = queue_prefix
+
+    def route(self, user_id: int, job: Job, task_route: TaskRoute) -> TaskRoute:
+        return replace(task_route, queue=f"{self._queue_prefix}.{CodeLanguage(job.code_language).value.lower()}")
+
+
+class CostPriorityPolicy(RoutingPolicy):
+    """
+    예상 채점 비용(테스트 케이스 별 시간 제한 x 테스트 케이스 수, 단위: 초)이 작을수록 높은 우선순위로 등록하는 정책.
+    비용이 max_cost_seconds 이상이면 가장 낮은 우선순위가 된다. (짧은 작업이 긴 작업 뒤에서 기다리는 시간을 줄임)
+    시간 제한은 작업 생성 시 사용한 설정 스냅샷(job.test_case_config_version)에서 조회한다. (테스트 케이스 수와 같은 설정 기준)
+    """
+    name = "cost"
+
+    def __init__(self,
+        max_cost_seconds: float,
+        snapshot_func: Callable[[Optional[str]], Optional[TestCaseConfigSnapshot]] = TestCaseConfig.get_snapshot
+    ):
+        self._max_cost_seconds = max_cost_seconds
+        self._snapshot_func = snapshot_func
+
+    def route(self, user_id: int, job: Job, task_route: TaskRoute) -> TaskRoute:
+        snapshot = self._snapshot_func(job.test_case_config_version)
+        if snapshot is None:
+            # 작업 생성 시 사용한 설정 스냅샷을 더 이상 유지하지 않으면 우선순위를 정하지 않음
+            logging.warning(
+                f"[Test case config snapshot not found for version={job.test_case_config_version}. Task priority not set]"
+            )
+            return task_route
+        try:
+            time_limit = snapshot.get_time_limit(job.challenge_id, CodeLanguage(job.code_language))
+        except KeyError:
+            # 시간 제한 설정이 없는 챌린지는 우선순위를 정하지 않음
+            logging.warning(f"[Time limit not found for challenge_id={job.challenge_id}. Task priority not set]")
+            return task_route
+        cost = time_limit * job.total_test_cases
+        priority = min(PRIORITY_LEVELS - 1, int(PRIORITY_LEVELS * cost / self._max_cost_seconds))
+        return replace(task_route, priority=priority)
+
+
+class FairSharePolicy(RoutingPolicy):
+    """
+    유저별 토큰 버킷(최대 burst개, 초당 refill_rate개 충전)으로 짧은 시간에 많은 작업을 등록한 유저를 찾아,
+    토큰이 없는 유저의 작업은 우선순위를 penalty 단계 낮추는 정책. (한 유저가 몰아서 제출해도 다른 유저의 작업이 먼저 처리됨)
+    토큰 버킷은 프로세스(워커)마다 유지하며, 최근에 등록한 max_users명의 유저만 기억한다.
+    """
+    name = "fair_share"
+
+    def __init__(self,
+        burst: float,
+        refill_rate: float,
+        penalty: int,
+        default_priority: int,
+        max_users: int = 100_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._burst = burst
+        self._refill_rate = refill_rate
+        self._penalty = penalty
+        self._default_priority = default_priority
+        self._max_users = max_users
+        self._clock = clock
+
+        self._buckets: OrderedDict[int, tuple[float, float]] = OrderedDict() # user_id: (남은 토큰 수, 마지막 갱신 시각)
+        self._lock = threading.Lock()
+
+    def route(self, user_id: int, job: Job, task_route: TaskRoute) -> TaskRoute:
+        if self._take_token(user_id):
+            return task_route
+        priority = self._default_priority if task_route.priority is None else task_route.priority
+        return replace(task_route, priority=min(PRIORITY_LEVELS - 1, priority + self._penalty))
+
+    def _take_token(self, user_id: int) -> bool:
+        now = self._clock()
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(user_id, (self._burst, now))
+            tokens = min(self._burst, tokens + (now - updated_at) * self._refill_rate)
+            has_token = tokens >= 1
+            self._buckets[user_id] = (tokens - 1 if has_token else tokens, now)
+            if len(self._buckets) > self._max_users:
+                self._buckets.popitem(last=False)
+            return has_token
+
+
+class CompositeRoutingPolicy(RoutingPolicy):
+    """여러 정책을 순서대로 적용하는 정책 (정책이 없으면 Celery 기본 큐, 기본 우선순위)"""
+    name = "composite"
+
+    def __init__(self, policies: list[RoutingPolicy]):
+        self._policies = policies
+
+    def route(self, user_id: int, job: Job, task_route: TaskRoute = TaskRoute()) -> TaskRoute:
+        for policy in self._policies:
+            task_route = policy.route(user_id, job, task_route)
+        return task_route
+
+
+def create_routing_policy(names: list[str]) -> CompositeRoutingPolicy:
+    """
+    설정 값(정책 이름 목록)에 해당하는 정책을 순서대로 적용하는 정책 객체를 생성합니다.
+    """
+    factories = {
+        LanguageQueuePolicy.name: lambda: LanguageQueuePolicy(CeleryConfig.LANGUAGE_QUEUE_PREFIX),
+        CostPriorityPolicy.name: lambda: CostPriorityPolicy(CeleryConfig.MAX_COST_SECONDS),
+        FairSharePolicy.name: lambda: FairSharePolicy(
+            burst=CeleryConfig.FAIR_SHARE_BURST,
+            refill_rate=CeleryConfig.FAIR_SHARE_REFILL_RATE,
+            penalty=CeleryConfig.FAIR_SHARE_PENALTY,
+            default_priority=CeleryConfig.DEFAULT_PRIORITY
+        ),
+    }
+    policies = []
+    for name in names:
+        factory = factories.get(name.lower())
+        if factory is None:
+            raise ValueError(f"Unknown routing policy: '{name}' (available: {', '.join(factories)})")
+        policies.append(factory())
+    return CompositeRoutingPolicy(policies)
@@ -1,3 +1,5 @@
-from .env_helper import get_env_var
+from .env_helper import get_env_var, str_to_bool
 from .util import *
 from .enums import *
+from .codec import Codec, JsonCodec, StorageCodec, get_codec
+from .compression import CodeCompressor
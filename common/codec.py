@@ -0,0 +1,126 @@
+import json
+from typing import Any, Optional, Union
+
+
+class Codec:
+    """
+    Description:
+        객체(dict, list 등 기본 타입) <-> bytes 변환을 담당하는 코덱의 공통 인터페이스.
+
+    Attributes:
+        name (str): 설정 값으로 사용하는 코덱 이름
+        format_version (Optional[int]): 저장 형식 버전 (JSON 텍스트 형식은 헤더 없이 저장하므로 None)
+    """
+    name: str = ""
+    format_version: Optional[int] = None
+
+    def encode(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """표준 라이브러리 json 모듈 기반 코덱"""
+    name = "json"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """orjson 기반 코덱 (JsonCodec과 같은 JSON 텍스트를 생성하므로 서로의 결과를 읽을 수 있음)"""
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def encode(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """msgpack 기반 바이너리 코덱"""
+    name = "msgpack"
+    format_version = 1
+
+    def __init__(self):
+        import msgpack
+        self._msgpack = msgpack
+
+    def encode(self, obj: Any) -> bytes:
+        return self._msgpack.packb(obj, use_bin_type=True)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+
+_CODEC_CLASSES = {codec_class.name: codec_class for codec_class in (JsonCodec, OrjsonCodec, MsgpackCodec)}
+
+
+def get_codec(name: str) -> Codec:
+    """
+    설정 값(코덱 이름)에 해당하는 코덱 객체를 생성합니다.
+    orjson, msgpack 코덱은 해당 패키지가 설치되어 있어야 합니다.
+    """
+    codec_class = _CODEC_CLASSES.get(name.lower())
+    if codec_class is None:
+        raise ValueError(f"Unknown codec: '{name}' (available: {', '.join(_CODEC_CLASSES)})")
+    return codec_class()
+
+
+class StorageCodec:
+    """
+    Description:
+        저장 데이터에 형식 버전을 기록하여, 어떤 코덱으로 저장된 값이든 읽을 수 있도록 하는 클래스.
+
+        - JSON 텍스트 형식(json, orjson): 헤더 없이 저장 (기존 저장 데이터와 동일한 형식)
+        - 바이너리 형식(msgpack 등): STORAGE_HEADER(0xC1) + 형식 버전(1 byte) + 본문
+          0xC1은 msgpack에서 사용하지 않는 바이트이며 JSON 텍스트의 첫 글자로도 올 수 없으므로 형식 구분에 사용
+    """
+
+    STORAGE_HEADER = b"\xc1"
+
+    def __init__(self, codec: Codec):
+        self._codec = codec
+        # 읽기 시 사용할 JSON 코덱 (설정된 코덱이 JSON 텍스트 형식이면 그대로 사용)
+        self._json_codec = codec if codec.format_version is None else JsonCodec()
+        self._binary_codecs: dict[int, Codec] = {}
+        if codec.format_version is not None:
+            self._binary_codecs[codec.format_version] = codec
+
+    @property
+    def codec(self) -> Codec:
+        return self._codec
+
+    def encode(self, obj: Any) -> bytes:
+        payload = self._codec.encode(obj)
+        if self._codec.format_version is None:
+            return payload
+        return self.STORAGE_HEADER + bytes([self._codec.format_version]) + payload
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        if isinstance(data, bytes) and data[:1] == self.STORAGE_HEADER:
+            return self._binary_codec(data[1]).decode(data[2:])
+        return self._json_codec.decode(data)
+
+    def _binary_codec(self, format_version: int) -> Codec:
+        # 현재 설정과 다른 바이너리 형식으로 저장된 데이터(설정 변경 이전 데이터)는 필요할 때 코덱을 생성하여 읽음
+        codec = self._binary_codecs.get(format_version)
+        if codec is None:
+            codec_class = next(
+                (codec_class for codec_class in _CODEC_CLASSES.values() if codec_class.format_version == format_version),
+                None
+            )
+            if codec_class is None:
+                raise ValueError(f"Unknown storage format version: {format_version}")
+            codec = self._binary_codecs[format_version] = codec_class()
+        return codec
@@ -0,0 +1,77 @@
+import base64
+import zlib
+from typing import Union
+
+
+class CodeCompressor:
+    """
+    Description:
+        제출된 코드(base64 문자열)를 Redis에 저장할 형태로 변환하고, 조회 시 다시 base64 문자열로 복원하는 클래스.
+
+        - algorithm == "none": base64 문자열을 그대로 저장 (encoding: "base64")
+        - algorithm == "zlib" | "zstd": base64를 디코딩한 원본 바이트를 저장
+            - 원본 크기가 min_size 미만이면 압축하지 않고 원본 바이트 그대로 저장 (encoding: "raw")
+            - 그 외에는 압축하여 저장 (encoding: "zlib" | "zstd")
+    """
+
+    ALGORITHMS = ("none", "zlib", "zstd")
+
+    def __init__(self, algorithm: str = "none", min_size: int = 4096, level: int = None):
+        algorithm = algorithm.lower()
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown code compression algorithm: '{algorithm}' (available: {', '.join(self.ALGORITHMS)})")
+        self._algorithm = algorithm
+        self._min_size = min_size
+        self._level = level
+
+        self._zstd_compressor = None
+        self._zstd_decompressor = None
+        if algorithm == "zstd":
+            self._zstd_compressor, self._zstd_decompressor = self._create_zstd(level)
+
+    @staticmethod
+    def _create_zstd(level: int = None):
+        import zstandard
+        compressor = zstandard.ZstdCompressor(level=level) if level is not None else zstandard.ZstdCompressor()
+        return compressor, zstandard.ZstdDecompressor()
+
+    def compress(self, code_base64: str) -> tuple[str, Union[str, bytes]]:
+        """
+        Returns:
+            tuple[str, Union[str, bytes]]: (encoding, 저장할 값)
+        """
+        if self._algorithm == "none":
+            return "base64", code_base64
+
+        raw = base64.b64decode(code_base64)
+        if len(raw) < self._min_size:
+            return "raw", raw
+
+        if self._algorithm == "zlib":
+            return "zlib", zlib.compress(raw, self._level if self._level is not None else zlib.Z_DEFAULT_COMPRESSION)
+        return "zstd", self._zstd_compressor.compress(raw)
+
+    def decompress(self, encoding: str, data: Union[str, bytes, None]) -> Union[str, None]:
+        """
+        저장된 값을 base64 문자열로 복원합니다. (encoding 필드가 없는 데이터는 base64 문자열로 간주)
+        """
+        if data is None:
+            return None
+
+        if encoding in (None, "base64"):
+            return data.decode("utf-8") if isinstance(data, bytes) else data
+
+        if encoding == "raw":
+            raw = data
+        elif encoding == "zlib":
+            raw = zlib.decompress(data)
+        elif encoding == "zstd":
+            # 설정이 변경되기 전에 zstd로 저장된 데이터도 읽을 수 있도록 필요할 때 생성
+            if self._zstd_decompressor is None:
+                self._zstd_compressor, self._zstd_decompressor = self._create_zstd(self._level)
+            raw = self._zstd_decompressor.decompress(data)
+        else:
+            raise ValueError(f"Unknown code encoding: '{encoding}'")
+
+        return base64.b64encode(raw).decode("ascii")
+
@@ -24,4 +24,11 @@ class FailureCause(Enum):
     WRONG_ANSWER = "WRONG_ANSWER"
 
     SANDBOX_TIMEOUT = "SANDBOX_TIMEOUT"
-    SANDBOX_OUT_OF_MEMORY = "SANDBOX_OUT_OF_MEMORY"
\ No newline at end of file
+    SANDBOX_OUT_OF_MEMORY = "SANDBOX_OUT_OF_MEMORY"
+
+class CallbackEventType(Enum):
+    """채점 결과 콜백(웹훅) 이벤트 종류"""
+    TEST_CASE_RESULT = "TEST_CASE_RESULT" # 테스트 케이스 별 평가 결과 (묶어서 전송)
+    JUDGMENT_PASSED = "JUDGMENT_PASSED"
+    JUDGMENT_UNPASSED = "JUDGMENT_UNPASSED"
+    ERROR = "ERROR"
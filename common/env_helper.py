@@ -1,11 +1,21 @@
 import os
 
 
-def get_env_var(key: str, cast_func=lambda x: x):
+# default 인자가 전달되지 않았음을 나타내는 값 (None을 기본값으로 사용하는 경우와 구분하기 위함)
+_NO_DEFAULT = object()
+
+
+def get_env_var(key: str, cast_func=lambda x: x, default=_NO_DEFAULT):
     value = os.getenv(key)
     if value is None:
+        if default is not _NO_DEFAULT:
+            return default
         raise ValueError(f"Environment variable '{key}' is not set.")
     try:
         return cast_func(value)
     except Exception as e:
-        raise ValueError(f"Error converting environment variable '{key}': {e}") from e
\ No newline at end of file
+        raise ValueError(f"Error converting environment variable '{key}': {e}") from e
+
+
+def str_to_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
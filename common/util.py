@@ -1,12 +1,19 @@
 import re
+from functools import lru_cache
 
 
+# 키 변환 대상은 스키마 필드 이름 등 종류가 한정된 문자열이므로 결과를 캐싱하여 재사용
+@lru_cache(maxsize=1024)
 def snake_to_camel(snake_str: str) -> str:
     components = snake_str.split('_')
     return components[0] + ''.join(x.title() for x in components[1:])
 
 
-def camel_to_snake(camel_str: str) -> str:
-    s1 = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', camel_str)
-    return re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+_CAMEL_TO_SNAKE_PATTERN_1 = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL_TO_SNAKE_PATTERN_2 = re.compile(r'([a-z0-9])([A-Z])')
+
 
+@lru_cache(maxsize=1024)
+def camel_to_snake(camel_str: str) -> str:
+    s1 = _CAMEL_TO_SNAKE_PATTERN_1.sub(r'\1_\2', camel_str)
+    return _CAMEL_TO_SNAKE_PATTERN_2.sub(r'\1_\2', s1).lower()
@@ -4,4 +4,9 @@ load_dotenv()
 from .redis_config import RedisConfig
 from .security_config import SecurityConfig
 from .job_config import JobConfig
-from .test_case_config import TestCaseConfig
\ No newline at end of file
+from .test_case_config import TestCaseConfig
+from .codec_config import CodecConfig
+from .celery_config import CeleryConfig
+from .webhook_config import WebhookConfig
+from .metrics_config import MetricsConfig
+from .tracing_config import TracingConfig
@@ -0,0 +1,34 @@
+from common import get_env_var, str_to_bool
+
+
+class CeleryConfig:
+    """
+    Description:
+        채점 태스크 등록 관련 설정을 관리하는 클래스.
+        - TASK_PAYLOAD: 태스크 인자로 전달할 작업 데이터 (full: 작업 전체(코드 포함) | job_id: 작업 ID만 전달, 워커가 Redis에서 작업 조회)
+        - ASYNC_PUBLISH: 태스크를 요청 스레드에서 바로 등록하지 않고, 버퍼에 넣은 뒤 별도 스레드에서 묶어서 등록할지 여부
+        - ROUTING_POLICIES: 태스크의 큐와 우선순위를 정하는 정책 목록 (쉼표로 구분, 순서대로 적용, 빈 값이면 기본 큐)
+          language: 언어별 큐 | cost: 예상 채점 비용 기반 우선순위 | fair_share: 유저별 토큰 소진 시 우선순위 하향
+    """
+    EXECUTE_TASK_NAME = "worker.tasks.execute_code" # 인자: [user_id, 작업 딕셔너리]
+    EXECUTE_BY_JOB_ID_TASK_NAME = "worker.tasks.execute_code_by_job_id" # 인자: [user_id, job_id]
+
+    TASK_PAYLOAD = get_env_var("CELERY_TASK_PAYLOAD", str, "full")
+
+    ASYNC_PUBLISH = get_env_var("CELERY_ASYNC_PUBLISH", str_to_bool, False)
+    PUBLISH_BUFFER_SIZE = get_env_var("CELERY_PUBLISH_BUFFER_SIZE", int, 10000) # 버퍼가 가득 차면 등록 요청 거절 (503 응답)
+    PUBLISH_BATCH_SIZE = get_env_var("CELERY_PUBLISH_BATCH_SIZE", int, 100) # 한 번에 같은 커넥션으로 등록할 최대 태스크 수
+    # 첫 태스크가 들어온 뒤 묶음을 채우기 위해 기다리는 최대 시간 (단위: 초, 0: 기다리지 않고 버퍼에 있는 태스크만 등록)
+    PUBLISH_LINGER_SECONDS = get_env_var("CELERY_PUBLISH_LINGER_SECONDS", float, 0.0)
+
+    ROUTING_POLICIES = get_env_var(
+        "CELERY_ROUTING_POLICIES", lambda value: [name.strip() for name in value.split(",") if name.strip()], []
+    )
+    LANGUAGE_QUEUE_PREFIX = get_env_var("CELERY_LANGUAGE_QUEUE_PREFIX", str, "judge") # 언어별 큐 이름: {prefix}.{언어}
+    # 이 값 이상의 예상 채점 비용(테스트 케이스 별 시간 제한 x 테스트 케이스 수, 단위: 초)은 가장 낮은 우선순위
+    MAX_COST_SECONDS = get_env_var("CELERY_MAX_COST_SECONDS", float, 60.0)
+    # 유저별 토큰 버킷 (최대 토큰 수, 초당 충전 토큰 수, 토큰이 없을 때 낮출 우선순위 단계)
+    FAIR_SHARE_BURST = get_env_var("CELERY_FAIR_SHARE_BURST", float, 10.0)
+    FAIR_SHARE_REFILL_RATE = get_env_var("CELERY_FAIR_SHARE_REFILL_RATE", float, 0.2)
+    FAIR_SHARE_PENALTY = get_env_var("CELERY_FAIR_SHARE_PENALTY", int, 3)
+    DEFAULT_PRIORITY = get_env_var("CELERY_DEFAULT_PRIORITY", int, 5) # 앞선 정책이 우선순위를 정하지 않은 경우의 기준 우선순위
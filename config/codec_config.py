@@ -0,0 +1,12 @@
+from common import get_env_var
+
+
+class CodecConfig:
+    """
+    Description:
+        직렬화 코덱 설정 정보를 관리하는 클래스.
+        - STORAGE_CODEC: Redis에 저장하는 작업 데이터의 코덱 (json | orjson | msgpack)
+        - RESPONSE_CODEC: HTTP 응답 본문의 코덱 (json | orjson, 응답은 항상 JSON 형식)
+    """
+    STORAGE_CODEC = get_env_var("JOB_STORAGE_CODEC", str, "json")
+    RESPONSE_CODEC = get_env_var("RESPONSE_CODEC", str, "json")
@@ -1,6 +1,33 @@
+from common import get_env_var, str_to_bool
+
+
 class JobConfig:
     """
     Description:
         코드 채점 작업 설정 관련 설정(유저 당 동시에 유지 가능한 코드 채점 작업 갯수 제한 등)을 관리하는 클래스.
     """
     MAX_JOB_COUNT_PER_USER = 2
+
+    MAX_CODE_BYTES = 1 * 1024 * 1024 # 제출 코드 최대 크기 (디코딩 후 기준, 1MB = 1,048,576 바이트)
+    # 요청 본문 최대 크기 (1MB 코드의 base64 인코딩 크기 약 1.34MB + 나머지 필드, 초과 시 본문을 읽기 전에 413 응답)
+    MAX_REQUEST_BODY_BYTES = get_env_var("MAX_REQUEST_BODY_BYTES", int, 2 * 1024 * 1024)
+
+    # /job/batch 요청 설정 (요청 하나에 포함 가능한 작업 수, 본문 최대 크기)
+    MAX_BATCH_SIZE = get_env_var("MAX_BATCH_SIZE", int, 1000)
+    MAX_BATCH_REQUEST_BODY_BYTES = get_env_var("MAX_BATCH_REQUEST_BODY_BYTES", int, 64 * 1024 * 1024)
+
+    # /job/verdicts 평가 결과 스트림 조회 설정
+    VERDICT_STREAM_BATCH_SIZE = get_env_var("VERDICT_STREAM_BATCH_SIZE", int, 100) # 한 번에 읽을 최대 평가 결과 수
+    # 새 평가 결과를 기다리는 최대 시간 (단위: 밀리초, 대기 중 Redis 커넥션을 점유하며 REDIS_SOCKET_TIMEOUT보다 짧아야 함)
+    VERDICT_STREAM_MAX_WAIT_MS = get_env_var("VERDICT_STREAM_MAX_WAIT_MS", int, 3000)
+    VERDICT_STREAM_SSE_TIMEOUT = get_env_var("VERDICT_STREAM_SSE_TIMEOUT", float, 300.0) # SSE 연결 최대 유지 시간 (단위: 초)
+
+    # 제출 코드 압축 저장 설정 (none | zlib | zstd, 기본값 none: base64 문자열 그대로 저장)
+    CODE_COMPRESSION = get_env_var("JOB_CODE_COMPRESSION", str, "none")
+    CODE_COMPRESSION_MIN_BYTES = get_env_var("JOB_CODE_COMPRESSION_MIN_BYTES", int, 4096) # 이 크기 미만의 코드는 압축하지 않음
+    CODE_COMPRESSION_LEVEL = get_env_var("JOB_CODE_COMPRESSION_LEVEL", int, None) # None: 알고리즘 기본 압축 레벨
+
+    # 동일한 코드(챌린지, 언어, 디코딩된 코드 기준)를 공유 blob으로 한 번만 저장할지 여부
+    CODE_DEDUP = get_env_var("JOB_CODE_DEDUP", str_to_bool, False)
+    # 동일한 코드의 채점 결과 캐시 TTL (단위: 초, 0: 캐시 미사용)
+    VERDICT_CACHE_TTL = get_env_var("JOB_VERDICT_CACHE_TTL", int, 0)
@@ -0,0 +1,11 @@
+from common import get_env_var, str_to_bool
+
+
+class MetricsConfig:
+    """
+    Description:
+        요청 처리 경로(hot path) 계측 관련 설정을 관리하는 클래스.
+        - ENABLED: 라우트별 처리 시간, 저장소 메서드별 처리 시간과 Redis 명령 수, HMAC/코드 검증 시간, send_task 시간 기록 여부
+          (false이면 계측 코드를 건너뜀, 커넥션 풀/태스크 등록 버퍼 등 백그라운드 메트릭은 항상 기록)
+    """
+    ENABLED = get_env_var("METRICS_ENABLED", str_to_bool, True)
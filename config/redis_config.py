@@ -1,4 +1,4 @@
-from common import get_env_var
+from common import get_env_var, str_to_bool
 
 
 class RedisConfig:
@@ -11,3 +11,20 @@ class RedisConfig:
     PASSWORD = get_env_var("REDIS_PASSWORD")
     DB = get_env_var("REDIS_DB", int)
     REDIS_URI = f'redis://:{PASSWORD}@{HOST}:{PORT}/{DB}'
+
+    # 커넥션 풀 설정 (프로세스 당 하나의 풀을 저장소와 Celery 클라이언트가 같은 크기로 사용)
+    MAX_CONNECTIONS = get_env_var("REDIS_MAX_CONNECTIONS", int, 50)
+    POOL_TIMEOUT = get_env_var("REDIS_POOL_TIMEOUT", float, 5.0) # 여유 커넥션 대기 최대 시간 (초)
+    SOCKET_TIMEOUT = get_env_var("REDIS_SOCKET_TIMEOUT", float, 5.0) # 명령 응답 대기 최대 시간 (초)
+    SOCKET_CONNECT_TIMEOUT = get_env_var("REDIS_SOCKET_CONNECT_TIMEOUT", float, 2.0) # 연결 수립 대기 최대 시간 (초)
+    HEALTH_CHECK_INTERVAL = get_env_var("REDIS_HEALTH_CHECK_INTERVAL", int, 30) # 유휴 커넥션 재사용 전 PING 확인 주기 (초)
+    SOCKET_KEEPALIVE = get_env_var("REDIS_SOCKET_KEEPALIVE", str_to_bool, True)
+
+    # 저장소 호출 재시도 정책 (일시적 장애만 재시도, 지터를 적용한 지수 백오프)
+    RETRY_MAX_ATTEMPTS = get_env_var("REDIS_RETRY_MAX_ATTEMPTS", int, 3)
+    RETRY_BASE_DELAY = get_env_var("REDIS_RETRY_BASE_DELAY", float, 0.05) # 첫 재시도 간격 상한 (초, 재시도마다 2배 증가)
+    RETRY_MAX_DELAY = get_env_var("REDIS_RETRY_MAX_DELAY", float, 0.5) # 재시도 간격 상한 (초)
+    RETRY_DEADLINE = get_env_var("REDIS_RETRY_DEADLINE", float, 1.0) # 요청 하나에서 재시도할 수 있는 시간 (초, 이후에는 재시도하지 않음)
+    # 일시적 장애가 연속 CIRCUIT_FAILURE_THRESHOLD번 발생하면 CIRCUIT_RESET_TIMEOUT(초) 동안 호출하지 않고 바로 실패 (503 응답)
+    CIRCUIT_FAILURE_THRESHOLD = get_env_var("REDIS_CIRCUIT_FAILURE_THRESHOLD", int, 5)
+    CIRCUIT_RESET_TIMEOUT = get_env_var("REDIS_CIRCUIT_RESET_TIMEOUT", float, 5.0)
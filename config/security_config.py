@@ -7,5 +7,16 @@ class SecurityConfig:
         Security 설정 정보를 관리하는 클래스.
     """
     API_SECRET_KEY = get_env_var("API_SECRET_KEY")
+    # 키 교체 기간 동안 함께 허용할 이전/신규 비밀 키 목록 (쉼표로 구분, API 키 발급에는 API_SECRET_KEY만 사용)
+    API_SECRET_KEYS = get_env_var(
+        "API_SECRET_KEYS", lambda value: tuple(key.strip() for key in value.split(",") if key.strip()), ()
+    )
+    # API 키 검증에 사용할 비밀 키 목록 (API_SECRET_KEY 우선, 중복 제거)
+    ACTIVE_SECRET_KEYS = tuple(dict.fromkeys((API_SECRET_KEY, *API_SECRET_KEYS)))
 
+    HMAC_KEY_CACHE_SIZE = get_env_var("HMAC_KEY_CACHE_SIZE", int, 1024) # 클라이언트별로 계산한 API 키 캐시 최대 개수
 
+    # /job/batch 관리자 모드(유저별 작업 수 제한 미적용)를 사용할 수 있는 클라이언트 식별자 목록 (쉼표로 구분)
+    ADMIN_CLIENT_IDS = get_env_var(
+        "ADMIN_CLIENT_IDS", lambda value: frozenset(client_id.strip() for client_id in value.split(",") if client_id.strip()), frozenset()
+    )
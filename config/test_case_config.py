@@ -1,29 +1,217 @@
+import hashlib
+import json
+import logging
 import os
+import signal
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
 
+from common import get_env_var
 from common.enums import CodeLanguage
 from common.fileutils import load_json_file
+from config.test_case_store import TestCaseStore, INDEX_FILE_NAME
+
+
+_JSON_DIR = os.path.join(os.path.dirname(__file__), "json")
+# 테스트 케이스 파일(저장소에 포함하지 않음)은 TEST_CASES_DATA_DIR로 다른 위치를 지정할 수 있음 (기본: config/json)
+_TEST_CASES_DATA_DIR = get_env_var("TEST_CASES_DATA_DIR", str, _JSON_DIR)
+_TEST_CASES_DIR = os.path.join(_TEST_CASES_DATA_DIR, "test_cases")
+_LEGACY_TEST_CASES_PATH = os.path.join(_TEST_CASES_DATA_DIR, "test_cases_inputs_and_expected.json")
+_LIMITS_PATH = os.path.join(_JSON_DIR, "exec_time_and_memory_limits.json")
+_LIMITS_BONUS_PATH = os.path.join(_JSON_DIR, "exec_time_and_memory_language_bonus.json")
+
+# 변경 여부를 확인할 설정 파일 목록 (테스트 케이스 인덱스가 있으면 이전 형식 파일 대신 인덱스를 사용)
+_WATCHED_PATHS = (os.path.join(_TEST_CASES_DIR, INDEX_FILE_NAME), _LEGACY_TEST_CASES_PATH, _LIMITS_PATH, _LIMITS_BONUS_PATH)
+
+
+def _file_signatures() -> tuple:
+    """설정 파일별 (수정 시각, 크기). 파일이 없으면 None"""
+    signatures = []
+    for path in _WATCHED_PATHS:
+        try:
+            stat = os.stat(path)
+            signatures.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signatures.append(None)
+    return tuple(signatures)
+
+
+class TestCaseConfigSnapshot:
+    """
+    Description:
+        테스트 케이스 인덱스와 시간/메모리 제한 설정을 한 시점에 읽어 만든 불변 스냅샷.
+        설정이 다시 로드되어도 기존 스냅샷은 변경되지 않으므로, 요청 처리 도중에는 처리 시작 시점의 스냅샷을 계속 사용할 수 있다.
+
+    Attributes:
+        version (str): 스냅샷을 만든 설정 파일 내용의 해시 (설정이 같으면 프로세스가 달라도 같은 값)
+    """
+
+    def __init__(self):
+        self._file_signatures = _file_signatures()
+
+        self._test_case_store = TestCaseStore(_TEST_CASES_DIR, legacy_file_path=_LEGACY_TEST_CASES_PATH)
+
+        limits = load_json_file(_LIMITS_PATH)
+        self._time_limits = limits.get("timeLimits")
+        self._memory_limits = limits.get("memoryLimits")
+
+        self._limits_bonus = load_json_file(_LIMITS_BONUS_PATH)
+        self._time_bonus = self._limits_bonus.get("timeBonus")
+        self._memory_bonus = self._limits_bonus.get("memoryBonus")
+
+        version_hash = hashlib.sha256()
+        for path in _WATCHED_PATHS:
+            if os.path.exists(path) and not (path == _LEGACY_TEST_CASES_PATH and self._test_case_store.is_split):
+                with open(path, "rb") as f:
+                    version_hash.update(f.read())
+        self.version = version_hash.hexdigest()[:12]
+
+        self._test_cases_versions: dict[str, str] = {}
+
+    @property
+    def file_signatures(self) -> tuple:
+        return self._file_signatures
+
+    def get_test_cases(self, challenge_id: int) -> list:
+        return self._test_case_store.load_test_cases(challenge_id)
+
+    def get_test_case_count(self, challenge_id: int) -> int:
+        """
+        챌린지의 테스트 케이스 수 (테스트 케이스 본문을 읽지 않고 인덱스로 조회, 챌린지가 없으면 0)
+        """
+        return self._test_case_store.get_count(challenge_id)
+
+    def get_test_cases_version(self, challenge_id: int) -> str:
+        """
+        챌린지의 테스트 케이스와 시간/메모리 제한으로 만든 해시. (테스트 케이스가 변경되면 값이 달라짐)
+        """
+        challenge_key = str(challenge_id)
+        version = self._test_cases_versions.get(challenge_key)
+        if version is None:
+            meta = self._test_case_store.get_meta(challenge_id)
+            version = self._test_cases_versions[challenge_key] = hashlib.sha256(json.dumps([
+                meta.sha256 if meta else None,
+                self._time_limits.get(challenge_key),
+                self._memory_limits.get(challenge_key),
+                self._limits_bonus
+            ], sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        return version
+
+    def get_memory_limit(self, challenge_id: int, code_language: CodeLanguage) -> int:
+        return self._memory_limits[str(challenge_id)] + self._memory_bonus[code_language.value]
+
+    def get_time_limit(self, challenge_id: int, code_language: CodeLanguage) -> float:
+        return self._time_limits[str(challenge_id)] + self._time_bonus[code_language.value]
 
 
 class TestCaseConfig:
-    _TEST_CASES = load_json_file(os.path.join(os.path.dirname(__file__), "json", "test_cases_inputs_and_expected.json"))
+    """
+    Description:
+        현재 테스트 케이스 설정 스냅샷을 관리하는 클래스.
+        설정 파일이 변경되면 새 스냅샷을 만든 뒤 참조만 교체하므로(원자적 교체), 재시작 없이 설정을 반영할 수 있다.
+        - 주기적 확인: RELOAD_INTERVAL(초)마다 설정 파일의 수정 시각, 크기 확인 (0이면 사용 안 함)
+        - 시그널: RELOAD_SIGNAL(ex. SIGHUP) 수신 시 다시 로드 (빈 문자열이면 사용 안 함)
+
+        요청 처리 중 같은 스냅샷을 사용해야 하는 경우 current()로 스냅샷을 한 번 가져와 사용한다.
+        작업 생성 이후 설정이 다시 로드되어도 작업에 기록된 버전으로 스냅샷을 찾을 수 있도록,
+        최근 스냅샷 RETAINED_SNAPSHOTS개를 버전별로 유지한다. (get_snapshot())
+    """
+    RELOAD_INTERVAL = get_env_var("TEST_CASE_CONFIG_RELOAD_INTERVAL", float, 0.0)
+    RELOAD_SIGNAL = get_env_var("TEST_CASE_CONFIG_RELOAD_SIGNAL", str, "SIGHUP")
+    RETAINED_SNAPSHOTS = max(1, get_env_var("TEST_CASE_CONFIG_RETAINED_SNAPSHOTS", int, 4))
+
+    _snapshot = TestCaseConfigSnapshot()
+    _snapshots: OrderedDict[str, TestCaseConfigSnapshot] = OrderedDict([(_snapshot.version, _snapshot)]) # 버전: 스냅샷 (오래된 순)
+    _reload_lock = threading.RLock() # 주기적 확인 스레드와 시그널 핸들러(메인 스레드)가 함께 호출할 수 있음
+    _reload_thread: Optional[threading.Thread] = None
+    _failed_file_signatures: Optional[tuple] = None # 마지막으로 로드에 실패한 설정 파일 상태 (같은 상태로 반복 시도하지 않음)
+
+    @staticmethod
+    def current() -> TestCaseConfigSnapshot:
+        return TestCaseConfig._snapshot
+
+    @staticmethod
+    def get_snapshot(version: Optional[str]) -> Optional[TestCaseConfigSnapshot]:
+        """
+        버전에 해당하는 스냅샷. 버전이 None이거나 더 이상 유지하지 않는 스냅샷이면 None
+        """
+        if version is None:
+            return None
+        return TestCaseConfig._snapshots.get(version)
+
+    @staticmethod
+    def reload(force: bool = False) -> bool:
+        """
+        설정 파일이 변경되었으면(force=True이면 항상) 새 스냅샷을 만들어 교체한다.
+        새 설정을 읽지 못하면 기존 스냅샷을 유지한다.
 
-    _TEST_CASES_LIMITS = load_json_file(os.path.join(os.path.dirname(__file__), "json", "exec_time_and_memory_limits.json"))
-    _TEST_CASES_TIME_LIMITS = _TEST_CASES_LIMITS.get("timeLimits")
-    _TEST_CASES_MEM_LIMITS = _TEST_CASES_LIMITS.get("memoryLimits")
+        Returns:
+            bool: 스냅샷 교체 여부
+        """
+        with TestCaseConfig._reload_lock:
+            file_signatures = _file_signatures()
+            if not force and file_signatures in (TestCaseConfig._snapshot.file_signatures, TestCaseConfig._failed_file_signatures):
+                return False
+            try:
+                snapshot = TestCaseConfigSnapshot()
+            except Exception:
+                TestCaseConfig._failed_file_signatures = file_signatures
+                logging.error("[Reloading test case config failed. Keeping the previous snapshot]", exc_info=True)
+                return False
 
-    _TEST_CASE_LIMITS_BONUS = load_json_file(os.path.join(os.path.dirname(__file__), "json", "exec_time_and_memory_language_bonus.json"))
-    _TEST_CASE_LIMITS_TIME_BONUS = _TEST_CASE_LIMITS_BONUS.get("timeBonus")
-    _TEST_CASE_LIMITS_MEMORY_BONUS = _TEST_CASE_LIMITS_BONUS.get("memoryBonus")
+            previous_version = TestCaseConfig._snapshot.version
+            # 유지 목록을 먼저 갱신하여, 현재 스냅샷의 버전은 항상 get_snapshot()으로 찾을 수 있도록 함
+            snapshots = OrderedDict(TestCaseConfig._snapshots)
+            snapshots.pop(snapshot.version, None)
+            snapshots[snapshot.version] = snapshot
+            while len(snapshots) > TestCaseConfig.RETAINED_SNAPSHOTS:
+                snapshots.popitem(last=False)
+            TestCaseConfig._snapshots = snapshots
+            TestCaseConfig._snapshot = snapshot
+            logging.info(f"[Test case config reloaded: {previous_version} -> {snapshot.version}]")
+            return True
+
+    @staticmethod
+    def start_auto_reload():
+        """
+        설정 파일 주기적 확인 스레드와 다시 로드 시그널 핸들러를 등록한다. (프로세스(워커)당 한 번 호출)
+        """
+        if TestCaseConfig.RELOAD_INTERVAL > 0 and TestCaseConfig._reload_thread is None:
+            def _poll():
+                while True:
+                    time.sleep(TestCaseConfig.RELOAD_INTERVAL)
+                    TestCaseConfig.reload()
+
+            TestCaseConfig._reload_thread = threading.Thread(target=_poll, name="test-case-config-reload", daemon=True)
+            TestCaseConfig._reload_thread.start()
+
+        if TestCaseConfig.RELOAD_SIGNAL:
+            try:
+                signal.signal(
+                    getattr(signal, TestCaseConfig.RELOAD_SIGNAL), lambda signum, frame: TestCaseConfig.reload(force=True)
+                )
+            except (ValueError, AttributeError):
+                # 시그널 핸들러는 메인 스레드에서만 등록 가능, 플랫폼에 없는 시그널은 등록 불가
+                logging.warning(f"[Test case config reload signal handler ({TestCaseConfig.RELOAD_SIGNAL}) not registered]")
 
     @staticmethod
     def get_test_cases(challenge_id: int) -> list:
-        return TestCaseConfig._TEST_CASES[str(challenge_id)]
+        return TestCaseConfig._snapshot.get_test_cases(challenge_id)
+
+    @staticmethod
+    def get_test_case_count(challenge_id: int) -> int:
+        return TestCaseConfig._snapshot.get_test_case_count(challenge_id)
+
+    @staticmethod
+    def get_test_cases_version(challenge_id: int) -> str:
+        return TestCaseConfig._snapshot.get_test_cases_version(challenge_id)
 
     @staticmethod
     def get_memory_limit(challenge_id: int, code_language: CodeLanguage) -> int:
-        return TestCaseConfig._TEST_CASES_MEM_LIMITS[str(challenge_id)] + TestCaseConfig._TEST_CASE_LIMITS_MEMORY_BONUS[code_language.value]
+        return TestCaseConfig._snapshot.get_memory_limit(challenge_id, code_language)
 
     @staticmethod
     def get_time_limit(challenge_id: int, code_language: CodeLanguage) -> float:
-        return TestCaseConfig._TEST_CASES_TIME_LIMITS[str(challenge_id)] + TestCaseConfig._TEST_CASE_LIMITS_TIME_BONUS[code_language.value]
-
+        return TestCaseConfig._snapshot.get_time_limit(challenge_id, code_language)
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from common.fileutils import load_json_file
+
+
+# 테스트 케이스 저장 형식 (config/json/test_cases/)
+# - index.json: {challengeId: {"count": 테스트 케이스 수, "bytes": 테스트 케이스 파일 크기, "sha256": 테스트 케이스 파일 해시}}
+# - {challengeId}.json: 챌린지의 테스트 케이스 목록 (입력, 기대 출력)
+# 분할 형식이 없으면 이전 형식(test_cases_inputs_and_expected.json, 전체 챌린지의 테스트 케이스를 하나의 파일로 저장)에서
+# 인덱스를 만들고 테스트 케이스 본문은 메모리에 유지하지 않는다.
+INDEX_FILE_NAME = "index.json"
+
+
+@dataclass(frozen=True)
+class ChallengeTestCaseMeta:
+    """
+    Description:
+        챌린지별 테스트 케이스 메타데이터 (API는 테스트 케이스 본문 없이 이 정보만 사용)
+
+    Attributes:
+        count (int): 테스트 케이스 수
+        total_bytes (int): 테스트 케이스 본문(JSON) 크기
+        sha256 (str): 테스트 케이스 본문(JSON) 해시 (테스트 케이스가 변경되면 값이 달라짐)
+    """
+    __slots__ = ("count", "total_bytes", "sha256")
+    count: int
+    total_bytes: int
+    sha256: str
+
+
+def _encode_test_cases(test_cases: list) -> bytes:
+    return json.dumps(test_cases, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _create_meta(encoded_test_cases: bytes, count: int) -> ChallengeTestCaseMeta:
+    return ChallengeTestCaseMeta(
+        count=count,
+        total_bytes=len(encoded_test_cases),
+        sha256=hashlib.sha256(encoded_test_cases).hexdigest()
+    )
+
+
+class TestCaseStore:
+    """
+    Description:
+        챌린지별 테스트 케이스 메타데이터 인덱스를 메모리에 유지하고, 테스트 케이스 본문은 필요할 때 챌린지별 파일에서 읽는 저장소.
+        모든 챌린지의 테스트 케이스를 프로세스(워커)마다 메모리에 올리지 않기 위해 사용한다.
+    """
+
+    def __init__(self, test_cases_dir: str, legacy_file_path: Optional[str] = None):
+        self._test_cases_dir = test_cases_dir
+        self._legacy_file_path = legacy_file_path
+
+        index_path = os.path.join(test_cases_dir, INDEX_FILE_NAME)
+        if os.path.exists(index_path):
+            self._index = {
+                challenge_id: ChallengeTestCaseMeta(meta["count"], meta["bytes"], meta["sha256"])
+                for challenge_id, meta in load_json_file(index_path).items()
+            }
+            self._split = True
+        elif legacy_file_path and os.path.exists(legacy_file_path):
+            self._index = {
+                challenge_id: _create_meta(_encode_test_cases(test_cases), len(test_cases))
+                for challenge_id, test_cases in load_json_file(legacy_file_path).items()
+            }
+            self._split = False
+        else:
+            raise FileNotFoundError(f"Test case index not found: {index_path}")
+
+    @property
+    def is_split(self) -> bool:
+        """챌린지별 파일과 인덱스로 분할된 형식이면 True, 이전 형식(단일 파일)이면 False"""
+        return self._split
+
+    def get_meta(self, challenge_id: int) -> Optional[ChallengeTestCaseMeta]:
+        return self._index.get(str(challenge_id))
+
+    def get_count(self, challenge_id: int) -> int:
+        meta = self.get_meta(challenge_id)
+        return meta.count if meta else 0
+
+    def load_test_cases(self, challenge_id: int) -> list:
+        """
+        챌린지의 테스트 케이스 본문을 디스크에서 읽는다. (캐시하지 않음)
+        """
+        challenge_key = str(challenge_id)
+        if challenge_key not in self._index:
+            raise KeyError(challenge_key)
+
+        if self._split:
+            return load_json_file(os.path.join(self._test_cases_dir, f"{challenge_key}.json"))
+        # 이전 형식은 챌린지별로 읽을 수 없으므로 전체 파일을 읽은 뒤 해당 챌린지만 반환
+        return load_json_file(self._legacy_file_path)[challenge_key]
+
+
+def build_test_case_store(legacy_file_path: str, test_cases_dir: str) -> int:
+    """
+    이전 형식의 테스트 케이스 파일을 챌린지별 파일과 메타데이터 인덱스로 분할한다.
+
+    Returns:
+        int: 분할한 챌린지 수
+    """
+    os.makedirs(test_cases_dir, exist_ok=True)
+    index = {}
+    for challenge_id, test_cases in load_json_file(legacy_file_path).items():
+        encoded_test_cases = _encode_test_cases(test_cases)
+        with open(os.path.join(test_cases_dir, f"{challenge_id}.json"), "wb") as f:
+            f.write(encoded_test_cases)
+        meta = _create_meta(encoded_test_cases, len(test_cases))
+        index[challenge_id] = {"count": meta.count, "bytes": meta.total_bytes, "sha256": meta.sha256}
+
+    # 인덱스 파일을 마지막에 교체하여, 분할 도중에 시작된 프로세스가 일부만 분할된 인덱스를 읽지 않도록 함
+    index_path = os.path.join(test_cases_dir, INDEX_FILE_NAME)
+    with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+    os.replace(index_path + ".tmp", index_path)
+    return len(index)
+
+
+# 사용법: python -m config.test_case_store build [이전 형식 파일 경로] [출력 디렉터리]
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "build":
+        json_dir = os.path.join(os.path.dirname(__file__), "json")
+        source = sys.argv[2] if len(sys.argv) > 2 else os.path.join(json_dir, "test_cases_inputs_and_expected.json")
+        target = sys.argv[3] if len(sys.argv) > 3 else os.path.join(json_dir, "test_cases")
+        print(f"{build_test_case_store(source, target)} challenges -> {target}")
+    else:
+        print("usage: python -m config.test_case_store build [legacy_file_path] [test_cases_dir]")
@@ -0,0 +1,15 @@
+from common import get_env_var
+
+
+class TracingConfig:
+    """
+    Description:
+        요청 트레이싱(API -> Redis -> Celery 워커) 관련 설정을 관리하는 클래스.
+        - EXPORTER: 종료된 스팬을 내보낼 위치 (none: 트레이싱 미사용 | memory: 메모리 보관, /test/traces로 조회 | file: FILE_PATH에 JSON Lines로 기록)
+        - SAMPLE_RATIO: 기록할 트레이스 비율 (0.0 ~ 1.0, 요청 헤더로 전달받은 트레이스는 전달받은 결정을 따름)
+    """
+    EXPORTER = get_env_var("TRACING_EXPORTER", str, "none")
+    FILE_PATH = get_env_var("TRACING_FILE_PATH", str, "traces.jsonl")
+    SERVICE_NAME = get_env_var("TRACING_SERVICE_NAME", str, "devolt-judge-api")
+    SAMPLE_RATIO = get_env_var("TRACING_SAMPLE_RATIO", float, 1.0)
+    MEMORY_MAX_SPANS = get_env_var("TRACING_MEMORY_MAX_SPANS", int, 10000) # memory exporter가 보관할 최대 스팬 수
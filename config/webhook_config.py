@@ -0,0 +1,31 @@
+from common import get_env_var
+
+
+class WebhookConfig:
+    """
+    Description:
+        채점 결과 콜백(워커/API 서버 -> Spring Boot 백엔드) 전송 관련 설정을 관리하는 클래스.
+        - 테스트 케이스 별 평가 결과는 BATCH_WINDOW_SECONDS 동안 모아 한 번에 전송 (채점 완료, 에러 이벤트는 모으지 않고 바로 전송)
+        - 전송에 실패한 콜백은 Redis 아웃박스에 저장한 뒤, 지터를 적용한 지수 백오프 간격으로 MAX_ATTEMPTS번까지 다시 전송
+    """
+    BASE_URL = get_env_var("WEBHOOK_BASE_URL", str, "http://localhost:5000/test")
+    # 이벤트 종류별 콜백 경로 (BASE_URL 기준)
+    TEST_CASE_RESULTS_PATH = get_env_var("WEBHOOK_TEST_CASE_RESULTS_PATH", str, "/test-case-results")
+    JUDGMENT_PASSED_PATH = get_env_var("WEBHOOK_JUDGMENT_PASSED_PATH", str, "/judgment-passed")
+    JUDGMENT_UNPASSED_PATH = get_env_var("WEBHOOK_JUDGMENT_UNPASSED_PATH", str, "/judgment-unpassed")
+    ERROR_PATH = get_env_var("WEBHOOK_ERROR_PATH", str, "/error")
+
+    BATCH_WINDOW_SECONDS = get_env_var("WEBHOOK_BATCH_WINDOW_SECONDS", float, 0.05) # 첫 결과 이후 묶음을 채우기 위해 기다리는 최대 시간
+    MAX_BATCH_SIZE = get_env_var("WEBHOOK_MAX_BATCH_SIZE", int, 100) # 한 번에 전송할 최대 평가 결과 수
+    BUFFER_SIZE = get_env_var("WEBHOOK_BUFFER_SIZE", int, 10000) # 전송 대기 버퍼 크기 (가득 차면 아웃박스에 바로 저장)
+
+    CONNECT_TIMEOUT = get_env_var("WEBHOOK_CONNECT_TIMEOUT", float, 2.0) # 단위: 초
+    READ_TIMEOUT = get_env_var("WEBHOOK_READ_TIMEOUT", float, 5.0) # 단위: 초
+    POOL_MAXSIZE = get_env_var("WEBHOOK_POOL_MAXSIZE", int, 10) # 호스트별로 유지할 keep-alive 커넥션 수
+
+    MAX_ATTEMPTS = get_env_var("WEBHOOK_MAX_ATTEMPTS", int, 8) # 초과 시 dead letter 목록으로 이동
+    RETRY_BASE_SECONDS = get_env_var("WEBHOOK_RETRY_BASE_SECONDS", float, 0.5)
+    RETRY_MAX_SECONDS = get_env_var("WEBHOOK_RETRY_MAX_SECONDS", float, 60.0)
+    RETRY_POLL_INTERVAL = get_env_var("WEBHOOK_RETRY_POLL_INTERVAL", float, 1.0) # 아웃박스에서 재전송할 콜백을 확인하는 간격 (단위: 초)
+    OUTBOX_KEY_PREFIX = get_env_var("WEBHOOK_OUTBOX_KEY_PREFIX", str, "callback-outbox")
+    MAX_DEAD_LETTERS = get_env_var("WEBHOOK_MAX_DEAD_LETTERS", int, 10000) # 보관할 최대 dead letter 수
@@ -1,2 +1,4 @@
-from .exception import RedisConnectionError
+from .exception import RedisConnectionError, RedisUnavailableError
 from .connection import RedisConnection
+from .async_connection import AsyncRedisConnection
+from .retry import RetryPolicy, CircuitBreaker, start_retry_deadline, clear_retry_deadline
@@ -0,0 +1,66 @@
+import redis.asyncio
+
+from .exception import RedisConnectionError
+from .pool import InstrumentedAsyncBlockingConnectionPool
+
+
+class AsyncRedisConnection:
+    """
+    Description:
+        비동기(asyncio) Redis Client 객체를 제공하는 클래스.
+        RedisConnection과 동일하게 외부에서 Redis 연결에 필요한 설정(host, port, password, db)과
+        커넥션 풀 설정을 주입받아 인스턴스를 생성.
+
+        이벤트 루프가 실행되기 전에도 인스턴스를 생성할 수 있도록, 클라이언트 생성 시에는 연결하지 않고
+        ping()을 통해 애플리케이션 시작 시점(ex. Quart before_serving)에 연결을 확인한다.
+    """
+
+    def __init__(self, host, port, password, db,
+        pool_name: str = "default-async",
+        max_connections: int = 50,
+        pool_timeout: float = 5.0,
+        socket_timeout: float = None,
+        socket_connect_timeout: float = None,
+        health_check_interval: int = 0,
+        socket_keepalive: bool = False
+    ):
+        self._pool = InstrumentedAsyncBlockingConnectionPool(
+            pool_name=pool_name,
+            host=host,
+            port=port,
+            password=password,
+            db=db,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+            health_check_interval=health_check_interval,
+            socket_keepalive=socket_keepalive
+        )
+        self._client = redis.asyncio.StrictRedis(connection_pool=self._pool)
+
+    async def ping(self):
+        """
+        Description:
+            연결 테스트
+        """
+        try:
+            await self._client.ping()
+        except redis.exceptions.AuthenticationError as e:
+            raise RedisConnectionError(f"Redis authentication failed: {e}")
+        except redis.exceptions.RedisError as e:
+            raise RedisConnectionError(f"Failed to connect to Redis: {e}")
+        except Exception as e:
+            raise RedisConnectionError(f"Unexpected error during Redis initialization: {e}")
+
+    async def close(self):
+        await self._client.aclose()
+        await self._pool.disconnect()
+
+    @property
+    def pool(self) -> InstrumentedAsyncBlockingConnectionPool:
+        return self._pool
+
+    @property
+    def client(self) -> redis.asyncio.StrictRedis:
+        return self._client
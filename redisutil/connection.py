@@ -1,20 +1,46 @@
 import redis
 
 from .exception import RedisConnectionError
+from .pool import InstrumentedBlockingConnectionPool
 
 
 class RedisConnection:
     """
     Description:
         Redis 설정 Client 객체를 제공하는 클래스.
-        DI(의존성 주입) 방식으로, 외부에서 Redis 연결에 필요한 설정(host, port, password, db)을 주입받아 인스턴스를 생성.
+        DI(의존성 주입) 방식으로, 외부에서 Redis 연결에 필요한 설정(host, port, password, db)과
+        커넥션 풀 설정을 주입받아 인스턴스를 생성.
+
+        클라이언트는 크기가 제한된 하나의 커넥션 풀(InstrumentedBlockingConnectionPool)을 사용하며,
+        유휴 커넥션은 health_check_interval 주기로 PING 확인 후 재사용하고 끊어진 커넥션은 다음 명령 실행 시 재연결한다.
     """
 
-    def __init__(self, host, port, password, db):
+    def __init__(self, host, port, password, db,
+        pool_name: str = "default",
+        max_connections: int = 50,
+        pool_timeout: float = 5.0,
+        socket_timeout: float = None,
+        socket_connect_timeout: float = None,
+        health_check_interval: int = 0,
+        socket_keepalive: bool = False
+    ):
         self._host = host
         self._port = port
         self._password = password
         self._db = db
+        self._pool = InstrumentedBlockingConnectionPool(
+            pool_name=pool_name,
+            host=host,
+            port=port,
+            password=password,
+            db=db,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout,
+            health_check_interval=health_check_interval,
+            socket_keepalive=socket_keepalive
+        )
         self._client = None
         self._connect()
 
@@ -24,12 +50,7 @@ class RedisConnection:
             job.StrictRedis 객체 생성 및 client 필드 초기화 & ping 테스트
         """
         try:
-            client = redis.StrictRedis(
-                host=self._host,
-                port=self._port,
-                password=self._password,
-                db=self._db
-            )
+            client = redis.StrictRedis(connection_pool=self._pool)
             # 연결 테스트
             client.ping()
             self._client = client
@@ -59,6 +80,10 @@ class RedisConnection:
         print("\033[92m" + "│" + msg + "│" + "\033[0m")
         print("\033[92m" + "└" + border + "┘" + "\033[0m\n")
 
+    @property
+    def pool(self) -> InstrumentedBlockingConnectionPool:
+        return self._pool
+
     @property
     def client(self) -> redis.StrictRedis:
         """
@@ -4,3 +4,11 @@ class RedisConnectionError(Exception):
         Redis 연결 실패에 대한 사용자 정의 예외.
     """
     pass
+
+
+class RedisUnavailableError(Exception):
+    """
+    Description:
+        Redis 일시적 장애로 호출이 실패한 경우의 예외. (재시도 예산 소진 또는 서킷 브레이커 열림, 잠시 후 다시 요청해야 함)
+    """
+    pass
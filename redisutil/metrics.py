@@ -0,0 +1,28 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# 저장소 호출 재시도, 서킷 브레이커 메트릭 (policy 레이블: 재시도 정책 이름)
+REDIS_RETRY_TOTAL = Counter(
+    "redis_retry_total", "Number of Redis call failures by retry decision", ["policy", "decision"]
+)
+REDIS_CIRCUIT_STATE = Gauge(
+    "redis_circuit_state", "Redis circuit breaker state (0: closed, 1: half-open, 2: open)", ["policy"]
+)
+
+# 작업 저장소 계측 메트릭 (repository 레이블: job | async_job, MetricsConfig.ENABLED가 false이면 기록하지 않음)
+REDIS_REPOSITORY_CALL_SECONDS = Histogram(
+    "redis_repository_call_seconds", "Time spent in a job repository method, including retries", ["repository", "method"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+REDIS_COMMAND_TOTAL = Counter(
+    "redis_command_total", "Number of Redis calls issued by job repositories (evalsha: Lua script, execute_pipeline: one pipeline)",
+    ["repository", "command"]
+)
+REDIS_PIPELINE_COMMANDS = Histogram(
+    "redis_pipeline_commands", "Number of commands sent in one job repository pipeline", ["repository"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+)
+REDIS_USER_INDEX_ENTRIES_SCANNED = Histogram(
+    "redis_user_index_entries_scanned", "Number of job ids read from a user's job index by find_by_user_id", ["repository"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100)
+)
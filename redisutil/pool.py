@@ -0,0 +1,79 @@
+import threading
+import time
+
+import redis
+import redis.asyncio
+from prometheus_client import Gauge, Histogram
+
+
+# 커넥션 풀 사용률 및 대기 시간 메트릭 (pool 레이블: 풀을 사용하는 클라이언트 이름)
+REDIS_POOL_MAX_CONNECTIONS = Gauge(
+    "redis_pool_max_connections", "Maximum number of connections of the Redis connection pool", ["pool"]
+)
+REDIS_POOL_CONNECTIONS_IN_USE = Gauge(
+    "redis_pool_connections_in_use", "Number of Redis connections currently checked out of the pool", ["pool"]
+)
+REDIS_POOL_WAIT_SECONDS = Histogram(
+    "redis_pool_wait_seconds", "Time spent waiting for a free Redis connection from the pool", ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0)
+)
+
+
+class InstrumentedBlockingConnectionPool(redis.BlockingConnectionPool):
+    """
+    Description:
+        커넥션을 max_connections개로 제한하고, 여유 커넥션이 없으면 timeout(초)까지 대기하는 커넥션 풀.
+        커넥션 대기 시간과 사용 중인 커넥션 수를 메트릭으로 기록한다.
+    """
+
+    def __init__(self, pool_name: str, **kwargs):
+        super().__init__(**kwargs)
+        self._pool_name = pool_name
+        self._in_use_count = 0
+        self._in_use_lock = threading.Lock()
+        REDIS_POOL_MAX_CONNECTIONS.labels(pool=pool_name).set(self.max_connections)
+        REDIS_POOL_CONNECTIONS_IN_USE.labels(pool=pool_name).set_function(lambda: self._in_use_count)
+
+    def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            connection = super().get_connection(*args, **kwargs)
+        finally:
+            # 여유 커넥션이 없어 timeout으로 실패한 경우의 대기 시간도 기록
+            REDIS_POOL_WAIT_SECONDS.labels(pool=self._pool_name).observe(time.perf_counter() - start)
+        with self._in_use_lock:
+            self._in_use_count += 1
+        return connection
+
+    def release(self, connection):
+        super().release(connection)
+        with self._in_use_lock:
+            self._in_use_count -= 1
+
+
+class InstrumentedAsyncBlockingConnectionPool(redis.asyncio.BlockingConnectionPool):
+    """
+    Description:
+        InstrumentedBlockingConnectionPool의 redis.asyncio 버전.
+        (단일 이벤트 루프에서만 접근하므로 사용 중인 커넥션 수 갱신에 별도 잠금을 사용하지 않음)
+    """
+
+    def __init__(self, pool_name: str, **kwargs):
+        super().__init__(**kwargs)
+        self._pool_name = pool_name
+        self._in_use_count = 0
+        REDIS_POOL_MAX_CONNECTIONS.labels(pool=pool_name).set(self.max_connections)
+        REDIS_POOL_CONNECTIONS_IN_USE.labels(pool=pool_name).set_function(lambda: self._in_use_count)
+
+    async def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        finally:
+            REDIS_POOL_WAIT_SECONDS.labels(pool=self._pool_name).observe(time.perf_counter() - start)
+        self._in_use_count += 1
+        return connection
+
+    async def release(self, connection):
+        await super().release(connection)
+        self._in_use_count -= 1
@@ -1 +1,3 @@
-from .code_challenge_judgment_job_repository import job_repository
\ No newline at end of file
+from .code_challenge_judgment_job_repository import job_repository
+from .async_code_challenge_judgment_job_repository import async_job_repository, async_redis_connection
+from .job_cancel_listener import JobCancelListener
@@ -0,0 +1,364 @@
+from typing import Awaitable, Callable, Optional, Union
+
+from redis.asyncio.client import Pipeline
+
+from redisutil import AsyncRedisConnection, RetryPolicy, CircuitBreaker
+from common import Codec, CodeCompressor, JsonCodec, StorageCodec, get_codec
+from redisutil.repository.job_repository_base import JobRepositoryBase, instrument_repository, _MAX_LINKED_KEYS_ATTEMPTS
+from schema import Verdict, VerdictStreamBatch
+from schema.job import CodeChallengeJudgmentJob as Job
+
+
+@instrument_repository("async_job")
+class AsyncCodeChallengeJudgmentJobRepository(JobRepositoryBase):
+    """
+    CodeChallengeJudgmentJobRepository와 동일한 인터페이스를 redis.asyncio 기반 코루틴으로 제공하는 클래스.
+    저장 형식(키 구성, Lua 스크립트)은 JobRepositoryBase를 통해 동기 저장소와 공유한다.
+    """
+
+    def __init__(self,
+        redis_conn: AsyncRedisConnection,
+        storage_codec: Codec = None,
+        code_compressor: CodeCompressor = None,
+        code_dedup: bool = False,
+        verdict_cache_ttl: int = 0,
+        retry_policy: RetryPolicy = None
+    ):
+        self._redis_client = redis_conn.client
+        self._storage_codec = StorageCodec(storage_codec or JsonCodec())
+        self._code_compressor = code_compressor or CodeCompressor()
+        self._code_dedup = code_dedup
+        self._verdict_cache_ttl = verdict_cache_ttl
+        # 재시도 정책을 주입하지 않으면 재시도하지 않음
+        self._retry_policy = retry_policy or RetryPolicy("async-job-repository", max_attempts=1, base_delay=0, max_delay=0, deadline_seconds=0)
+        self._register_scripts(self._redis_client)
+
+
+    async def find_by_user_id(self, user_id: int) -> list[Job]:
+        index_key = self._user_index_key(user_id)
+        job_ids: list[Union[str, bytes]] = await self._with_retry(
+            self._find_user_job_ids_script, keys=[index_key]
+        )
+
+        job_ids = [self._decode(job_id) for job_id in job_ids]
+        self._observe_user_index_scan(len(job_ids))
+        found_jobs = await self.find_many([(user_id, job_id) for job_id in job_ids])
+
+        jobs: list[Job] = []
+        stale_job_ids: list[str] = []
+        for job_id, job in zip(job_ids, found_jobs):
+            if isinstance(job, Exception):
+                raise job
+            if job:
+                jobs.append(job)
+            else:
+                stale_job_ids.append(job_id)
+
+        # 인덱스에는 남아있지만 작업 키가 사라진 항목은 조회 시점에 정리 (lazy cleanup)
+        if stale_job_ids:
+            await self._with_retry(
+                self._redis_client.zrem, index_key, *stale_job_ids
+            )
+        return jobs
+
+
+    async def count_by_user_id(self, user_id: int) -> int:
+        return await self._with_retry(
+            self._count_user_jobs_script, keys=[self._user_index_key(user_id)]
+        )
+
+
+    async def count_by_user_ids(self, user_ids: list[int]) -> list[int]:
+        """
+        여러 유저가 현재 보유한 작업 개수를 하나의 파이프라인으로 조회한다. (반환 리스트는 입력 순서를 따름)
+        """
+        async def _count_jobs(pipeline: Pipeline):
+            for user_id in user_ids:
+                await self._count_user_jobs_script(keys=[self._user_index_key(user_id)], client=pipeline)
+
+        counts = await self._execute_batch(_count_jobs)
+        for count in counts:
+            if isinstance(count, Exception):
+                raise count
+        return counts
+
+
+    async def find_user_id_by_job_id(self, job_id: str) -> int:
+        user_id_data: Union[str, bytes, None] = await self._with_retry(
+            self._redis_client.get, self._job_owner_key(job_id)
+        )
+
+        if not user_id_data:
+            return -1
+
+        return int(user_id_data)
+
+
+    async def find_user_ids_by_job_ids(self, job_ids: list[str]) -> list[int]:
+        if not job_ids:
+            return []
+
+        user_id_data_list: list[Union[str, bytes, None]] = await self._with_retry(
+            self._redis_client.mget, [self._job_owner_key(job_id) for job_id in job_ids]
+        )
+        return [int(user_id_data) if user_id_data else -1 for user_id_data in user_id_data_list]
+
+
+    async def find_by_job_id(self, job_id: str) -> Optional[Job]:
+        user_id: int = await self.find_user_id_by_job_id(job_id)
+        if user_id == -1:
+            return None
+
+        return await self.find_by_user_id_and_job_id(user_id, job_id)
+
+
+    async def find_by_user_id_and_job_id(self,
+        user_id: int,
+        job_id: str,
+        include_code: bool = True,
+        include_verdicts: bool = True
+    ) -> Optional[Job]:
+        keys, args = self._find_job_script_params(user_id, job_id, include_code, include_verdicts)
+        job_data: Optional[list] = await self._run_script(self._find_job_script, keys, args)
+        if not job_data:
+            return None
+
+        return self._create_job_from_stored_data(job_data)
+
+
+    async def find_many(self,
+        user_job_ids: list[tuple[int, str]],
+        include_code: bool = True,
+        include_verdicts: bool = True
+    ) -> list[Union[Job, None, Exception]]:
+        script_params = [
+            self._find_job_script_params(user_id, job_id, include_code, include_verdicts) for user_id, job_id in user_job_ids
+        ]
+        return self._create_jobs_from_batch_results(await self._run_script_batch(self._find_job_script, script_params))
+
+
+    async def exists_by_user_id_and_job_id(self, user_id: int, job_id: str) -> bool:
+        return await self._with_retry(
+            self._redis_client.exists, self._job_key(user_id, job_id)
+        ) == 1
+
+
+    async def find_stop_flag(self, job_id: str, user_id: int = None) -> Optional[bool]:
+        if user_id is None:
+            user_id = await self.find_user_id_by_job_id(job_id)
+            if user_id == -1:
+                return None
+
+        job = await self.find_by_user_id_and_job_id(user_id, job_id, include_code=False, include_verdicts=False)
+        return job.stop_flag if job else None
+
+
+    async def is_cancelled(self, job_id: str) -> bool:
+        return bool(await self._with_retry(self._redis_client.exists, self._job_cancel_key(job_id)))
+
+
+    async def find_cached_verdicts(self, job: Job) -> Optional[list[Verdict]]:
+        """
+        같은 챌린지, 언어, 코드로 채점이 완료된 결과가 캐시되어 있으면 테스트 케이스별 평가 결과를 반환한다.
+        채점 결과 캐시를 사용하지 않거나 캐시된 결과가 없으면 None을 반환한다.
+        """
+        cache_key = self._verdict_cache_lookup_key(job)
+        if cache_key is None:
+            return None
+
+        cached_verdicts: list = await self._with_retry(
+            self._redis_client.lrange, cache_key, 0, -1
+        )
+        return self._create_cached_verdicts(cached_verdicts)
+
+
+    async def save(self,
+        user_id: int,
+        job: Job,
+        ttl: int,
+        max_user_jobs: int = 0
+    ) -> int:
+        """
+        max_user_jobs > 0이면 유저의 작업 수가 max_user_jobs 이상일 때 저장하지 않고 -2를 반환한다. (개수 확인과 저장은 원자적으로 처리)
+        """
+        keys, args = self._save_job_script_params(user_id, job, ttl, max_user_jobs)
+        return self._record_save_result(await self._run_script(self._save_job_script, keys, args), args)
+
+
+    async def save_many(self,
+        user_jobs: list[tuple[int, Job, int]],
+        max_user_jobs: int = 0
+    ) -> list[Union[int, Exception]]:
+        # 재시도 시에도 작업을 다시 인코딩하지 않도록 스크립트 인자를 미리 구성
+        script_params = [
+            self._save_job_script_params(user_id, job, ttl, max_user_jobs) for user_id, job, ttl in user_jobs
+        ]
+        return [
+            self._record_save_result(result, args)
+            for result, (_, args) in zip(await self._run_script_batch(self._save_job_script, script_params), script_params)
+        ]
+
+
+    async def delete_many(self, user_job_ids: list[tuple[int, str]]) -> list[Union[int, Exception]]:
+        script_params = [self._delete_job_script_params(user_id, job_id) for user_id, job_id in user_job_ids]
+        return await self._run_script_batch(self._delete_job_script, script_params)
+
+
+    async def delete(self,
+        job_id: str,
+        user_id: int = None
+    ) -> int:
+        if user_id is None:
+            user_id = await self.find_user_id_by_job_id(job_id)
+            if user_id == -1:
+                return -1
+
+        # 삭제된 데이터(작업) 수 반환
+        keys, args = self._delete_job_script_params(user_id, job_id)
+        return await self._run_script(self._delete_job_script, keys, args)
+
+
+    async def update(self,
+        job_id: str,
+        user_id: int = None,
+        stop_flag: bool = None,
+        verdicts: list[Verdict] = None
+    ) -> int:
+        if user_id is None:
+            user_id: int = await self.find_user_id_by_job_id(job_id)
+            if user_id == -1:
+                return -1
+
+        return await self._update_fields(job_id, user_id, stop_flag, "" if verdicts is None else "set", verdicts or [])
+
+
+    async def read_verdict_stream(self,
+        user_id: int,
+        job_id: str,
+        cursor: str = "0",
+        count: int = 100,
+        block_ms: int = 0
+    ) -> VerdictStreamBatch:
+        stream_key = self._job_verdict_stream_key(user_id, job_id)
+        result = await self._with_retry(
+            self._redis_client.xread, {stream_key: cursor}, count=count, block=block_ms or None
+        )
+        return self._create_verdict_stream_batch(cursor, result)
+
+
+    async def append_verdicts(self,
+        job_id: str,
+        verdicts: list[Verdict],
+        user_id: int = None
+    ) -> int:
+        if user_id is None:
+            user_id: int = await self.find_user_id_by_job_id(job_id)
+            if user_id == -1:
+                return -1
+
+        return await self._update_fields(job_id, user_id, None, "append", verdicts)
+
+
+    async def _update_fields(self,
+        job_id: str,
+        user_id: int,
+        stop_flag: Optional[bool],
+        verdicts_mode: str,
+        verdicts: list[Verdict]
+    ) -> int:
+        keys, args = self._update_job_script_params(job_id, user_id, stop_flag, verdicts_mode, verdicts)
+        return await self._run_script(self._update_job_script, keys, args)
+
+
+    async def _run_script(self, script, keys: list, args: list) -> any:
+        params = (keys, args)
+        for _ in range(_MAX_LINKED_KEYS_ATTEMPTS):
+            result = await self._with_retry(script, keys=params[0], args=params[1])
+            linked_params = self._linked_script_params(params, result)
+            if linked_params is None:
+                return result
+            params = linked_params
+        raise self._linked_keys_changed_error()
+
+
+    async def _run_script_batch(self, script, script_params: list[tuple[list, list]]) -> list:
+        results: list = [None] * len(script_params)
+        pending = list(enumerate(script_params))
+        for _ in range(_MAX_LINKED_KEYS_ATTEMPTS):
+            async def _run_scripts(pipeline: Pipeline, batch=pending):
+                for _, (keys, args) in batch:
+                    await script(keys=keys, args=args, client=pipeline)
+
+            retry_pending = []
+            for (index, params), result in zip(pending, await self._execute_batch(_run_scripts)):
+                linked_params = self._linked_script_params(params, result)
+                if linked_params is None:
+                    results[index] = result
+                else:
+                    retry_pending.append((index, linked_params))
+            pending = retry_pending
+            if not pending:
+                return results
+
+        for index, _ in pending:
+            results[index] = self._linked_keys_changed_error()
+        return results
+
+
+    async def _execute_batch(self, add_commands: Callable[[Pipeline], Awaitable[None]]) -> list:
+        async def execute_pipeline():
+            # 파이프라인은 execute 후 명령이 초기화되므로, 재시도 시마다 새로 구성
+            pipeline = self._redis_client.pipeline(transaction=False)
+            await add_commands(pipeline)
+            self._observe_pipeline(len(pipeline))
+            return await pipeline.execute(raise_on_error=False)
+
+        return await self._with_retry(execute_pipeline)
+
+
+    async def _with_retry(self, func: Callable[..., Awaitable], *args, **kwargs) -> any:
+        """
+        CodeChallengeJudgmentJobRepository._with_retry의 비동기 버전
+        재시도 대기에 asyncio.sleep을 사용하여 대기 중에도 이벤트 루프가 다른 요청을 처리할 수 있도록 한다.
+        """
+        self._count_command(func)
+        return await self._retry_policy.call_async(func, *args, **kwargs)
+
+
+from config import RedisConfig, CodecConfig, JobConfig
+async_redis_connection = AsyncRedisConnection(
+    host=RedisConfig.HOST,
+    port=RedisConfig.PORT,
+    password=RedisConfig.PASSWORD,
+    db=RedisConfig.DB,
+    pool_name="async-job-repository",
+    max_connections=RedisConfig.MAX_CONNECTIONS,
+    pool_timeout=RedisConfig.POOL_TIMEOUT,
+    socket_timeout=RedisConfig.SOCKET_TIMEOUT,
+    socket_connect_timeout=RedisConfig.SOCKET_CONNECT_TIMEOUT,
+    health_check_interval=RedisConfig.HEALTH_CHECK_INTERVAL,
+    socket_keepalive=RedisConfig.SOCKET_KEEPALIVE
+)
+async_job_repository = AsyncCodeChallengeJudgmentJobRepository(
+    async_redis_connection,
+    storage_codec=get_codec(CodecConfig.STORAGE_CODEC),
+    code_compressor=CodeCompressor(
+        JobConfig.CODE_COMPRESSION,
+        min_size=JobConfig.CODE_COMPRESSION_MIN_BYTES,
+        level=JobConfig.CODE_COMPRESSION_LEVEL
+    ),
+    code_dedup=JobConfig.CODE_DEDUP,
+    verdict_cache_ttl=JobConfig.VERDICT_CACHE_TTL,
+    retry_policy=RetryPolicy(
+        "async-job-repository",
+        max_attempts=RedisConfig.RETRY_MAX_ATTEMPTS,
+        base_delay=RedisConfig.RETRY_BASE_DELAY,
+        max_delay=RedisConfig.RETRY_MAX_DELAY,
+        deadline_seconds=RedisConfig.RETRY_DEADLINE,
+        circuit_breaker=CircuitBreaker(
+            "async-job-repository",
+            failure_threshold=RedisConfig.CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=RedisConfig.CIRCUIT_RESET_TIMEOUT
+        )
+    )
+)
@@ -1,57 +1,119 @@
-import json
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 import logging
-import time
 
-from redisutil import RedisConnection, RedisConnectionError
-from schema import Verdict
+from redis.client import Pipeline
+
+from redisutil import RedisConnection, RedisConnectionError, RetryPolicy, CircuitBreaker
+from common import Codec, CodeCompressor, JsonCodec, StorageCodec, get_codec
+from redisutil.repository.job_repository_base import JobRepositoryBase, instrument_repository, _MAX_LINKED_KEYS_ATTEMPTS
+from schema import Verdict, VerdictStreamBatch
 from schema.job import CodeChallengeJudgmentJob as Job
 
 
-class CodeChallengeJudgmentJobRepository:
+@instrument_repository("job")
+class CodeChallengeJudgmentJobRepository(JobRepositoryBase):
     """
     코딩 테스트 작업(Job) 정보를 Redis에 CRUD하는 메서드를 제공하는 클래스.
+
+    작업은 "{user_id}:{job_id}" hash 키에 필드별로 저장되며, 유저별 작업 목록은
+    "job-index:{user_id}" sorted set 인덱스로, 작업의 소유자는 "job-owner:{job_id}" 키로 관리하여
+    키스페이스 전체를 SCAN하지 않는다.
     """
 
-    def __init__(self, redis_conn: RedisConnection):
+    def __init__(self,
+        redis_conn: RedisConnection,
+        storage_codec: Codec = None,
+        code_compressor: CodeCompressor = None,
+        code_dedup: bool = False,
+        verdict_cache_ttl: int = 0,
+        retry_policy: RetryPolicy = None
+    ):
         self._redis_client = redis_conn.client
+        self._storage_codec = StorageCodec(storage_codec or JsonCodec())
+        self._code_compressor = code_compressor or CodeCompressor()
+        self._code_dedup = code_dedup
+        self._verdict_cache_ttl = verdict_cache_ttl
+        # 재시도 정책을 주입하지 않으면 재시도하지 않음
+        self._retry_policy = retry_policy or RetryPolicy("job-repository", max_attempts=1, base_delay=0, max_delay=0, deadline_seconds=0)
+        self._register_scripts(self._redis_client)
 
 
     def find_by_user_id(self, user_id: int) -> list[Job]:
-        key_pattern = f"{user_id}:*"
+        index_key = self._user_index_key(user_id)
         # Redis 조회는 기본적으로 str 반환, Redis encode/decode 관련 설정에 따라 bytes 타입이 반환될 수 있음
-        keys: list[Union[str, bytes]] = list(self._with_retry(
-            self._redis_client.scan_iter, key_pattern
-        ))
+        job_ids: list[Union[str, bytes]] = self._with_retry(
+            self._find_user_job_ids_script, keys=[index_key]
+        )
+
+        job_ids = [self._decode(job_id) for job_id in job_ids]
+        self._observe_user_index_scan(len(job_ids))
+        found_jobs = self.find_many([(user_id, job_id) for job_id in job_ids])
 
         jobs: list[Job] = []
-        for key in keys:
-            job_data: Union[str, bytes, None] = self._with_retry(
-                self._redis_client.get, key
+        stale_job_ids: list[str] = []
+        for job_id, job in zip(job_ids, found_jobs):
+            if isinstance(job, Exception):
+                raise job
+            if job:
+                jobs.append(job)
+            else:
+                stale_job_ids.append(job_id)
+
+        # 인덱스에는 남아있지만 작업 키가 사라진 항목은 조회 시점에 정리 (lazy cleanup)
+        if stale_job_ids:
+            self._with_retry(
+                self._redis_client.zrem, index_key, *stale_job_ids
             )
-            if job_data:
-                if isinstance(job_data, bytes):
-                    job_data = job_data.decode("utf-8") # bytes 타입인 경우 디코딩하여 str 타입으로 변환
-                jobs.append(Job.create_from_dict(json.loads(job_data)))
         return jobs
 
 
-    def find_user_id_by_job_id(self, job_id: str) -> int:
-        key_pattern = f"*:{job_id}"
+    def count_by_user_id(self, user_id: int) -> int:
+        """
+        유저가 현재 보유한 작업 개수를 작업 데이터 조회 없이 인덱스만으로 반환한다.
+        """
+        return self._with_retry(
+            self._count_user_jobs_script, keys=[self._user_index_key(user_id)]
+        )
+
+
+    def count_by_user_ids(self, user_ids: list[int]) -> list[int]:
+        """
+        여러 유저가 현재 보유한 작업 개수를 하나의 파이프라인으로 조회한다. (반환 리스트는 입력 순서를 따름)
+        """
+        def _count_jobs(pipeline: Pipeline):
+            for user_id in user_ids:
+                self._count_user_jobs_script(keys=[self._user_index_key(user_id)], client=pipeline)
 
-        key: Union[str, bytes, None] = self._with_retry(
-            # next(iterator, default_value)를 사용하여 첫 번째 값만 가져오고 반복 중단
-            lambda _key_pattern: next(self._redis_client.scan_iter(_key_pattern), None), key_pattern
+        counts = self._execute_batch(_count_jobs)
+        for count in counts:
+            if isinstance(count, Exception):
+                raise count
+        return counts
+
+
+    def find_user_id_by_job_id(self, job_id: str) -> int:
+        # 작업 저장 시 함께 기록한 소유자 역매핑 키를 단일 GET으로 조회
+        user_id_data: Union[str, bytes, None] = self._with_retry(
+            self._redis_client.get, self._job_owner_key(job_id)
         )
 
-        if not key:
+        if not user_id_data:
             return -1
 
-        if isinstance(key, bytes):
-            key = key.decode("utf-8")
+        return int(user_id_data)
 
-        user_id_str = key.split(":", 1)[0] # 1회만 분할하여 리스트로 구분 후 0번 요소 추출
-        return int(user_id_str)
+
+    def find_user_ids_by_job_ids(self, job_ids: list[str]) -> list[int]:
+        """
+        여러 작업의 소유자를 단일 MGET으로 조회한다. 소유자가 없는 작업은 -1을 반환한다.
+        """
+        if not job_ids:
+            return []
+
+        user_id_data_list: list[Union[str, bytes, None]] = self._with_retry(
+            self._redis_client.mget, [self._job_owner_key(job_id) for job_id in job_ids]
+        )
+        return [int(user_id_data) if user_id_data else -1 for user_id_data in user_id_data_list]
 
 
     def find_by_job_id(self, job_id: str) -> Optional[Job]:
@@ -62,31 +124,122 @@ class CodeChallengeJudgmentJobRepository:
         return self.find_by_user_id_and_job_id(user_id, job_id)
 
 
-    def find_by_user_id_and_job_id(self, user_id: int, job_id: str) -> Optional[Job]:
-        key = f"{user_id}:{job_id}"
+    def find_by_user_id_and_job_id(self,
+        user_id: int,
+        job_id: str,
+        include_code: bool = True,
+        include_verdicts: bool = True
+    ) -> Optional[Job]:
+        """
+        작업을 조회한다.
+        include_code, include_verdicts가 False인 경우 해당 필드를 Redis에서 전송받지 않으며,
+        반환된 작업의 code는 None, verdicts는 빈 리스트가 된다.
+        """
+        keys, args = self._find_job_script_params(user_id, job_id, include_code, include_verdicts)
+        job_data: Optional[list] = self._run_script(self._find_job_script, keys, args)
+        if not job_data:
+            return None
+
+        return self._create_job_from_stored_data(job_data)
+
+
+    def find_many(self,
+        user_job_ids: list[tuple[int, str]],
+        include_code: bool = True,
+        include_verdicts: bool = True
+    ) -> list[Union[Job, None, Exception]]:
+        """
+        여러 작업을 하나의 파이프라인으로 조회한다.
+        반환 리스트는 입력 순서를 따르며, 각 항목은 작업 객체, 작업이 없으면 None,
+        해당 항목의 명령이 실패하면 발생한 예외 객체가 된다.
+        """
+        script_params = [
+            self._find_job_script_params(user_id, job_id, include_code, include_verdicts) for user_id, job_id in user_job_ids
+        ]
+        return self._create_jobs_from_batch_results(self._run_script_batch(self._find_job_script, script_params))
+
+
+    def exists_by_user_id_and_job_id(self, user_id: int, job_id: str) -> bool:
+        return self._with_retry(
+            self._redis_client.exists, self._job_key(user_id, job_id)
+        ) == 1
+
+
+    def find_stop_flag(self, job_id: str, user_id: int = None) -> Optional[bool]:
+        """
+        코드와 verdicts를 전송받지 않고 작업의 중지 요청 여부만 조회한다.
+        작업이 존재하지 않으면 None을 반환한다.
+        """
+        if user_id is None:
+            user_id = self.find_user_id_by_job_id(job_id)
+            if user_id == -1:
+                return None
+
+        job = self.find_by_user_id_and_job_id(user_id, job_id, include_code=False, include_verdicts=False)
+        return job.stop_flag if job else None
+
+
+    def is_cancelled(self, job_id: str) -> bool:
+        """
+        작업 중지 요청 키만 조회하여 중지 요청 여부를 확인한다. (작업 소유자와 작업 데이터를 조회하지 않음)
+        실행 중인 작업의 중지 요청은 JobCancelListener로 전달받고, 이 메서드는 실행 시작 전 확인에 사용한다.
+        """
+        return bool(self._with_retry(self._redis_client.exists, self._job_cancel_key(job_id)))
 
-        job = None
-        # get 반환 값 -> value 존재: str/bytes, value 존재 X: None
-        job_data: [str, bytes, None] = self._with_retry(
-            self._redis_client.get, key
+
+    def find_cached_verdicts(self, job: Job) -> Optional[list[Verdict]]:
+        """
+        같은 챌린지, 언어, 코드로 채점이 완료된 결과가 캐시되어 있으면 테스트 케이스별 평가 결과를 반환한다.
+        채점 결과 캐시를 사용하지 않거나 캐시된 결과가 없으면 None을 반환한다.
+        """
+        cache_key = self._verdict_cache_lookup_key(job)
+        if cache_key is None:
+            return None
+
+        cached_verdicts: list = self._with_retry(
+            self._redis_client.lrange, cache_key, 0, -1
         )
-        if job_data:
-            if isinstance(job_data, bytes):
-                job_data = job_data.decode("utf-8") # bytes 타입인 경우 디코딩하여 str 타입으로 변환
-            job = Job.create_from_dict(json.loads(job_data))
-        return job
+        return self._create_cached_verdicts(cached_verdicts)
 
 
     def save(self,
         user_id: int,
         job: Job,
-        ttl: int
+        ttl: int,
+        max_user_jobs: int = 0
     ) -> int:
-        key = f"{user_id}:{job.job_id}"
+        """
+        max_user_jobs > 0이면 유저의 작업 수가 max_user_jobs 이상일 때 저장하지 않고 -2를 반환한다. (개수 확인과 저장은 원자적으로 처리)
+        """
+        keys, args = self._save_job_script_params(user_id, job, ttl, max_user_jobs)
+        return self._record_save_result(self._run_script(self._save_job_script, keys, args), args)
+
 
-        return 1 if self._with_retry(
-            self._redis_client.setex, key, ttl, json.dumps(job.as_dict())
-        ) else 0
+    def save_many(self,
+        user_jobs: list[tuple[int, Job, int]],
+        max_user_jobs: int = 0
+    ) -> list[Union[int, Exception]]:
+        """
+        (user_id, job, ttl) 목록을 하나의 파이프라인으로 저장한다.
+        반환 리스트는 입력 순서를 따르며, 각 항목은 save()와 같은 결과 값 또는 발생한 예외 객체가 된다.
+        """
+        # 재시도 시에도 작업을 다시 인코딩하지 않도록 스크립트 인자를 미리 구성
+        script_params = [
+            self._save_job_script_params(user_id, job, ttl, max_user_jobs) for user_id, job, ttl in user_jobs
+        ]
+        return [
+            self._record_save_result(result, args)
+            for result, (_, args) in zip(self._run_script_batch(self._save_job_script, script_params), script_params)
+        ]
+
+
+    def delete_many(self, user_job_ids: list[tuple[int, str]]) -> list[Union[int, Exception]]:
+        """
+        (user_id, job_id) 목록에 해당하는 작업을 하나의 파이프라인으로 삭제한다.
+        반환 리스트는 입력 순서를 따르며, 각 항목은 삭제된 작업 수 또는 발생한 예외 객체가 된다.
+        """
+        script_params = [self._delete_job_script_params(user_id, job_id) for user_id, job_id in user_job_ids]
+        return self._run_script_batch(self._delete_job_script, script_params)
 
 
     def delete(self,
@@ -98,12 +251,9 @@ class CodeChallengeJudgmentJobRepository:
             if user_id == -1:
                 return -1
 
-        key = f"{user_id}:{job_id}"
-
-        # 삭제된 데이터 수 반환
-        return self._with_retry(
-            self._redis_client.delete, key
-        )
+        # 삭제된 데이터(작업) 수 반환
+        keys, args = self._delete_job_script_params(user_id, job_id)
+        return self._run_script(self._delete_job_script, keys, args)
 
 
     def update(self,
@@ -117,69 +267,189 @@ class CodeChallengeJudgmentJobRepository:
             if user_id == -1:
                 return -1
 
-        job = self.find_by_user_id_and_job_id(user_id, job_id)
+        # 조회-수정-저장을 하나의 스크립트로 처리하여 동시 갱신 시 변경 사항이 유실되지 않도록 함
+        # (ex. 워커의 verdicts 갱신이 /job/cancel의 stop_flag 갱신을 덮어쓰는 문제)
+        return self._update_fields(job_id, user_id, stop_flag, "" if verdicts is None else "set", verdicts or [])
 
-        key = f"{user_id}:{job_id}"
-        if not job:
-            return -1
 
-        # 기존 키의 TTL 조회
-        ttl_value = self._with_retry(
-            self._redis_client.ttl, key
+    def read_verdict_stream(self,
+        user_id: int,
+        job_id: str,
+        cursor: str = "0",
+        count: int = 100,
+        block_ms: int = 0
+    ) -> VerdictStreamBatch:
+        """
+        평가 결과 스트림에서 cursor(마지막으로 읽은 항목 ID, 처음이면 "0") 이후의 항목을 최대 count개 읽는다.
+        block_ms > 0이면 새 항목이 없을 때 최대 block_ms 동안 기다린다. (REDIS_SOCKET_TIMEOUT보다 짧아야 함)
+        """
+        stream_key = self._job_verdict_stream_key(user_id, job_id)
+        result = self._with_retry(
+            self._redis_client.xread, {stream_key: cursor}, count=count, block=block_ms or None
         )
+        return self._create_verdict_stream_batch(cursor, result)
 
-        if ttl_value < 0:
-            # -1 => ttl 설정되지 않은 상태 (로직 상 존재 불가능)
-            # -2 => key가 존재하지 않음
-            if ttl_value == -1:
-                self.delete(job_id, user_id)
-            return -1
 
-        if stop_flag is not None:
-            job.stop_flag = stop_flag
+    def append_verdicts(self,
+        job_id: str,
+        verdicts: list[Verdict],
+        user_id: int = None
+    ) -> int:
+        """
+        기존 verdicts를 다시 쓰지 않고 새 평가 결과만 뒤에 추가한다.
+        """
+        if user_id is None:
+            user_id: int = self.find_user_id_by_job_id(job_id)
+            if user_id == -1:
+                return -1
 
-        if verdicts is not None:
-            job.verdicts = verdicts
+        return self._update_fields(job_id, user_id, None, "append", verdicts)
 
-        return self.save(user_id, job, ttl_value)
+
+    def backfill_legacy_jobs(self, scan_count: int = 1000) -> int:
+        """
+        유저별 인덱스와 소유자 역매핑이 도입되기 전에 이전 형식(JSON 문자열)으로 저장된 작업에 두 키를 채운다.
+        채우지 않은 작업은 job_id로 조회되지 않고(find_by_job_id, update), 유저의 작업 개수 제한에도 포함되지 않는다.
+        배포 직후 한 번 실행하며(scripts/backfill_legacy_jobs.py), 여러 번 실행해도 이미 채운 작업은 건너뛴다.
+        반환 값은 채운 작업 수.
+        """
+        backfilled = 0
+        script_params: list[tuple[list, list]] = []
+
+        def _backfill_jobs(pipeline: Pipeline):
+            for keys, args in script_params:
+                self._backfill_legacy_job_script(keys=keys, args=args, client=pipeline)
+
+        for key in self._redis_client.scan_iter(match="*:*", count=scan_count, _type="string"):
+            params = self._backfill_legacy_job_script_params(key)
+            if params is not None:
+                script_params.append(params)
+            if len(script_params) >= scan_count:
+                backfilled += sum(result for result in self._execute_batch(_backfill_jobs) if result == 1)
+                script_params.clear()
+        if script_params:
+            backfilled += sum(result for result in self._execute_batch(_backfill_jobs) if result == 1)
+        return backfilled
+
+
+    def _update_fields(self,
+        job_id: str,
+        user_id: int,
+        stop_flag: Optional[bool],
+        verdicts_mode: str,
+        verdicts: list[Verdict]
+    ) -> int:
+        keys, args = self._update_job_script_params(job_id, user_id, stop_flag, verdicts_mode, verdicts)
+
+        # 작업이 존재하지 않거나 TTL이 설정되지 않은 경우(로직 상 존재 불가능) -1 반환
+        return self._run_script(self._update_job_script, keys, args)
 
 
-    # 필드에 의존하지 않는 메서드 이므로 static으로 처리
-    # kwargs는 args와 같이 쓸 경우, args 뒤에 와야함
-    # args는 연속된 변수를 tuple에 순서대로 담고
-    # kwargs는 keyword=value와 같이 주어진 값을 하나의 dict로 변환 묶어 다루도록 해줌
-    @staticmethod
-    def _with_retry(func: callable, *args, **kwargs) -> any:
+    def _run_script(self, script, keys: list, args: list) -> any:
         """
-        전달된 Redis 관련 CRUD 작업 실패 시 재시도를 수행하는 메서드
-        - func: 실행할 함수 (예: self.client.get, self.client.setex 등)
-        - args, kwargs: 함수에 전달될 인자
+        Lua 스크립트를 재시도 정책에 따라 실행한다.
+        스크립트가 KEYS로 전달되지 않은 연결된 키(공유 코드 blob, 채점 결과 캐시)를 반환하면 해당 키를 KEYS에 추가해 다시 실행한다.
         """
+        params = (keys, args)
+        for _ in range(_MAX_LINKED_KEYS_ATTEMPTS):
+            result = self._with_retry(script, keys=params[0], args=params[1])
+            linked_params = self._linked_script_params(params, result)
+            if linked_params is None:
+                return result
+            params = linked_params
+        raise self._linked_keys_changed_error()
+
 
-        max_retries = 3 # 최대 재시도 횟수
-        retry_interval = 0.5 # 재시도 간격 (단위: 초)
-        for attempt in range(1, max_retries + 1):
-            try:
-                return func(*args, **kwargs)
-            except Exception as ex:
-                func_name = getattr(func, '__name__', repr(func))
-                logging.error(
-                    f"[(Attempt: ({attempt}/{max_retries}) JobRepository >> {func_name} throw unexpected exception: {ex}]")
-                if attempt < max_retries:
-                    time.sleep(retry_interval)
-                    retry_interval *= 2
+    def _run_script_batch(self, script, script_params: list[tuple[list, list]]) -> list:
+        """
+        (keys, args) 목록으로 Lua 스크립트를 하나의 파이프라인으로 실행한다. (반환 리스트는 입력 순서를 따름)
+        연결된 키를 반환한 항목만 해당 키를 KEYS에 추가해 다음 파이프라인으로 다시 실행한다.
+        """
+        results: list = [None] * len(script_params)
+        pending = list(enumerate(script_params))
+        for _ in range(_MAX_LINKED_KEYS_ATTEMPTS):
+            def _run_scripts(pipeline: Pipeline, batch=pending):
+                for _, (keys, args) in batch:
+                    script(keys=keys, args=args, client=pipeline)
+
+            retry_pending = []
+            for (index, params), result in zip(pending, self._execute_batch(_run_scripts)):
+                linked_params = self._linked_script_params(params, result)
+                if linked_params is None:
+                    results[index] = result
                 else:
-                    raise  # 최종 실패 시 func에서 발생한 예외를 그대로 throw -> 상위에서 처리
+                    retry_pending.append((index, linked_params))
+            pending = retry_pending
+            if not pending:
+                return results
+
+        for index, _ in pending:
+            results[index] = self._linked_keys_changed_error()
+        return results
 
 
-from config import RedisConfig
+    def _execute_batch(self, add_commands: Callable[[Pipeline], None]) -> list:
+        """
+        add_commands로 구성한 명령들을 하나의 파이프라인(단일 왕복)으로 실행한다.
+        - 재시도는 개별 명령이 아닌 배치 전체 단위로 수행
+        - 개별 명령의 오류는 예외를 던지지 않고 결과 리스트의 해당 위치에 예외 객체로 반환
+        """
+        def execute_pipeline():
+            # 파이프라인은 execute 후 명령이 초기화되므로, 재시도 시마다 새로 구성
+            pipeline = self._redis_client.pipeline(transaction=False)
+            add_commands(pipeline)
+            self._observe_pipeline(len(pipeline))
+            return pipeline.execute(raise_on_error=False)
+
+        return self._with_retry(execute_pipeline)
+
+
+    def _with_retry(self, func: callable, *args, **kwargs) -> any:
+        """
+        전달된 Redis 관련 CRUD 작업을 재시도 정책(RetryPolicy)에 따라 실행하는 메서드
+        - func: 실행할 함수 (예: self.client.get, self.client.setex 등)
+        - args, kwargs: 함수에 전달될 인자
+        일시적 장애로 최종 실패하거나 서킷이 열려 있으면 RedisUnavailableError 발생 -> 상위에서 처리 (503 응답)
+        """
+        self._count_command(func)
+        return self._retry_policy.call(func, *args, **kwargs)
+
+
+from config import RedisConfig, CodecConfig, JobConfig
 try:
     job_repository = CodeChallengeJudgmentJobRepository(
         RedisConnection(
             host=RedisConfig.HOST,
             port=RedisConfig.PORT,
             password=RedisConfig.PASSWORD,
-            db=RedisConfig.DB
+            db=RedisConfig.DB,
+            pool_name="job-repository",
+            max_connections=RedisConfig.MAX_CONNECTIONS,
+            pool_timeout=RedisConfig.POOL_TIMEOUT,
+            socket_timeout=RedisConfig.SOCKET_TIMEOUT,
+            socket_connect_timeout=RedisConfig.SOCKET_CONNECT_TIMEOUT,
+            health_check_interval=RedisConfig.HEALTH_CHECK_INTERVAL,
+            socket_keepalive=RedisConfig.SOCKET_KEEPALIVE
+        ),
+        storage_codec=get_codec(CodecConfig.STORAGE_CODEC),
+        code_compressor=CodeCompressor(
+            JobConfig.CODE_COMPRESSION,
+            min_size=JobConfig.CODE_COMPRESSION_MIN_BYTES,
+            level=JobConfig.CODE_COMPRESSION_LEVEL
+        ),
+        code_dedup=JobConfig.CODE_DEDUP,
+        verdict_cache_ttl=JobConfig.VERDICT_CACHE_TTL,
+        retry_policy=RetryPolicy(
+            "job-repository",
+            max_attempts=RedisConfig.RETRY_MAX_ATTEMPTS,
+            base_delay=RedisConfig.RETRY_BASE_DELAY,
+            max_delay=RedisConfig.RETRY_MAX_DELAY,
+            deadline_seconds=RedisConfig.RETRY_DEADLINE,
+            circuit_breaker=CircuitBreaker(
+                "job-repository",
+                failure_threshold=RedisConfig.CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=RedisConfig.CIRCUIT_RESET_TIMEOUT
+            )
         )
     )
 except RedisConnectionError as ex:
@@ -0,0 +1,95 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+import redis
+
+from redisutil.repository.job_repository_base import JOB_CANCEL_CHANNEL, JobRepositoryBase
+
+
+class JobCancelListener:
+    """
+    Description:
+        작업 중지 요청을 Redis Pub/Sub(JOB_CANCEL_CHANNEL)으로 전달받아, 실행 중인 작업의 threading.Event를 설정하는 클래스.
+        워커는 작업 실행 전 watch()로 받은 Event를 테스트 케이스 사이(또는 실행 대기 중)에 확인하며,
+        중지 여부를 확인하기 위해 Redis에 주기적으로 작업을 다시 조회하지 않는다.
+
+        - 프로세스(워커)당 하나의 구독 커넥션으로 모든 작업의 중지 요청을 전달받음
+        - watch() 이전에 발행된 중지 요청, 구독이 끊긴 동안 발행된 중지 요청은 중지 요청 키("job-cancel:{job_id}")로 확인
+    """
+    _RECONNECT_INTERVAL = 0.5 # 구독 커넥션이 끊긴 경우 재연결 간격 (단위: 초)
+
+    def __init__(self, redis_client: redis.StrictRedis):
+        self._redis_client = redis_client
+        self._events: dict[str, threading.Event] = {}
+        self._events_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._subscribed = threading.Event()
+        self._closed = threading.Event()
+
+    def start(self):
+        """구독 스레드를 시작하고 구독이 완료될 때까지 기다린다."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="job-cancel-listener", daemon=True)
+            self._thread.start()
+        self._subscribed.wait()
+
+    def close(self):
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def watch(self, job_id: str) -> threading.Event:
+        """
+        작업의 중지 요청을 전달받을 Event를 반환한다. (이미 중지 요청된 작업이면 설정된 Event)
+        작업 실행이 끝나면 unwatch()를 호출해야 한다.
+        """
+        event = threading.Event()
+        with self._events_lock:
+            self._events[job_id] = event
+        # 등록 이전에 발행된 중지 요청 확인
+        if self._redis_client.exists(JobRepositoryBase._job_cancel_key(job_id)):
+            event.set()
+        return event
+
+    def unwatch(self, job_id: str):
+        with self._events_lock:
+            self._events.pop(job_id, None)
+
+    def _run(self):
+        while not self._closed.is_set():
+            pubsub = self._redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(JOB_CANCEL_CHANNEL)
+                # 구독이 끊긴 동안 발행된 중지 요청 확인
+                self._check_cancel_keys()
+                self._subscribed.set()
+                while not self._closed.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message:
+                        self._set_event(message["data"])
+            except redis.exceptions.RedisError:
+                logging.error("[Job cancel subscription lost. Reconnecting]", exc_info=True)
+                time.sleep(self._RECONNECT_INTERVAL)
+            finally:
+                pubsub.close()
+
+    def _check_cancel_keys(self):
+        with self._events_lock:
+            job_ids = list(self._events)
+        if not job_ids:
+            return
+        cancelled = self._redis_client.mget([JobRepositoryBase._job_cancel_key(job_id) for job_id in job_ids])
+        for job_id, value in zip(job_ids, cancelled):
+            if value is not None:
+                self._set_event(job_id)
+
+    def _set_event(self, job_id):
+        if isinstance(job_id, bytes):
+            job_id = job_id.decode("utf-8")
+        with self._events_lock:
+            event = self._events.get(job_id)
+        if event is not None:
+            event.set()
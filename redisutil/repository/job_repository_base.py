@@ -0,0 +1,798 @@
+import base64
+import functools
+import hashlib
+import inspect
+import json
+import re
+import time
+from typing import Callable, Optional, Union
+
+from prometheus_client import Counter
+
+from common import CodeCompressor, CodeLanguage, StorageCodec
+from config import MetricsConfig, TestCaseConfig
+from redisutil.metrics import (
+    REDIS_REPOSITORY_CALL_SECONDS, REDIS_COMMAND_TOTAL, REDIS_PIPELINE_COMMANDS, REDIS_USER_INDEX_ENTRIES_SCANNED
+)
+from redisutil.exception import RedisUnavailableError
+from redisutil.retry import RetryPolicy
+from schema import Verdict, VerdictStreamBatch
+from schema.job import CodeChallengeJudgmentJob as Job
+from traceutil import tracer, SpanKind
+
+
+# 작업 중지 요청을 실행 중인 워커에 전달하는 Pub/Sub 채널 (메시지: job_id)
+JOB_CANCEL_CHANNEL = "job-cancel"
+
+# 코드 중복 제거 및 채점 결과 캐시 메트릭
+JOB_CODE_DEDUP_TOTAL = Counter(
+    "job_code_dedup_total", "Number of saved jobs by whether an identical code blob already existed", ["result"]
+)
+JOB_CODE_DEDUP_SAVED_BYTES = Counter(
+    "job_code_dedup_saved_bytes_total", "Bytes of code not stored again because an identical code blob already existed"
+)
+JOB_VERDICT_CACHE_TOTAL = Counter(
+    "job_verdict_cache_total", "Number of verdict cache lookups by result", ["result"]
+)
+
+# 스크립트가 반환한 연결된 키를 KEYS에 추가해 다시 호출하는 최대 횟수 (호출 사이에 작업이 참조하는 키가 바뀐 경우에만 2번 이상 호출)
+_MAX_LINKED_KEYS_ATTEMPTS = 3
+
+# 이전 형식 작업 키 "{user_id}:{job_id}" (job-owner:*, job-cancel:* 등 다른 string 키 제외)
+_LEGACY_JOB_KEY_PATTERN = re.compile(r"(\d+):([^:]+)")
+
+
+# 작업 저장 형식
+# - "{user_id}:{job_id}" (hash)
+#     meta: code, stopFlag, verdicts를 제외한 나머지 필드 (StorageCodec으로 인코딩)
+#     code: 제출된 코드 (codeEncoding에 따라 base64 문자열 | 디코딩된 원본 바이트 | 압축된 원본 바이트)
+#     codeEncoding: 'base64' | 'raw' | 'zlib' | 'zstd' (필드가 없는 작업은 'base64'로 간주)
+#     codeBlob: 코드 중복 제거 사용 시 code, codeEncoding 대신 공유 코드 blob 키를 저장
+#     stopFlag: '1' | '0'
+#     verdictCacheKey, verdictCacheTtl, totalTestCases: 채점 결과 캐시 사용 시 결과를 기록할 캐시 키와 TTL, 테스트 케이스 수
+#     testCase:{index}: 평가 결과가 기록된 테스트 케이스 번호 ('1', 재시도로 같은 평가 결과가 다시 추가되지 않도록 확인)
+# - "{user_id}:{job_id}:verdicts" (list): 테스트 케이스별 평가 결과 (StorageCodec으로 인코딩, append-only)
+# - "{user_id}:{job_id}:verdict-stream" (stream): 진행 상황 조회용 평가 결과 스트림 (작업과 동일한 TTL)
+#     "{n}-0" 항목: n번째 평가 결과 (verdict 필드, verdicts 목록과 같은 인코딩)
+#     "{n}-1" 항목: n개의 평가 결과가 기록된 뒤 중지 요청됨 (stopped 필드)
+#     항목 ID의 앞부분이 평가 결과 순번이므로, 마지막으로 읽은 항목 ID(커서)로 읽은 평가 결과 수를 알 수 있음
+# - "code-blob:{code_hash}" (hash): 동일한 코드(챌린지, 언어, 디코딩된 코드 기준)를 공유하는 작업들의 코드
+#     code, codeEncoding: 작업 hash의 같은 이름 필드와 동일
+#     refs: 참조 중인 작업 수 (삭제 시 감소, 0이 되면 삭제)
+#     TTL은 참조 중인 작업 중 가장 늦게 만료되는 작업에 맞추므로, TTL 만료로 참조가 정리되지 않아도 함께 만료됨
+# - "verdict-cache:{code_hash}:{test_cases_version}" (list): 동일한 코드의 테스트 케이스별 평가 결과 캐시
+# - "job-cancel:{job_id}" (string): 작업 중지 요청 표시 (작업과 동일한 TTL, 워커가 작업 전체를 읽지 않고 중지 여부를 확인)
+# 이전 형식(작업 전체를 하나의 JSON 문자열로 저장)의 작업도 함께 읽고 갱신할 수 있도록 각 스크립트에서 키 타입을 확인한다.
+# 인덱스와 소유자 역매핑이 도입되기 전에 저장된 작업은 backfill_legacy_jobs()로 두 키를 채워야 조회, 개수 제한, 갱신 대상이 된다.
+
+# 작업 hash가 참조하는 키(공유 코드 blob, 채점 결과 캐시)를 다루는 함수
+# - 스크립트가 접근하는 키는 모두 KEYS로 전달받아야 하므로(Redis Cluster, 키 기반 라우팅 프록시), 작업 hash에 저장된 키 이름으로
+#   바로 접근하지 않고 first번째 이후의 KEYS로 전달되었는지 먼저 확인한다.
+# - 전달되지 않은 키가 있으면 아무것도 쓰지 않고 {'linked', blob 키, 캐시 키}를 반환하며,
+#   호출한 쪽(_resolve_linked_keys)은 반환된 키를 KEYS에 추가해 스크립트를 다시 호출한다.
+_LINKED_KEYS_FUNCTIONS = """
+local function is_declared(first, key)
+    for i = first, #KEYS do
+        if KEYS[i] == key then
+            return true
+        end
+    end
+    return false
+end
+
+local function undeclared_linked_keys(first, blob, cache)
+    if (blob and not is_declared(first, blob)) or (cache and not is_declared(first, cache)) then
+        return {'linked', blob or '', cache or ''}
+    end
+    return nil
+end
+
+local function release_code_blob(blob)
+    if blob and redis.call('EXISTS', blob) == 1 and redis.call('HINCRBY', blob, 'refs', -1) <= 0 then
+        redis.call('DEL', blob)
+    end
+end
+"""
+
+# 인코딩된 verdict를 다루는 함수
+# - 바이너리 형식(0xC1 헤더 + 형식 버전 1: msgpack)으로 인코딩된 verdict는 cmsgpack으로 디코딩
+# - verdict_index: verdict의 테스트 케이스 번호 (없으면 false)
+_VERDICT_FUNCTIONS = """
+local function decode_verdict(value)
+    if string.byte(value, 1) == 193 then
+        return cmsgpack.unpack(string.sub(value, 3))
+    end
+    return cjson.decode(value)
+end
+
+local function verdict_index(value)
+    local index = decode_verdict(value)['testCaseIndex']
+    return type(index) == 'number' and index or false
+end
+"""
+
+# 작업 저장과 유저별 인덱스, 작업 소유자 역매핑 갱신을 원자적으로 처리하는 스크립트
+# - 인덱스(sorted set)의 score는 작업의 만료 시각(Redis 서버 시각 기준 unix time)
+# - 인덱스 키의 만료 시각은 가장 늦게 만료되는 작업의 만료 시각에 맞춤
+# - 소유자 역매핑 키와 verdicts 키는 작업과 동일한 TTL을 가짐
+# - KEYS[6..]: 공유 코드 blob 키 (ARGV[8] = '1'이면 KEYS[6]이 저장할 blob 키), 같은 job_id로 저장된 작업이 참조하던 blob 키
+# - ARGV[7]: codeEncoding, ARGV[8]: 코드 중복 제거 사용 여부 ('1' | '')
+# - ARGV[9]: 채점 결과 캐시 키 ('' => 캐시 미사용, 저장만 하고 접근하지 않음), ARGV[10]: 캐시 TTL, ARGV[11]: 테스트 케이스 수
+# - ARGV[12]: 유저별 최대 작업 수 (0 => 제한 없음, 같은 job_id의 작업을 다시 저장하는 경우는 제외)
+#   개수 확인과 저장을 하나의 스크립트로 처리하여 동시 요청이 모두 제한을 통과하지 않도록 함
+# - ARGV[13..]: 인코딩된 verdict 목록 (테스트 케이스 번호가 있으면 작업 hash에 testCase:{index} 필드로 기록)
+# - 반환: 1 (저장) | 2 (저장, 동일한 코드의 blob이 이미 존재하여 코드를 새로 저장하지 않음) | -2 (최대 작업 수 초과, 저장하지 않음)
+#   | {'linked', ...} (저장하지 않음)
+_SAVE_JOB_SCRIPT = _LINKED_KEYS_FUNCTIONS + _VERDICT_FUNCTIONS + """
+local ttl = tonumber(ARGV[1])
+local now = tonumber(redis.call('TIME')[1])
+local result = 1
+local previous_blob = false
+if redis.call('TYPE', KEYS[1])['ok'] == 'hash' then
+    previous_blob = redis.call('HGET', KEYS[1], 'codeBlob')
+end
+local undeclared = undeclared_linked_keys(6, previous_blob, false)
+if undeclared then
+    return undeclared
+end
+local max_user_jobs = tonumber(ARGV[12])
+if max_user_jobs > 0 then
+    redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', now)
+    if not redis.call('ZSCORE', KEYS[3], ARGV[5]) and redis.call('ZCARD', KEYS[3]) >= max_user_jobs then
+        return -2
+    end
+end
+-- verdict 디코딩은 실패할 수 있으므로 쓰기 전에 수행
+local verdict_indexes = {}
+for i = 13, #ARGV do
+    local index = verdict_index(ARGV[i])
+    if index then
+        table.insert(verdict_indexes, 'testCase:' .. index)
+        table.insert(verdict_indexes, '1')
+    end
+end
+release_code_blob(previous_blob)
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[5])
+redis.call('HSET', KEYS[1], 'meta', ARGV[2], 'stopFlag', ARGV[4])
+if ARGV[8] == '1' then
+    if redis.call('HEXISTS', KEYS[6], 'code') == 1 then
+        result = 2
+    else
+        redis.call('HSET', KEYS[6], 'code', ARGV[3], 'codeEncoding', ARGV[7])
+    end
+    redis.call('HINCRBY', KEYS[6], 'refs', 1)
+    if redis.call('TTL', KEYS[6]) < ttl then
+        redis.call('EXPIRE', KEYS[6], ttl)
+    end
+    redis.call('HSET', KEYS[1], 'codeBlob', KEYS[6])
+else
+    redis.call('HSET', KEYS[1], 'code', ARGV[3], 'codeEncoding', ARGV[7])
+end
+if ARGV[9] ~= '' then
+    redis.call('HSET', KEYS[1], 'verdictCacheKey', ARGV[9], 'verdictCacheTtl', ARGV[10], 'totalTestCases', ARGV[11])
+end
+redis.call('EXPIRE', KEYS[1], ttl)
+if #ARGV > 12 then
+    redis.call('RPUSH', KEYS[2], unpack(ARGV, 13))
+    redis.call('EXPIRE', KEYS[2], ttl)
+    for i = 13, #ARGV do
+        redis.call('XADD', KEYS[5], (i - 12) .. '-0', 'verdict', ARGV[i])
+    end
+    redis.call('EXPIRE', KEYS[5], ttl)
+    if #verdict_indexes > 0 then
+        redis.call('HSET', KEYS[1], unpack(verdict_indexes))
+    end
+end
+redis.call('SETEX', KEYS[4], ttl, ARGV[6])
+redis.call('ZADD', KEYS[3], now + ttl, ARGV[5])
+local last = redis.call('ZRANGE', KEYS[3], -1, -1, 'WITHSCORES')
+redis.call('EXPIREAT', KEYS[3], tonumber(last[2]))
+return result
+"""
+
+# 작업의 필요한 필드만 조회하는 스크립트
+# - KEYS[3..]: 작업이 참조하는 공유 코드 blob 키 (code 포함 조회 시)
+# - ARGV[1]: code 포함 여부, ARGV[2]: verdicts 포함 여부 ('1' | '0')
+# - 반환: {'hash', meta, stopFlag, code, codeEncoding, verdicts} | {'json', 작업 JSON} (이전 형식) | nil | {'linked', ...}
+_FIND_JOB_SCRIPT = _LINKED_KEYS_FUNCTIONS + """
+local key_type = redis.call('TYPE', KEYS[1])['ok']
+if key_type == 'string' then
+    return {'json', redis.call('GET', KEYS[1])}
+elseif key_type ~= 'hash' then
+    return false
+end
+local fields = redis.call('HMGET', KEYS[1], 'meta', 'stopFlag', 'code', 'codeEncoding', 'codeBlob')
+local code = false
+local code_encoding = false
+if ARGV[1] == '1' then
+    if fields[5] then
+        local undeclared = undeclared_linked_keys(3, fields[5], false)
+        if undeclared then
+            return undeclared
+        end
+        local blob = redis.call('HMGET', fields[5], 'code', 'codeEncoding')
+        code, code_encoding = blob[1], blob[2]
+    else
+        code, code_encoding = fields[3], fields[4]
+    end
+end
+local verdicts = {}
+if ARGV[2] == '1' then
+    verdicts = redis.call('LRANGE', KEYS[2], 0, -1)
+end
+return {'hash', fields[1], fields[2], code, code_encoding, verdicts}
+"""
+
+# 작업과 인덱스 항목, 소유자 역매핑을 삭제하고 공유 코드 blob의 참조를 해제하는 스크립트
+# - KEYS[6..]: 작업이 참조하는 공유 코드 blob 키
+# - ARGV[1]: job_id
+# - 반환: 삭제된 작업 수 | {'linked', ...} (삭제하지 않음)
+_DELETE_JOB_SCRIPT = _LINKED_KEYS_FUNCTIONS + """
+local blob = false
+if redis.call('TYPE', KEYS[1])['ok'] == 'hash' then
+    blob = redis.call('HGET', KEYS[1], 'codeBlob')
+end
+local undeclared = undeclared_linked_keys(6, blob, false)
+if undeclared then
+    return undeclared
+end
+release_code_blob(blob)
+local deleted = redis.call('DEL', KEYS[1])
+redis.call('DEL', KEYS[2], KEYS[4], KEYS[5])
+redis.call('ZREM', KEYS[3], ARGV[1])
+return deleted
+"""
+
+# 작업의 일부 필드만 서버 측에서 갱신하는 스크립트 (남은 TTL 유지)
+# - KEYS[7..]: 작업이 참조하는 공유 코드 blob 키(TTL이 없는 작업 정리 시), 채점 결과 캐시 키(모든 테스트 케이스의 결과 기록 시)
+# - ARGV[1]: job_id
+# - ARGV[2]: stopFlag ('1' | '0' | '' => 변경 없음)
+#   '1'이면 중지 요청 키(KEYS[5])를 기록하고 JOB_CANCEL_CHANNEL로 job_id를 발행하여 실행 중인 워커에 바로 전달
+#   평가 결과 스트림(KEYS[6])에는 중지 항목을 추가 (이미 같은 순번의 중지 항목이 있으면 추가하지 않음)
+# - ARGV[3]: verdicts 갱신 방식 ('set' => 전체 교체 | 'append' => 뒤에 추가 | '' => 변경 없음)
+#   'append'는 이미 평가 결과가 기록된 테스트 케이스 번호의 verdict를 건너뜀
+#   (응답을 받지 못해 재시도한 호출이 서버에서 이미 실행된 경우에도 verdicts 목록과 스트림에 중복 기록되지 않도록 함)
+# - ARGV[4..]: 인코딩된 verdict 목록
+# - cjson은 빈 배열을 객체({})로 인코딩하므로 이전 형식의 verdicts는 배열 표기로 복원
+# - 채점 결과 캐시를 사용하는 작업은 중지되지 않고 모든 테스트 케이스의 결과가 기록되면 결과를 캐시에 복사
+# - 실패할 수 있는 처리(이전 형식 디코딩, 연결된 키 확인, 스트림 항목 ID 확인)는 모두 쓰기 전에 수행하여 일부만 기록되지 않도록 함
+# - 반환: 1 (갱신) | -1 (작업 없음) | {'linked', ...} (갱신하지 않음)
+_UPDATE_JOB_SCRIPT = _LINKED_KEYS_FUNCTIONS + _VERDICT_FUNCTIONS + """
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl == -2 then
+    return -1
+end
+local key_type = redis.call('TYPE', KEYS[1])['ok']
+local fields = {false, false, false, false, false}
+if key_type == 'hash' then
+    fields = redis.call('HMGET', KEYS[1], 'codeBlob', 'verdictCacheKey', 'verdictCacheTtl', 'totalTestCases', 'stopFlag')
+end
+if ttl == -1 then
+    local undeclared = undeclared_linked_keys(7, fields[1], false)
+    if undeclared then
+        return undeclared
+    end
+    release_code_blob(fields[1])
+    redis.call('DEL', KEYS[1], KEYS[2], KEYS[4], KEYS[6])
+    redis.call('ZREM', KEYS[3], ARGV[1])
+    return -1
+end
+
+if key_type == 'string' then
+    local job = cjson.decode(redis.call('GET', KEYS[1]))
+    local recorded = {}
+    if ARGV[3] == 'append' then
+        for _, verdict in ipairs(job['verdicts']) do
+            if type(verdict['testCaseIndex']) == 'number' then
+                recorded[verdict['testCaseIndex']] = true
+            end
+        end
+    end
+    local new_verdicts = {}
+    for i = 4, #ARGV do
+        local verdict = decode_verdict(ARGV[i])
+        if type(verdict['testCaseIndex']) ~= 'number' or not recorded[verdict['testCaseIndex']] then
+            table.insert(new_verdicts, verdict)
+        end
+    end
+    if ARGV[2] ~= '' then
+        job['stopFlag'] = (ARGV[2] == '1')
+    end
+    if ARGV[3] == 'set' then
+        job['verdicts'] = {}
+    end
+    if ARGV[3] ~= '' then
+        for _, verdict in ipairs(new_verdicts) do
+            table.insert(job['verdicts'], verdict)
+        end
+    end
+    local encoded = string.gsub(cjson.encode(job), '"verdicts":{}', '"verdicts":[]')
+    if ARGV[2] == '1' then
+        redis.call('SET', KEYS[5], '1', 'PX', ttl)
+        redis.call('PUBLISH', '""" + JOB_CANCEL_CHANNEL + """', ARGV[1])
+    elseif ARGV[2] == '0' then
+        redis.call('DEL', KEYS[5])
+    end
+    redis.call('SET', KEYS[1], encoded, 'PX', ttl)
+    return 1
+end
+
+-- 추가할 평가 결과 중 이미 기록된 테스트 케이스의 결과는 제외
+local new_verdicts = {}
+local new_indexes = {}
+for i = 4, #ARGV do
+    local index = verdict_index(ARGV[i])
+    if ARGV[3] ~= 'append' or not index or redis.call('HEXISTS', KEYS[1], 'testCase:' .. index) == 0 then
+        table.insert(new_verdicts, ARGV[i])
+        if index then
+            table.insert(new_indexes, 'testCase:' .. index)
+            table.insert(new_indexes, '1')
+        end
+    end
+end
+
+-- 갱신 후 평가 결과 수와 중지 여부로 채점 완료(캐시 복사) 여부를 미리 판단
+local new_count = #new_verdicts
+local verdict_count = (ARGV[3] == 'set') and 0 or redis.call('LLEN', KEYS[2])
+local stop_flag = (ARGV[2] ~= '') and ARGV[2] or fields[5]
+local cache = false
+if ARGV[3] ~= '' and fields[2] and stop_flag ~= '1' and verdict_count + new_count == tonumber(fields[4]) then
+    cache = fields[2]
+end
+local undeclared = undeclared_linked_keys(7, false, cache)
+if undeclared then
+    return undeclared
+end
+-- 스트림의 마지막 항목 순번이 새 평가 결과 순번 이상이면(목록과 스트림이 어긋난 경우) XADD가 실패하므로 스트림을 다시 구성
+local rebuild_stream = false
+if ARGV[3] == 'append' and new_count > 0 then
+    local last = redis.call('XREVRANGE', KEYS[6], '+', '-', 'COUNT', 1)[1]
+    rebuild_stream = last ~= nil and tonumber(string.match(last[1], '^(%d+)')) > verdict_count
+end
+
+if ARGV[2] == '1' then
+    redis.call('SET', KEYS[5], '1', 'PX', ttl)
+    redis.call('PUBLISH', '""" + JOB_CANCEL_CHANNEL + """', ARGV[1])
+elseif ARGV[2] == '0' then
+    redis.call('DEL', KEYS[5])
+end
+if ARGV[2] ~= '' then
+    redis.call('HSET', KEYS[1], 'stopFlag', ARGV[2])
+end
+if ARGV[3] == 'set' or rebuild_stream then
+    redis.call('DEL', KEYS[6])
+end
+if ARGV[3] == 'set' then
+    redis.call('DEL', KEYS[2])
+    local recorded_indexes = {}
+    for _, field in ipairs(redis.call('HKEYS', KEYS[1])) do
+        if string.sub(field, 1, 9) == 'testCase:' then
+            table.insert(recorded_indexes, field)
+        end
+    end
+    if #recorded_indexes > 0 then
+        redis.call('HDEL', KEYS[1], unpack(recorded_indexes))
+    end
+end
+if ARGV[3] ~= '' and new_count > 0 then
+    redis.call('RPUSH', KEYS[2], unpack(new_verdicts))
+    redis.call('PEXPIRE', KEYS[2], ttl)
+    if #new_indexes > 0 then
+        redis.call('HSET', KEYS[1], unpack(new_indexes))
+    end
+    if rebuild_stream then
+        for i, verdict in ipairs(redis.call('LRANGE', KEYS[2], 0, -1)) do
+            redis.call('XADD', KEYS[6], i .. '-0', 'verdict', verdict)
+        end
+    else
+        for i, verdict in ipairs(new_verdicts) do
+            redis.call('XADD', KEYS[6], (verdict_count + i) .. '-0', 'verdict', verdict)
+        end
+    end
+    redis.call('PEXPIRE', KEYS[6], ttl)
+end
+if ARGV[2] == '1' then
+    redis.pcall('XADD', KEYS[6], redis.call('LLEN', KEYS[2]) .. '-1', 'stopped', '1')
+    redis.call('PEXPIRE', KEYS[6], ttl)
+end
+if cache then
+    redis.call('DEL', cache)
+    redis.call('RPUSH', cache, unpack(redis.call('LRANGE', KEYS[2], 0, -1)))
+    redis.call('EXPIRE', cache, tonumber(fields[3]))
+end
+return 1
+"""
+
+# 인덱스와 소유자 역매핑 없이 저장된 이전 형식 작업(JSON 문자열)에 두 키를 채우는 스크립트 (남은 TTL 유지)
+# - KEYS[1]: 작업 키, KEYS[2]: 유저별 인덱스 키, KEYS[3]: 소유자 역매핑 키
+# - ARGV[1]: job_id, ARGV[2]: user_id
+# - 반환: 1 (채움) | 0 (작업이 없거나 이전 형식이 아니거나 TTL이 없거나 이미 채워져 있음)
+_BACKFILL_LEGACY_JOB_SCRIPT = """
+if redis.call('TYPE', KEYS[1])['ok'] ~= 'string' or redis.call('EXISTS', KEYS[3]) == 1 then
+    return 0
+end
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl <= 0 then
+    return 0
+end
+local time = redis.call('TIME')
+local expire_at = tonumber(time[1]) + math.ceil(ttl / 1000)
+redis.call('SET', KEYS[3], ARGV[2], 'PX', ttl)
+redis.call('ZADD', KEYS[2], expire_at, ARGV[1])
+local last = redis.call('ZRANGE', KEYS[2], -1, -1, 'WITHSCORES')
+redis.call('EXPIREAT', KEYS[2], tonumber(last[2]))
+return 1
+"""
+
+# TTL 만료로 남은 인덱스 항목을 정리한 뒤 유저의 작업 ID 목록을 반환하는 스크립트
+_FIND_USER_JOB_IDS_SCRIPT = """
+local now = redis.call('TIME')[1]
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+return redis.call('ZRANGE', KEYS[1], 0, -1)
+"""
+
+# TTL 만료로 남은 인덱스 항목을 정리한 뒤 유저의 작업 개수를 반환하는 스크립트
+_COUNT_USER_JOBS_SCRIPT = """
+local now = redis.call('TIME')[1]
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+return redis.call('ZCARD', KEYS[1])
+"""
+
+
+# (repository, command) -> 레이블을 적용한 REDIS_COMMAND_TOTAL
+_command_counters: dict[tuple[str, str], Counter] = {}
+
+
+def instrument_repository(repository: str):
+    """
+    저장소 클래스의 공개 메서드(동기/비동기)를 감싸 계측하는 클래스 데코레이터.
+    - MetricsConfig.ENABLED: 메서드별 처리 시간(재시도 포함)을 REDIS_REPOSITORY_CALL_SECONDS에 기록
+    - 트레이싱 사용 시(TRACING_EXPORTER): 메서드 호출마다 스팬(ex. CodeChallengeJudgmentJobRepository.save) 기록
+    둘 다 사용하지 않으면 클래스를 그대로 반환한다.
+    """
+    def decorate(cls):
+        cls._METRICS_NAME = repository
+        if not (MetricsConfig.ENABLED or tracer.enabled):
+            return cls
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(method):
+                continue
+            histogram = REDIS_REPOSITORY_CALL_SECONDS.labels(repository=repository, method=name) if MetricsConfig.ENABLED else None
+            span_name = f"{cls.__name__}.{name}" if tracer.enabled else None
+            setattr(cls, name, _instrumented(method, histogram, span_name))
+        return cls
+    return decorate
+
+
+def _instrumented(method: Callable, histogram, span_name: Optional[str]) -> Callable:
+    # 레이블을 적용한 히스토그램을 미리 구해 두어, 호출마다 레이블 조회를 하지 않음
+    span_attributes = {"db.system": "redis", "db.operation.name": method.__name__}
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                if span_name is None:
+                    return await method(*args, **kwargs)
+                with tracer.start_as_current_span(span_name, SpanKind.CLIENT, span_attributes):
+                    return await method(*args, **kwargs)
+            finally:
+                if histogram is not None:
+                    histogram.observe(time.perf_counter() - start)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            if span_name is None:
+                return method(*args, **kwargs)
+            with tracer.start_as_current_span(span_name, SpanKind.CLIENT, span_attributes):
+                return method(*args, **kwargs)
+        finally:
+            if histogram is not None:
+                histogram.observe(time.perf_counter() - start)
+    return wrapper
+
+
+class JobRepositoryBase:
+    """
+    동기/비동기 작업(Job) 저장소가 공유하는 Redis 저장 형식(키 구성, Lua 스크립트 인자, 역직렬화)을 제공하는 클래스.
+    실제 Redis 명령 실행(I/O)은 하위 클래스에서 담당한다.
+    """
+
+    # 작업 데이터(meta, verdicts) 인코딩에 사용할 코덱 (하위 클래스 생성자에서 주입)
+    _storage_codec: StorageCodec
+    # 제출 코드 저장 형식 변환(압축)에 사용할 객체 (하위 클래스 생성자에서 주입)
+    _code_compressor: CodeCompressor
+    # 동일한 코드를 공유 blob으로 한 번만 저장할지 여부, 채점 결과 캐시 TTL (0: 캐시 미사용) (하위 클래스 생성자에서 주입)
+    _code_dedup: bool = False
+    _verdict_cache_ttl: int = 0
+
+    # Redis 호출 재시도 정책 (하위 클래스 생성자에서 주입, 동기 저장소는 call(), 비동기 저장소는 call_async() 사용)
+    _retry_policy: RetryPolicy
+    # 메트릭 repository 레이블 (instrument_repository가 설정)
+    _METRICS_NAME: str = ""
+
+    def _count_command(self, func: Callable):
+        """저장소가 Redis에 보내는 호출 수를 명령 이름별로 기록한다. (Lua 스크립트: evalsha, 파이프라인: execute_pipeline)"""
+        if not MetricsConfig.ENABLED:
+            return
+        command = getattr(func, "__name__", "evalsha")
+        # 레이블 조회(labels())는 잠금을 사용하므로, 명령별로 한 번만 조회하여 재사용
+        counter = _command_counters.get((self._METRICS_NAME, command))
+        if counter is None:
+            counter = _command_counters.setdefault(
+                (self._METRICS_NAME, command), REDIS_COMMAND_TOTAL.labels(repository=self._METRICS_NAME, command=command)
+            )
+        counter.inc()
+
+    def _observe_pipeline(self, command_count: int):
+        if MetricsConfig.ENABLED:
+            REDIS_PIPELINE_COMMANDS.labels(repository=self._METRICS_NAME).observe(command_count)
+
+    def _observe_user_index_scan(self, entry_count: int):
+        if MetricsConfig.ENABLED:
+            REDIS_USER_INDEX_ENTRIES_SCANNED.labels(repository=self._METRICS_NAME).observe(entry_count)
+
+    def _register_scripts(self, redis_client):
+        """
+        Description:
+            Lua 스크립트를 Redis 클라이언트에 등록한다.
+            (redis.StrictRedis, redis.asyncio.StrictRedis 모두 동일한 register_script 인터페이스 제공)
+        """
+        self._save_job_script = redis_client.register_script(_SAVE_JOB_SCRIPT)
+        self._find_job_script = redis_client.register_script(_FIND_JOB_SCRIPT)
+        self._update_job_script = redis_client.register_script(_UPDATE_JOB_SCRIPT)
+        self._delete_job_script = redis_client.register_script(_DELETE_JOB_SCRIPT)
+        self._find_user_job_ids_script = redis_client.register_script(_FIND_USER_JOB_IDS_SCRIPT)
+        self._count_user_jobs_script = redis_client.register_script(_COUNT_USER_JOBS_SCRIPT)
+        self._backfill_legacy_job_script = redis_client.register_script(_BACKFILL_LEGACY_JOB_SCRIPT)
+
+
+    def _find_job_script_params(self,
+        user_id: int,
+        job_id: str,
+        include_code: bool,
+        include_verdicts: bool
+    ) -> tuple[list, list]:
+        keys = [self._job_key(user_id, job_id), self._job_verdicts_key(user_id, job_id)]
+        args = ["1" if include_code else "0", "1" if include_verdicts else "0"]
+        return keys, args
+
+
+    def _save_job_script_params(self, user_id: int, job: Job, ttl: int, max_user_jobs: int = 0) -> tuple[list, list]:
+        job_dict = job.as_dict()
+        code_encoding, code = self._code_compressor.compress(job_dict.pop("code"))
+        stop_flag = job_dict.pop("stopFlag")
+        verdicts = job_dict.pop("verdicts")
+
+        code_hash = self._code_hash(job) if self._code_dedup or self._verdict_cache_ttl > 0 else None
+        verdict_cache_key = (self._verdict_cache_key(job, code_hash) if self._verdict_cache_ttl > 0 else None) or ""
+
+        keys = [
+            self._job_key(user_id, job.job_id),
+            self._job_verdicts_key(user_id, job.job_id),
+            self._user_index_key(user_id),
+            self._job_owner_key(job.job_id),
+            self._job_verdict_stream_key(user_id, job.job_id)
+        ]
+        if self._code_dedup:
+            keys.append(self._code_blob_key(code_hash))
+        args = [
+            ttl, self._storage_codec.encode(job_dict), code, "1" if stop_flag else "0", job.job_id, user_id,
+            code_encoding, "1" if self._code_dedup else "", verdict_cache_key, self._verdict_cache_ttl, job.total_test_cases, max_user_jobs,
+            *[self._storage_codec.encode(verdict) for verdict in verdicts]
+        ]
+        return keys, args
+
+
+    def _linked_script_params(self, params: tuple[list, list], result) -> Optional[tuple[list, list]]:
+        """
+        스크립트가 {'linked', 공유 코드 blob 키, 채점 결과 캐시 키}를 반환했으면(접근할 키가 KEYS로 전달되지 않아 실행하지 않음)
+        반환된 키를 KEYS에 추가한 스크립트 인자를, 그 외의 결과이면 None을 반환한다.
+        """
+        if not isinstance(result, list) or not result or self._decode(result[0]) != "linked":
+            return None
+        keys, args = params
+        linked_keys = [self._decode(key) for key in result[1:] if key]
+        return keys + [key for key in linked_keys if key not in keys], args
+
+
+    @staticmethod
+    def _linked_keys_changed_error() -> RedisUnavailableError:
+        # 스크립트를 다시 호출하는 사이에 작업이 참조하는 키가 계속 바뀐 경우 (잠시 후 다시 요청)
+        return RedisUnavailableError("Keys linked to the job kept changing between script calls")
+
+
+    def _record_save_result(self, result: Union[int, Exception], args: list) -> Union[int, Exception]:
+        """
+        _SAVE_JOB_SCRIPT의 반환 값으로 코드 중복 제거 메트릭을 기록하고 save()의 반환 값(1 | 0 | -2)으로 변환한다.
+        """
+        if isinstance(result, Exception) or result == -2:
+            return result
+        if self._code_dedup and result:
+            if result == 2:
+                JOB_CODE_DEDUP_TOTAL.labels(result="hit").inc()
+                JOB_CODE_DEDUP_SAVED_BYTES.inc(len(args[2]))
+            else:
+                JOB_CODE_DEDUP_TOTAL.labels(result="miss").inc()
+        return 1 if result else 0
+
+
+    def _update_job_script_params(self,
+        job_id: str,
+        user_id: int,
+        stop_flag: Optional[bool],
+        verdicts_mode: str,
+        verdicts: list[Verdict]
+    ) -> tuple[list, list]:
+        stop_flag_arg = "" if stop_flag is None else ("1" if stop_flag else "0")
+
+        keys = [
+            self._job_key(user_id, job_id),
+            self._job_verdicts_key(user_id, job_id),
+            self._user_index_key(user_id),
+            self._job_owner_key(job_id),
+            self._job_cancel_key(job_id),
+            self._job_verdict_stream_key(user_id, job_id)
+        ]
+        args = [
+            job_id, stop_flag_arg, verdicts_mode,
+            *[
+                self._storage_codec.encode(verdict.as_dict() if isinstance(verdict, Verdict) else verdict)
+                for verdict in verdicts
+            ]
+        ]
+        return keys, args
+
+
+    def _backfill_legacy_job_script_params(self, job_key: Union[str, bytes]) -> Optional[tuple[list, list]]:
+        """
+        SCAN으로 찾은 키가 작업 키("{user_id}:{job_id}")가 아니면 None을 반환한다.
+        """
+        match = _LEGACY_JOB_KEY_PATTERN.fullmatch(self._decode(job_key))
+        if match is None:
+            return None
+        user_id, job_id = int(match.group(1)), match.group(2)
+        keys = [self._job_key(user_id, job_id), self._user_index_key(user_id), self._job_owner_key(job_id)]
+        return keys, [job_id, user_id]
+
+
+    def _delete_job_script_params(self, user_id: int, job_id: str) -> tuple[list, list]:
+        keys = [
+            self._job_key(user_id, job_id),
+            self._job_verdicts_key(user_id, job_id),
+            self._user_index_key(user_id),
+            self._job_owner_key(job_id),
+            self._job_verdict_stream_key(user_id, job_id)
+        ]
+        return keys, [job_id]
+
+
+    def _verdict_cache_lookup_key(self, job: Job) -> Optional[str]:
+        """
+        채점 결과 캐시를 사용하지 않거나 작업의 코드 또는 설정 스냅샷 버전이 없으면 None을 반환한다.
+        """
+        if self._verdict_cache_ttl <= 0 or job.code is None:
+            return None
+        return self._verdict_cache_key(job, self._code_hash(job))
+
+
+    def _create_cached_verdicts(self, cached_verdicts: list) -> Optional[list[Verdict]]:
+        if not cached_verdicts:
+            JOB_VERDICT_CACHE_TOTAL.labels(result="miss").inc()
+            return None
+
+        JOB_VERDICT_CACHE_TOTAL.labels(result="hit").inc()
+        return [Verdict.create_from_dict(self._storage_codec.decode(verdict)) for verdict in cached_verdicts]
+
+
+    def _create_verdict_stream_batch(self, cursor: str, result: list) -> VerdictStreamBatch:
+        """
+        평가 결과 스트림 XREAD 결과로 VerdictStreamBatch를 생성한다. (읽은 항목이 없으면 result는 빈 리스트)
+        """
+        batch = VerdictStreamBatch(cursor=cursor, verdicts=[])
+        for entry_id, fields in (result[0][1] if result else []):
+            batch.cursor = self._decode(entry_id)
+            fields = {self._decode(name): value for name, value in fields.items()}
+            if "verdict" in fields:
+                batch.verdicts.append(Verdict.create_from_dict(self._storage_codec.decode(fields["verdict"])))
+            else:
+                batch.stopped = True
+        return batch
+
+
+    def _create_jobs_from_batch_results(self, results: list) -> list[Union[Job, None, Exception]]:
+        jobs = []
+        for job_data in results:
+            if isinstance(job_data, Exception) or not job_data:
+                jobs.append(job_data or None)
+                continue
+            try:
+                jobs.append(self._create_job_from_stored_data(job_data))
+            except (ValueError, TypeError) as ex:
+                # 저장된 데이터가 손상된 항목은 해당 위치에 예외 객체로 반환
+                jobs.append(ex)
+        return jobs
+
+
+    def _create_job_from_stored_data(self, job_data: list) -> Job:
+        """
+        _FIND_JOB_SCRIPT의 반환 값으로 작업 객체를 생성한다.
+        Redis 설정에 따라 bytes 타입이 반환될 수 있으므로 str 타입으로 변환하여 처리한다.
+        """
+        storage_format = self._decode(job_data[0])
+        if storage_format == "json":
+            # 이전 형식(작업 전체를 하나의 JSON 문자열로 저장)
+            return Job.create_from_dict(json.loads(self._decode(job_data[1])))
+
+        _, meta, stop_flag, code, code_encoding, verdicts = job_data
+        job_dict = self._storage_codec.decode(meta)
+        job_dict["code"] = self._code_compressor.decompress(self._decode(code_encoding), code)
+        job_dict["stopFlag"] = self._decode(stop_flag) == "1"
+        job_dict["verdicts"] = [self._storage_codec.decode(verdict) for verdict in verdicts]
+        return Job.create_from_dict(job_dict)
+
+
+    @staticmethod
+    def _decode(value: Union[str, bytes, None]) -> Optional[str]:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+    @staticmethod
+    def _code_hash(job: Job) -> str:
+        """
+        챌린지 ID, 언어, 디코딩된 코드로 동일한 제출을 식별하는 해시를 생성한다.
+        """
+        code_language = CodeLanguage(job.code_language).value
+        return hashlib.sha256(
+            f"{job.challenge_id}:{code_language}:".encode("utf-8") + base64.b64decode(job.code)
+        ).hexdigest()
+
+
+    @staticmethod
+    def _job_key(user_id: int, job_id: str) -> str:
+        return f"{user_id}:{job_id}"
+
+
+    @staticmethod
+    def _job_verdicts_key(user_id: int, job_id: str) -> str:
+        return f"{user_id}:{job_id}:verdicts"
+
+
+    @staticmethod
+    def _job_verdict_stream_key(user_id: int, job_id: str) -> str:
+        return f"{user_id}:{job_id}:verdict-stream"
+
+
+    @staticmethod
+    def _user_index_key(user_id: int) -> str:
+        return f"job-index:{user_id}"
+
+
+    @staticmethod
+    def _job_owner_key(job_id: str) -> str:
+        return f"job-owner:{job_id}"
+
+
+    @staticmethod
+    def _job_cancel_key(job_id: str) -> str:
+        return f"job-cancel:{job_id}"
+
+
+    @staticmethod
+    def _code_blob_key(code_hash: str) -> str:
+        return f"code-blob:{code_hash}"
+
+
+    @staticmethod
+    def _verdict_cache_key(job: Job, code_hash: str) -> Optional[str]:
+        # 작업 생성 시 사용한 설정 스냅샷의 테스트 케이스 버전으로 키를 만듦
+        # (테스트 케이스가 변경되면 키가 달라지므로 이전 결과는 사용되지 않고 TTL로 만료됨)
+        # 버전이 기록되지 않았거나 더 이상 유지하지 않는 스냅샷이면 어떤 테스트 케이스로 채점했는지 알 수 없으므로 캐시하지 않음
+        snapshot = TestCaseConfig.get_snapshot(job.test_case_config_version)
+        if snapshot is None:
+            return None
+        return f"verdict-cache:{code_hash}:{snapshot.get_test_cases_version(job.challenge_id)}"
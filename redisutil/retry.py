@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Optional
+
+import redis
+
+from .exception import RedisUnavailableError
+from .metrics import REDIS_RETRY_TOTAL, REDIS_CIRCUIT_STATE
+
+
+# 일시적인 장애(연결 끊김, 타임아웃, 장애 조치(failover) 중 응답)로 다시 시도하면 성공할 수 있는 예외
+TRANSIENT_ERRORS = (
+    redis.exceptions.ConnectionError,
+    redis.exceptions.TimeoutError,
+    redis.exceptions.ReadOnlyError, # 장애 조치로 복제본이 된 이전 마스터에 쓰기
+    redis.exceptions.TryAgainError,
+    redis.exceptions.MasterDownError,
+)
+# TRANSIENT_ERRORS의 하위 클래스이지만 다시 시도해도 실패하는 예외 (설정 오류)
+NON_TRANSIENT_ERRORS = (
+    redis.exceptions.AuthenticationError,
+    redis.exceptions.AuthorizationError,
+)
+
+# 요청 하나에서 호출하는 저장소 메서드들이 함께 사용하는 재시도 마감 시각 (time.monotonic 기준, None: 호출마다 새로 계산)
+_retry_deadline: ContextVar[Optional[float]] = ContextVar("redis_retry_deadline", default=None)
+
+
+def start_retry_deadline(seconds: float):
+    """
+    현재 요청(스레드, 코루틴 컨텍스트)의 재시도 마감 시각을 지금부터 seconds 이후로 설정한다.
+    이후 같은 컨텍스트에서 호출하는 저장소 메서드는 재시도 예산(마감 시각)을 나눠 사용한다.
+    """
+    _retry_deadline.set(time.monotonic() + seconds)
+
+
+def clear_retry_deadline():
+    _retry_deadline.set(None)
+
+
+def is_transient_error(ex: BaseException) -> bool:
+    return isinstance(ex, TRANSIENT_ERRORS) and not isinstance(ex, NON_TRANSIENT_ERRORS)
+
+
+class CircuitBreaker:
+    """
+    Description:
+        Redis 장애가 계속되는 동안 호출을 보내지 않고 바로 실패시키는 서킷 브레이커.
+        - closed: 정상. 일시적 장애가 failure_threshold번 연속 발생하면 open
+        - open: 호출하지 않고 RedisUnavailableError 발생. reset_timeout(초)이 지나면 half-open
+        - half-open: 호출 하나만 시험으로 보내, 성공하면 closed, 실패하면 다시 open
+          시험 호출이 결과 없이 중단되면(요청 취소 등) 다음 호출을 다시 시험으로 보냄
+    """
+    CLOSED, HALF_OPEN, OPEN = 0, 1, 2
+
+    def __init__(self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+        REDIS_CIRCUIT_STATE.labels(policy=name).set_function(lambda: self._state)
+
+    @property
+    def state(self) -> int:
+        return self._state
+
+    def allow(self) -> bool:
+        """호출을 보내도 되는지 확인한다. (half-open에서는 시험 호출 하나만 허용)"""
+        with self._lock:
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self._reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self._state != self.CLOSED:
+                logging.info(f"[Redis circuit closed. policy={self._name}]")
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """결과를 알 수 없이 중단된 호출(asyncio.CancelledError 등)이 차지한 시험 호출 자리를 반환한다."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+                if self._state != self.OPEN:
+                    logging.error(
+                        f"[Redis circuit opened. policy={self._name}, consecutive_failures={self._consecutive_failures}]"
+                    )
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+
+
+class RetryPolicy:
+    """
+    Description:
+        동기/비동기 저장소가 공유하는 Redis 호출 재시도 정책.
+        - 일시적인 장애(TRANSIENT_ERRORS)만 재시도하며, 그 외 예외(스크립트 오류, 데이터 오류 등)는 바로 전달
+        - 재시도 간격은 지수 백오프 상한 안에서 무작위로 선택 (full jitter, 여러 요청의 재시도가 한 시점에 몰리지 않도록 함)
+        - 재시도는 마감 시각(요청 단위로 start_retry_deadline()이 설정한 값, 없으면 호출마다 deadline_seconds) 안에서만 수행
+        - 일시적 장애로 최종 실패하거나 서킷이 열려 있으면 RedisUnavailableError 발생 (API 응답 503)
+        - 응답을 받지 못한 호출(타임아웃, 연결 끊김)도 서버에서는 실행되었을 수 있으므로, 다시 실행해도 결과가 같은 호출만 전달해야 함
+          (저장소의 Lua 스크립트와 파이프라인은 같은 인자로 다시 실행해도 결과가 같도록 작성)
+    """
+
+    def __init__(self,
+        name: str,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        deadline_seconds: float,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        self._name = name
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._deadline_seconds = deadline_seconds
+        self._circuit_breaker = circuit_breaker
+
+    def call(self, func: Callable, *args, **kwargs):
+        deadline = self._deadline()
+        for attempt in range(1, self._max_attempts + 1):
+            self._check_circuit(func)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as ex:
+                delay = self._on_failure(func, ex, attempt, deadline)
+                time.sleep(delay)
+                continue
+            except BaseException:
+                # 요청 취소(gevent.Timeout 등)로 중단된 호출은 장애로 기록하지 않고 시험 호출 자리만 반환
+                self._on_abort()
+                raise
+            self._on_success()
+            return result
+
+    async def call_async(self, func: Callable[..., Awaitable], *args, **kwargs):
+        """call()의 비동기 버전 (재시도 대기 중에도 이벤트 루프가 다른 요청을 처리)"""
+        deadline = self._deadline()
+        for attempt in range(1, self._max_attempts + 1):
+            self._check_circuit(func)
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as ex:
+                delay = self._on_failure(func, ex, attempt, deadline)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # 클라이언트 연결 종료, 타임아웃으로 취소된(asyncio.CancelledError) 호출
+                self._on_abort()
+                raise
+            self._on_success()
+            return result
+
+    def _deadline(self) -> float:
+        deadline = _retry_deadline.get()
+        return deadline if deadline is not None else time.monotonic() + self._deadline_seconds
+
+    def _check_circuit(self, func: Callable):
+        if self._circuit_breaker is not None and not self._circuit_breaker.allow():
+            REDIS_RETRY_TOTAL.labels(policy=self._name, decision="circuit_open").inc()
+            raise RedisUnavailableError(f"Redis circuit is open. {self._func_name(func)} not called")
+
+    def _on_success(self):
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success()
+
+    def _on_abort(self):
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.release_probe()
+
+    def _on_failure(self, func: Callable, ex: Exception, attempt: int, deadline: float) -> float:
+        """
+        재시도할 경우 대기 시간을 반환하고, 재시도하지 않을 경우 예외를 발생시킨다.
+        """
+        func_name = self._func_name(func)
+        if not is_transient_error(ex):
+            # Redis가 응답한 오류이므로 서킷 상태에는 성공으로 반영
+            self._on_success()
+            REDIS_RETRY_TOTAL.labels(policy=self._name, decision="not_retryable").inc()
+            raise ex
+
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_failure()
+        delay = random.uniform(0, min(self._max_delay, self._base_delay * 2 ** (attempt - 1)))
+        if attempt >= self._max_attempts or time.monotonic() + delay >= deadline:
+            REDIS_RETRY_TOTAL.labels(policy=self._name, decision="gave_up").inc()
+            logging.error(f"[(Attempt: ({attempt}/{self._max_attempts}) {self._name} >> {func_name} failed. Giving up: {ex}]")
+            raise RedisUnavailableError(f"Redis unavailable: {ex}") from ex
+
+        REDIS_RETRY_TOTAL.labels(policy=self._name, decision="retried").inc()
+        logging.warning(f"[(Attempt: ({attempt}/{self._max_attempts}) {self._name} >> {func_name} failed. Retrying in {delay:.3f}s: {ex}]")
+        return delay
+
+    @staticmethod
+    def _func_name(func: Callable) -> str:
+        return getattr(func, '__name__', repr(func))
@@ -1,2 +1,2 @@
 from .schema import Schema
-from .verdict import Verdict
+from .verdict import Verdict, VerdictStreamBatch
@@ -1,5 +1,6 @@
 import datetime
 from dataclasses import dataclass
+from typing import Optional
 import pytz
 import uuid
 
@@ -28,6 +29,7 @@ class CodeChallengeJudgmentJob(Schema):
         verdicts (list[Verdict]): 각 테스트 케이스별 평가 기록
 
         submitted_at (str): 작업이 제출된 시각 (ISO 8601 형식, KST)
+        test_case_config_version (Optional[str]): 작업 생성 시 사용한 테스트 케이스 설정 스냅샷 버전
     """
     job_id: str
     stop_flag: bool
@@ -41,6 +43,8 @@ class CodeChallengeJudgmentJob(Schema):
 
     submitted_at: str
 
+    test_case_config_version: Optional[str] = None
+
     def __post_init__(self):
         """객체 초기화 후 code_language를 문자열에서 CodeLanguage 객체로 변환"""
         if isinstance(self.code_language, str):
@@ -51,7 +55,8 @@ class CodeChallengeJudgmentJob(Schema):
         code_language: CodeLanguage,
         code: str,
         challenge_id: int,
-        total_test_cases: int
+        total_test_cases: int,
+        test_case_config_version: Optional[str] = None
     ) -> "CodeChallengeJudgmentJob": # 반환 타입 힌팅에 내부적으로 순환 참조를 막기 위해 문자열 힌팅 사용
         """
         Description:
@@ -64,6 +69,7 @@ class CodeChallengeJudgmentJob(Schema):
             code (str): 제출된 코드
             challenge_id (int): 평가할 챌린지(문제)의 ID
             total_test_cases (int): 총 테스트 케이스 개수
+            test_case_config_version (Optional[str]): 테스트 케이스 설정 스냅샷 버전
 
         Returns:
             CodeChallengeJudgmentJobEntity: 생성된 평가 작업 엔티티
@@ -81,30 +87,10 @@ class CodeChallengeJudgmentJob(Schema):
             total_test_cases=total_test_cases,
             verdicts=[],
 
-            submitted_at=now_in_seoul.strftime('%Y-%m-%dT%H:%M:%S')
-        )
-
-    @classmethod
-    def create_from_dict(cls, judgment_job_dict: dict) -> "CodeChallengeJudgmentJob":
-        """
-        Description:
-            부모 클래스 Schema의 create_from_dict를 호출한 뒤,
-            code_language 필드를 CodeLanguage 객체로 변환하여 인스턴스를 생성합니다.
-
-        Args:
-            judgment_job_dict (dict): 입력 딕셔너리
-
-        Returns:
-            CodeChallengeJudgmentJob: 생성된 인스턴스
-        """
-        # 부모 클래스 Schema의 create_from_dict 호출
-        instance = super().create_from_dict(judgment_job_dict)
-
-        # code_language 변환 (문자열 -> CodeLanguage 객체)
-        if isinstance(instance.code_language, str):
-            instance.code_language = CodeLanguage(instance.code_language)
+            submitted_at=now_in_seoul.strftime('%Y-%m-%dT%H:%M:%S'),
 
-        return instance
+            test_case_config_version=test_case_config_version
+        )
 
 
 # dict -> schema 변환 테스트: dict 필드 검증 및 인스턴스 반환
@@ -0,0 +1 @@
+from .job_request import JobRequest, CreateJobRequest, VerdictStreamRequest
@@ -0,0 +1,116 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from common import CodeLanguage
+
+
+# Redis Stream 항목 ID 형식 ("0" 또는 "{정수}-{정수}")
+_STREAM_ID_PATTERN = re.compile(r"0|\d+-\d+")
+
+
+def _parse_known_fields(request_body: dict, required_fields: tuple[str, ...]) -> dict[str, Any]:
+    """
+    필수 필드 존재 여부를 확인하고, 요청 본문에 포함된 공통 필드를 한 번에 변환합니다.
+    - userId, challengeId: int
+    - codeLanguage: CodeLanguage (대소문자 구분 없음)
+    유효하지 않은 값이 있으면 ValueError(또는 TypeError, KeyError, AttributeError)가 발생합니다.
+    """
+    if not request_body or not isinstance(request_body, dict):
+        raise ValueError("Request body is empty")
+
+    missing_fields = [field for field in required_fields if request_body.get(field) is None]
+    if missing_fields:
+        raise ValueError(f"Missing fields: {missing_fields}")
+
+    parsed = dict(request_body)
+    for key in ("userId", "challengeId"):
+        if key in parsed:
+            parsed[key] = int(parsed[key])
+    if "codeLanguage" in parsed:
+        parsed["codeLanguage"] = CodeLanguage[parsed["codeLanguage"].upper()]
+    return parsed
+
+
+@dataclass
+class JobRequest:
+    """
+    Description:
+        /job/execute, /job/cancel, /job 요청 본문을 검증, 변환한 요청 모델
+
+    Attributes:
+        user_id (int): 유저 ID
+        job_id (str): 작업(Job) ID
+    """
+    user_id: int
+    job_id: str
+
+    @classmethod
+    def parse(cls, request_body: dict) -> "JobRequest":
+        parsed = _parse_known_fields(request_body, ("jobId", "userId"))
+        return cls(user_id=parsed["userId"], job_id=str(parsed["jobId"]))
+
+
+@dataclass
+class CreateJobRequest:
+    """
+    Description:
+        /job/create 요청 본문을 검증, 변환한 요청 모델
+
+    Attributes:
+        user_id (int): 유저 ID
+        challenge_id (int): 코딩 챌린지 ID (문제 ID)
+        code_language (CodeLanguage): 제출된 코드의 프로그래밍 언어
+        code (str): 제출된 코드 (base64)
+        total_test_cases (int): 챌린지의 테스트 케이스 총 개수 (검증 시 테스트 케이스 설정 스냅샷에서 조회하여 설정)
+        test_case_time_limit (float): 테스트 케이스 별 시간 제한 (total_test_cases와 같은 스냅샷에서 조회)
+        test_case_config_version (Optional[str]): 조회에 사용한 테스트 케이스 설정 스냅샷 버전
+    """
+    user_id: int
+    challenge_id: int
+    code_language: CodeLanguage
+    code: str
+    total_test_cases: int = 0
+    test_case_time_limit: float = 0.0
+    test_case_config_version: Optional[str] = None
+
+    @classmethod
+    def parse(cls, request_body: dict) -> "CreateJobRequest":
+        parsed = _parse_known_fields(request_body, ("code", "codeLanguage", "challengeId", "userId"))
+        return cls(
+            user_id=parsed["userId"],
+            challenge_id=parsed["challengeId"],
+            code_language=parsed["codeLanguage"],
+            code=parsed["code"]
+        )
+
+
+@dataclass
+class VerdictStreamRequest:
+    """
+    Description:
+        /job/verdicts 요청 본문을 검증, 변환한 요청 모델
+
+    Attributes:
+        user_id (int): 유저 ID
+        job_id (str): 작업(Job) ID
+        cursor (str): 마지막으로 읽은 평가 결과 스트림 항목 ID (처음 조회 시 "0")
+        limit (int): 한 번에 읽을 최대 평가 결과 수 (0: 서버 기본값)
+        wait_ms (int): 새 평가 결과가 없을 때 기다릴 최대 시간 (단위: 밀리초, 0: 기다리지 않음)
+    """
+    user_id: int
+    job_id: str
+    cursor: str = "0"
+    limit: int = 0
+    wait_ms: int = 0
+
+    @classmethod
+    def parse(cls, request_body: dict) -> "VerdictStreamRequest":
+        parsed = _parse_known_fields(request_body, ("jobId", "userId"))
+        cursor = str(parsed.get("cursor") or "0")
+        if not _STREAM_ID_PATTERN.fullmatch(cursor):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        limit, wait_ms = int(parsed.get("limit") or 0), int(parsed.get("waitMs") or 0)
+        if limit < 0 or wait_ms < 0:
+            raise ValueError("limit and waitMs must not be negative")
+        return cls(user_id=parsed["userId"], job_id=str(parsed["jobId"]), cursor=cursor, limit=limit, wait_ms=wait_ms)
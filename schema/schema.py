@@ -1,12 +1,73 @@
 from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any
+from typing import Any, Union, get_args, get_origin, get_type_hints
 
 from common import camel_to_snake, snake_to_camel, CodeLanguage
 
 
+# as_dict 직렬화 시 별도 변환 없이 그대로 반환하는 타입
+_PRIMITIVE_TYPES = (str, int, float, bool)
+
+
+@dataclass(frozen=True)
+class _SchemaFieldTable:
+    """
+    Schema 하위 클래스별 직렬화/역직렬화에 사용하는 필드 정보 테이블.
+    (필드 목록은 클래스가 바뀌지 않는 한 동일하므로, 클래스 당 한 번만 생성하여 재사용)
+
+    Attributes:
+        field_names (frozenset[str]): 필드 이름(snake_case) 집합
+        camel_field_names (tuple[tuple[str, str], ...]): (snake_case 필드 이름, camelCase 키) 목록 (필드 선언 순서)
+        key_to_field_name (dict[str, str]): 입력 딕셔너리 키(camelCase 또는 snake_case) -> 필드 이름
+        enum_fields (dict[str, type[Enum]]): Enum 타입(Optional 포함) 필드 이름 -> Enum 클래스
+    """
+    field_names: frozenset
+    camel_field_names: tuple
+    key_to_field_name: dict
+    enum_fields: dict
+
+
 @dataclass
 class Schema:
+    @classmethod
+    def _field_table(cls) -> _SchemaFieldTable:
+        """
+        클래스의 필드 정보 테이블을 반환합니다.
+        @dataclass 데코레이터는 클래스 생성 이후에 필드를 구성하므로, 최초 호출 시 한 번만 생성하여 클래스에 저장합니다.
+        (상위 클래스의 테이블을 상속받아 사용하지 않도록 cls.__dict__에서 직접 조회)
+        """
+        table = cls.__dict__.get("_schema_field_table")
+        if table is None:
+            table = cls._build_field_table()
+            setattr(cls, "_schema_field_table", table)
+        return table
+
+    @classmethod
+    def _build_field_table(cls) -> _SchemaFieldTable:
+        type_hints = get_type_hints(cls)
+        field_names = [f.name for f in fields(cls)]
+
+        key_to_field_name = {}
+        for name in field_names:
+            key_to_field_name[name] = name
+            key_to_field_name[snake_to_camel(name)] = name
+
+        enum_fields = {}
+        for name in field_names:
+            field_type = type_hints.get(name)
+            # Optional[Enum] (= Union[Enum, None]) 형태인 경우 내부 Enum 타입 추출
+            if get_origin(field_type) is Union:
+                field_type = next((arg for arg in get_args(field_type) if arg is not type(None)), None)
+            if isinstance(field_type, type) and issubclass(field_type, Enum):
+                enum_fields[name] = field_type
+
+        return _SchemaFieldTable(
+            field_names=frozenset(field_names),
+            camel_field_names=tuple((name, snake_to_camel(name)) for name in field_names),
+            key_to_field_name=key_to_field_name,
+            enum_fields=enum_fields
+        )
+
     @classmethod
     def validate_keys(cls, schema_dict: dict):
         """
@@ -15,10 +76,13 @@ class Schema:
 
         (cls 인자를 통해 현재 호출한 클래스를 직접 참조하기 위해 static 대신 @classmethod 사용)
         """
-        valid_fields = {f.name for f in fields(cls)}
+        table = cls._field_table()
         for key in schema_dict.keys():
+            if key in table.key_to_field_name:
+                continue
+            # 테이블에 없는 표기(ex. 'memoryUsageMB')는 기존 방식대로 변환하여 확인
             converted_key = camel_to_snake(key)
-            if converted_key not in valid_fields:
+            if converted_key not in table.field_names:
                 raise ValueError(
                     f"Invalid key in input dict: '{key}' (converted to '{converted_key}') "
                     f"is not a valid field for {cls.__name__}"
@@ -29,12 +93,22 @@ class Schema:
         """
         부모 클래스에서 전체 구현을 제공하여, 입력 딕셔너리의
         camelCase 또는 snake_case 키를 모두 snake_case로 변환한 뒤,
+        Enum 타입 필드의 문자열 값을 Enum 객체로 변환하여
         해당 클래스의 생성자에 전달하여 인스턴스를 생성합니다.
 
         (cls 인자를 통해 현재 호출한 클래스를 직접 참조하기 위해 static 대신 @classmethod 사용)
         """
         cls.validate_keys(schema_dict)
-        processed_dict = {camel_to_snake(key): value for key, value in schema_dict.items()}
+        table = cls._field_table()
+        key_to_field_name = table.key_to_field_name
+        processed_dict = {
+            key_to_field_name.get(key) or camel_to_snake(key): value for key, value in schema_dict.items()
+        }
+
+        for name, enum_type in table.enum_fields.items():
+            value = processed_dict.get(name)
+            if isinstance(value, str):
+                processed_dict[name] = enum_type(value)
 
         # 동적 필드를 넘기는 부분을 정확히 추론하지 못해서 발생하는 IDE의 경고는
         # 이미 입력 값을 validate_keys를 통해 검증 하였기 때문에 무시
@@ -47,20 +121,18 @@ class Schema:
         Enum 타입의 값은 .value를 사용하여 직렬화하며,
         중첩된 Schema 객체에 대해서는 재귀적 as_dict 변환을 수행합니다.
         """
-        # 각 필드 순회하며 직접 처리
-        result = {}
-
-        for f in fields(self):
-            value = getattr(self, f.name)
-            # 값 처리
-            processed_value = self._process_value(value)
-            # 키 변환 및 결과 저장
-            result[snake_to_camel(f.name)] = processed_value
-
-        return result
+        # 각 필드 순회하며 직접 처리 (키 변환 결과는 필드 정보 테이블에 미리 계산되어 있음)
+        process_value = self._process_value
+        return {
+            camel_name: process_value(getattr(self, name))
+            for name, camel_name in self._field_table().camel_field_names
+        }
 
     def _process_value(self, value):
         """타입에 따라 값을 변환하는 헬퍼 메서드"""
+        # 대부분의 필드 값인 기본 타입은 추가 검사 없이 반환
+        if value is None or type(value) in _PRIMITIVE_TYPES:
+            return value
         if isinstance(value, Enum):
             return value.value
         elif isinstance(value, Schema):
@@ -70,4 +142,5 @@ class Schema:
                         self._process_value(v) for k, v in value.items()}
         elif isinstance(value, list):
             return [self._process_value(item) for item in value]
-        return value
\ No newline at end of file
+        return value
+
@@ -19,27 +19,26 @@ class Verdict(Schema):
         if isinstance(self.failure_cause, str):
             self.failure_cause = FailureCause(self.failure_cause)
 
-    @classmethod
-    def create_from_dict(cls, verdict_dict: dict) -> "Verdict":
-        """
-        Description:
-            부모 클래스 Schema의 create_from_dict를 호출한 뒤,
-            failure_cause 필드를 FailureCause 객체로 변환하여 인스턴스를 생성합니다.
-
-        Args:
-            verdict_dict (dict): 입력 딕셔너리
-
-        Returns:
-            Verdict: 생성된 인스턴스
-        """
-        # 부모 클래스 Schema의 create_from_dict 호출
-        instance = super().create_from_dict(verdict_dict)
-
-        # failure_cause 변환 (문자열 -> FailureCause 객체)
-        if isinstance(instance.failure_cause, str):
-            instance.failure_cause = FailureCause(instance.failure_cause)
-
-        return instance
+
+@dataclass
+class VerdictStreamBatch:
+    """
+    Description:
+        평가 결과 스트림에서 한 번에 읽은 항목.
+
+    Attributes:
+        cursor (str): 마지막으로 읽은 항목 ID (다음 조회 시 전달, 읽은 항목이 없으면 요청한 커서 그대로)
+        verdicts (list[Verdict]): 읽은 평가 결과 목록
+        stopped (bool): 중지 항목을 읽었는지 여부
+    """
+    cursor: str
+    verdicts: list[Verdict]
+    stopped: bool = False
+
+    @property
+    def read_count(self) -> int:
+        """커서까지 읽은 평가 결과 수 (항목 ID의 앞부분이 평가 결과 순번)"""
+        return int(self.cursor.split("-")[0])
 
 
 # dict -> schema 변환 테스트: dict 필드 검증 및 인스턴스 반환
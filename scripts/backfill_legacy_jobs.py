@@ -0,0 +1,17 @@
+"""
+유저별 작업 인덱스(job-index:{user_id})와 작업 소유자 역매핑(job-owner:{job_id})이 도입되기 전에
+이전 형식(작업 전체를 하나의 JSON 문자열)으로 저장된 작업에 두 키를 채운다.
+
+새 버전 배포 직후 한 번 실행한다. (여러 번 실행해도 이미 채운 작업은 건너뜀)
+    python -m scripts.backfill_legacy_jobs [scan_count]
+
+실행하지 않는 경우, 이전 버전이 저장한 작업이 모두 만료될 때까지 이전 버전 API 서버와 워커를 유지한 뒤 전환해야 한다.
+"""
+import sys
+
+from redisutil.repository import job_repository
+
+
+if __name__ == "__main__":
+    scan_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f"{job_repository.backfill_legacy_jobs(scan_count)} legacy jobs backfilled")
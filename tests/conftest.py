@@ -0,0 +1,52 @@
+import json
+import os
+import sys
+import tempfile
+
+import pytest
+
+# 저장소 모듈은 import 시점에 Redis에 연결하므로, 테스트 모듈을 import하기 전에 환경 변수와 Redis 클라이언트를 교체
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("REDIS_PORT", "6379")
+os.environ.setdefault("REDIS_DB", "0")
+os.environ.setdefault("REDIS_PASSWORD", "")
+os.environ.setdefault("API_SECRET_KEY", "test")
+
+# 테스트 케이스 파일은 저장소에 포함되지 않으므로, 챌린지 1개의 테스트 케이스 파일(이전 형식)을 임시 디렉터리에 생성
+if "TEST_CASES_DATA_DIR" not in os.environ:
+    _test_cases_data_dir = tempfile.mkdtemp(prefix="test-cases-")
+    with open(os.path.join(_test_cases_data_dir, "test_cases_inputs_and_expected.json"), "w", encoding="utf-8") as f:
+        json.dump({"1": [{"input": "1", "expected": "1"}] * 5}, f)
+    os.environ["TEST_CASES_DATA_DIR"] = _test_cases_data_dir
+
+try:
+    import fakeredis
+except ImportError:
+    # fakeredis(+ Lua 스크립트 실행에 필요한 lupa)가 없으면 Redis가 필요한 테스트는 수집하지 않음
+    fakeredis = None
+    collect_ignore_glob = ["test_*.py"]
+else:
+    import redis
+    import redis.asyncio
+
+    _server = fakeredis.FakeServer()
+
+    class _FakeRedis(fakeredis.FakeStrictRedis):
+        # RedisConnection이 전달하는 커넥션 풀 대신 프로세스 내 공유 FakeServer 사용
+        def __init__(self, *args, **kwargs):
+            super().__init__(server=_server, decode_responses=kwargs.get("decode_responses", False))
+
+    class _FakeAsyncRedis(fakeredis.FakeAsyncRedis):
+        def __init__(self, *args, **kwargs):
+            super().__init__(server=_server, decode_responses=kwargs.get("decode_responses", False))
+
+    redis.StrictRedis = redis.Redis = _FakeRedis
+    redis.asyncio.StrictRedis = redis.asyncio.Redis = _FakeAsyncRedis
+
+
+@pytest.fixture(autouse=True)
+def flush_redis():
+    if fakeredis is not None:
+        _FakeRedis().flushall()
+    yield
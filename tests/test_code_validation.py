@@ -0,0 +1,73 @@
+import base64
+import tracemalloc
+
+import flask
+import pytest
+
+from blueprint import job_bp
+from blueprint.helper import validate_code, _CODE_VALIDATION_CHUNK_SIZE
+from config import JobConfig
+
+
+FORMAT_ERROR = ("'code' field is not in a valid format", 400)
+# 청크 하나(base64)를 디코딩한 바이트 수
+DECODED_CHUNK_BYTES = _CODE_VALIDATION_CHUNK_SIZE // 4 * 3
+
+
+def _encode(source: bytes) -> str:
+    return base64.b64encode(source).decode("ascii")
+
+
+def test_valid_code_spanning_several_chunks():
+    assert validate_code(_encode(b"print(1)\n" * (3 * DECODED_CHUNK_BYTES // 9 + 1))) is None
+
+
+@pytest.mark.parametrize("padding", [1, 2])
+def test_padding_is_accepted_only_at_end(padding):
+    source = b"a" * (2 * DECODED_CHUNK_BYTES) + b"x" * (3 - padding)
+    code = _encode(source)
+    assert code.endswith("=" * padding)
+    assert validate_code(code) is None
+
+    # 마지막 청크의 패딩 뒤에 다른 문자가 있거나, 마지막 청크 이전에 패딩이 있으면 형식 오류
+    assert validate_code(code[:-4] + "a=b=") == FORMAT_ERROR
+    assert validate_code(code[:-4] + "===a") == FORMAT_ERROR
+    assert validate_code(_encode(b"x") + code) == FORMAT_ERROR
+
+
+def test_multibyte_character_split_across_chunk_boundary():
+    # '가'(UTF-8 3바이트)의 첫 바이트가 첫 번째 청크의 마지막 바이트가 되도록 배치
+    source = b"a" * (DECODED_CHUNK_BYTES - 1) + "가".encode("utf-8") + b"\n"
+    assert validate_code(_encode(source)) is None
+
+    # 마지막 청크에서 잘린 멀티바이트 문자, UTF-8이 아닌 바이트는 형식 오류
+    assert validate_code(_encode(source[:DECODED_CHUNK_BYTES + 1])) == FORMAT_ERROR
+    assert validate_code(_encode(b"a" * DECODED_CHUNK_BYTES + b"\xff")) == FORMAT_ERROR
+
+
+def test_blank_and_oversize_code_are_rejected():
+    assert validate_code(_encode(b" \n\t" * DECODED_CHUNK_BYTES)) == ("Empty source file", 400)
+    assert validate_code(_encode(b"a" * (JobConfig.MAX_CODE_BYTES + 1))) == ("Source code size exceeds 1MB", 400)
+
+
+def test_oversize_request_body_is_rejected_with_413():
+    app = flask.Flask(__name__)
+    app.config["MAX_CONTENT_LENGTH"] = JobConfig.MAX_REQUEST_BODY_BYTES
+    app.register_blueprint(job_bp, url_prefix="/job")
+
+    response = app.test_client().post(
+        "/job/create", data=b"a" * (JobConfig.MAX_REQUEST_BODY_BYTES + 1), content_type="application/json"
+    )
+    assert response.status_code == 413
+
+
+def test_peak_memory_is_bounded_by_chunk_size():
+    # 1MB 코드를 검증해도 추가 메모리 사용량은 청크 크기에 비례 (코드 전체를 디코딩하면 수 MB)
+    code = _encode(("print('가나다')\n" * (JobConfig.MAX_CODE_BYTES // 20)).encode("utf-8"))
+    tracemalloc.start()
+    try:
+        assert validate_code(code) is None
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 8 * _CODE_VALIDATION_CHUNK_SIZE
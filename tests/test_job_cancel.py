@@ -0,0 +1,106 @@
+import base64
+import hashlib
+import hmac
+import os
+import time
+from unittest import mock
+
+import flask
+import pytest
+from flask.testing import FlaskClient
+
+from blueprint import job_bp
+from celeryutil import celery_client
+from common import CodeLanguage
+from redisutil.repository import job_repository, JobCancelListener
+from schema.job import CodeChallengeJudgmentJob as Job
+
+
+USER_ID = 7
+CLIENT_ID = "test-client"
+
+
+@pytest.fixture
+def client() -> FlaskClient:
+    app = flask.Flask(__name__)
+    app.register_blueprint(job_bp, url_prefix="/job")
+    return app.test_client()
+
+
+@pytest.fixture
+def listener() -> JobCancelListener:
+    # 워커 프로세스와 같이 저장소의 Redis 클라이언트로 중지 요청을 구독
+    listener = JobCancelListener(job_repository._redis_client)
+    listener.start()
+    yield listener
+    listener.close()
+
+
+@pytest.fixture
+def revoke():
+    with mock.patch.object(celery_client.control, "revoke") as revoke:
+        yield revoke
+
+
+def _api_key_headers() -> dict:
+    digest = hmac.new(os.environ["API_SECRET_KEY"].encode("utf-8"), CLIENT_ID.encode("utf-8"), hashlib.sha256).digest()
+    return {"X-Api-Key": base64.urlsafe_b64encode(digest).decode("utf-8"), "X-Client-Id": CLIENT_ID}
+
+
+def _save_job() -> Job:
+    job = Job.create(CodeLanguage.PYTHON3, "cHJpbnQoMSk=", 1, 5)
+    assert job_repository.save(USER_ID, job, 60) == 1
+    return job
+
+
+def _cancel(client: FlaskClient, job_id: str) -> flask.Response:
+    return client.post("/job/cancel", json={"userId": USER_ID, "jobId": job_id}, headers=_api_key_headers())
+
+
+def test_cancel_reaches_running_worker_and_revokes_task(client, listener, revoke):
+    job = _save_job()
+    cancelled = listener.watch(job.job_id)
+    assert not cancelled.is_set()
+
+    started_at = time.monotonic()
+    assert _cancel(client, job.job_id).status_code == 202
+    # 실행 중인 워커는 작업을 다시 조회하지 않고 Pub/Sub 메시지로 중지 요청을 전달받음
+    assert cancelled.wait(timeout=2.0)
+    assert time.monotonic() - started_at < 2.0
+
+    assert job_repository.is_cancelled(job.job_id)
+    assert job_repository.find_by_job_id(job.job_id).stop_flag is True
+    # 태스크 ID는 작업 ID이므로 아직 시작되지 않은 태스크는 작업 ID로 취소
+    revoke.assert_called_once_with(job.job_id)
+    listener.unwatch(job.job_id)
+
+
+def test_cancel_before_watch_is_seen_through_cancel_key(client, listener, revoke):
+    # 워커가 작업을 시작하기 전에 발행된 중지 요청은 중지 요청 키("job-cancel:{job_id}")로 확인
+    job = _save_job()
+    assert _cancel(client, job.job_id).status_code == 202
+    assert job_repository._redis_client.exists(f"job-cancel:{job.job_id}") == 1
+
+    assert listener.watch(job.job_id).is_set()
+    revoke.assert_called_once_with(job.job_id)
+    listener.unwatch(job.job_id)
+
+
+def test_cancel_of_other_users_job_is_not_published(client, listener, revoke):
+    job = _save_job()
+    cancelled = listener.watch(job.job_id)
+    response = client.post("/job/cancel", json={"userId": USER_ID + 1, "jobId": job.job_id}, headers=_api_key_headers())
+
+    assert response.status_code == 404
+    assert not cancelled.wait(timeout=0.2)
+    assert not job_repository.is_cancelled(job.job_id)
+    revoke.assert_not_called()
+    listener.unwatch(job.job_id)
+
+
+def test_revoke_failure_does_not_fail_cancel(client, listener, revoke):
+    # 취소 요청 전송이 실패해도 워커는 중지 요청 키로 중지 여부를 확인하므로 202 응답
+    revoke.side_effect = ConnectionError("broker unavailable")
+    job = _save_job()
+    assert _cancel(client, job.job_id).status_code == 202
+    assert job_repository.is_cancelled(job.job_id)
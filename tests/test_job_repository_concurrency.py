@@ -0,0 +1,102 @@
+import threading
+
+from common import CodeLanguage
+from redisutil.repository import job_repository
+from schema import Verdict
+from schema.job import CodeChallengeJudgmentJob as Job
+
+
+USER_ID = 7
+
+
+def _create_job(total_test_cases: int = 5) -> Job:
+    return Job.create(CodeLanguage.PYTHON3, "cHJpbnQoMSk=", 1, total_test_cases)
+
+
+def _run_together(*targets):
+    """모든 스레드가 준비된 뒤 동시에 시작하여, 각 target을 별도 스레드에서 실행한다."""
+    barrier = threading.Barrier(len(targets))
+
+    def _run(target):
+        barrier.wait()
+        target()
+
+    threads = [threading.Thread(target=_run, args=(target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_cancel_and_verdict_updates_keep_both_writes():
+    # 워커의 verdicts 갱신과 /job/cancel의 stop_flag 갱신이 동시에 실행되어도 어느 쪽도 유실되지 않아야 함
+    verdict_count = 50
+    for _ in range(10):
+        job = _create_job(verdict_count)
+        assert job_repository.save(USER_ID, job, 60) == 1
+
+        def _write_verdicts():
+            for count in range(1, verdict_count + 1):
+                job_repository.update(
+                    job.job_id, user_id=USER_ID, verdicts=[Verdict(True, index) for index in range(count)]
+                )
+
+        def _cancel():
+            job_repository.update(job.job_id, user_id=USER_ID, stop_flag=True)
+
+        _run_together(_write_verdicts, _cancel)
+
+        saved_job = job_repository.find_by_job_id(job.job_id)
+        assert saved_job.stop_flag is True
+        assert len(saved_job.verdicts) == verdict_count
+        assert job_repository.is_cancelled(job.job_id)
+
+
+def test_concurrent_verdict_appends_are_not_lost():
+    job = _create_job(40)
+    job_repository.save(USER_ID, job, 60)
+
+    def _append(start: int):
+        return lambda: [
+            job_repository.append_verdicts(job.job_id, [Verdict(True, index)], user_id=USER_ID)
+            for index in range(start, start + 10)
+        ]
+
+    _run_together(*[_append(start) for start in range(0, 40, 10)])
+
+    saved_job = job_repository.find_by_job_id(job.job_id)
+    assert sorted(verdict["testCaseIndex"] for verdict in saved_job.verdicts) == list(range(40))
+    # 진행 상황 스트림에도 같은 수의 평가 결과가 순서대로 기록됨
+    batch = job_repository.read_verdict_stream(USER_ID, job.job_id, count=100)
+    assert len(batch.verdicts) == 40
+    assert batch.cursor == "40-0"
+
+
+def test_concurrent_creates_respect_max_user_jobs():
+    # 개수 확인과 저장이 원자적이므로 동시에 저장해도 제한을 넘지 않아야 함
+    max_user_jobs = 5
+    results = []
+
+    def _save():
+        results.append(job_repository.save(USER_ID, _create_job(), 60, max_user_jobs=max_user_jobs))
+
+    _run_together(*[_save for _ in range(20)])
+
+    assert results.count(1) == max_user_jobs
+    assert results.count(-2) == 20 - max_user_jobs
+    assert job_repository.count_by_user_id(USER_ID) == max_user_jobs
+
+
+def test_save_many_respects_max_user_jobs():
+    results = job_repository.save_many([(USER_ID, _create_job(), 60) for _ in range(4)], max_user_jobs=3)
+    assert results == [1, 1, 1, -2]
+    # 제한 없이(관리자 모드) 저장하면 제한을 적용하지 않음
+    assert job_repository.save_many([(USER_ID, _create_job(), 60)]) == [1]
+    assert job_repository.count_by_user_id(USER_ID) == 4
+
+
+def test_saving_same_job_again_is_not_limited():
+    job = _create_job()
+    assert job_repository.save(USER_ID, job, 60, max_user_jobs=1) == 1
+    assert job_repository.save(USER_ID, job, 60, max_user_jobs=1) == 1
+    assert job_repository.save(USER_ID, _create_job(), 60, max_user_jobs=1) == -2
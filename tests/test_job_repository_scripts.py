@@ -0,0 +1,112 @@
+import pytest
+
+from common import CodeLanguage
+from config import TestCaseConfig
+from redisutil import RedisConnection
+from redisutil.repository.code_challenge_judgment_job_repository import CodeChallengeJudgmentJobRepository
+from schema import Verdict
+from schema.job import CodeChallengeJudgmentJob as Job
+
+
+USER_ID = 7
+CODE = "cHJpbnQoMSk="
+
+
+@pytest.fixture
+def repository() -> CodeChallengeJudgmentJobRepository:
+    # 코드 중복 제거, 채점 결과 캐시를 사용하는 저장소 (스크립트가 공유 blob, 캐시 키를 KEYS로 전달받는 경로)
+    return CodeChallengeJudgmentJobRepository(
+        RedisConnection("localhost", 6379, "", 0, pool_name="test"), code_dedup=True, verdict_cache_ttl=60
+    )
+
+
+def _create_job(code: str = CODE, total_test_cases: int = 3, test_case_config_version: str = None) -> Job:
+    version = test_case_config_version or TestCaseConfig.current().version
+    return Job.create(CodeLanguage.PYTHON3, code, 1, total_test_cases, test_case_config_version=version)
+
+
+def _code_blob_keys(repository) -> list:
+    return list(repository._redis_client.scan_iter("code-blob:*"))
+
+
+def test_shared_code_blob_is_read_and_released_through_declared_keys(repository):
+    first, second = _create_job(), _create_job()
+    assert repository.save_many([(USER_ID, first, 60), (USER_ID, second, 60)]) == [1, 1]
+    assert len(_code_blob_keys(repository)) == 1
+
+    assert repository.find_by_user_id_and_job_id(USER_ID, first.job_id).code == CODE
+    assert [job.code for job in repository.find_many([(USER_ID, first.job_id), (USER_ID, second.job_id)])] == [CODE, CODE]
+
+    assert repository.delete(first.job_id, USER_ID) == 1
+    assert len(_code_blob_keys(repository)) == 1
+    assert repository.delete_many([(USER_ID, second.job_id)]) == [1]
+    assert _code_blob_keys(repository) == []
+
+
+def test_saving_same_job_with_other_code_releases_previous_blob(repository):
+    job = _create_job()
+    repository.save(USER_ID, job, 60)
+    changed_job = Job.create_from_dict({**job.as_dict(), "code": "eA=="})
+
+    assert repository.save(USER_ID, changed_job, 60) == 1
+    assert len(_code_blob_keys(repository)) == 1
+    assert repository.find_by_job_id(job.job_id).code == "eA=="
+
+
+def test_completed_verdicts_are_copied_to_cache(repository):
+    job = _create_job(total_test_cases=3)
+    repository.save(USER_ID, job, 60)
+    repository.append_verdicts(job.job_id, [Verdict(True, 0), Verdict(True, 1)], USER_ID)
+    assert repository.find_cached_verdicts(job) is None
+
+    repository.append_verdicts(job.job_id, [Verdict(False, 2)], USER_ID)
+    assert [verdict.passed for verdict in repository.find_cached_verdicts(_create_job())] == [True, True, False]
+
+
+def test_job_without_retained_config_snapshot_is_not_cached(repository):
+    # 어떤 테스트 케이스로 채점했는지 알 수 없는 작업의 결과는 캐시하지 않음
+    for job in (Job.create(CodeLanguage.PYTHON3, CODE, 1, 1), _create_job(total_test_cases=1, test_case_config_version="unknown")):
+        repository.save(USER_ID, job, 60)
+        repository.append_verdicts(job.job_id, [Verdict(True, 0)], USER_ID)
+        assert repository.find_cached_verdicts(job) is None
+    assert list(repository._redis_client.scan_iter("verdict-cache:*")) == []
+
+
+def test_cancelled_job_is_not_cached(repository):
+    job = _create_job(total_test_cases=1)
+    repository.save(USER_ID, job, 60)
+    repository.update(job.job_id, USER_ID, stop_flag=True)
+    repository.append_verdicts(job.job_id, [Verdict(True, 0)], USER_ID)
+    assert repository.find_cached_verdicts(job) is None
+
+
+def test_out_of_sync_verdict_stream_is_rebuilt(repository):
+    job = _create_job()
+    repository.save(USER_ID, job, 60)
+    repository._redis_client.xadd(repository._job_verdict_stream_key(USER_ID, job.job_id), {"verdict": "x"}, id="9-0")
+
+    assert repository.append_verdicts(job.job_id, [Verdict(True, 0)], USER_ID) == 1
+    batch = repository.read_verdict_stream(USER_ID, job.job_id)
+    assert batch.cursor == "1-0"
+    assert len(batch.verdicts) == 1
+    assert len(repository.find_by_job_id(job.job_id).verdicts) == 1
+
+
+def test_repeated_append_does_not_duplicate_verdicts(repository):
+    # 재시도로 같은 평가 결과가 다시 추가되어도 목록과 스트림에 한 번만 기록되어야 함
+    job = _create_job(total_test_cases=3)
+    repository.save(USER_ID, job, 60)
+    for _ in range(2):
+        repository.append_verdicts(job.job_id, [Verdict(True, 0), Verdict(True, 1)], USER_ID)
+    repository.append_verdicts(job.job_id, [Verdict(True, 1), Verdict(False, 2)], USER_ID)
+
+    assert [verdict["testCaseIndex"] for verdict in repository.find_by_job_id(job.job_id).verdicts] == [0, 1, 2]
+    batch = repository.read_verdict_stream(USER_ID, job.job_id)
+    assert [verdict.test_case_index for verdict in batch.verdicts] == [0, 1, 2]
+    assert batch.cursor == "3-0"
+    assert [verdict.passed for verdict in repository.find_cached_verdicts(_create_job())] == [True, True, False]
+
+    # 전체 교체 후에는 교체된 목록 기준으로 확인
+    repository.update(job.job_id, USER_ID, verdicts=[Verdict(True, 0)])
+    repository.append_verdicts(job.job_id, [Verdict(True, 0), Verdict(True, 1)], USER_ID)
+    assert [verdict["testCaseIndex"] for verdict in repository.find_by_job_id(job.job_id).verdicts] == [0, 1]
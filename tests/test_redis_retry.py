@@ -0,0 +1,193 @@
+import asyncio
+import time
+
+import pytest
+import redis
+
+from common import CodeLanguage
+from redisutil import (
+    RedisConnection, RedisUnavailableError, RetryPolicy, CircuitBreaker, start_retry_deadline, clear_retry_deadline
+)
+from redisutil.repository.code_challenge_judgment_job_repository import CodeChallengeJudgmentJobRepository
+from schema import Verdict
+from schema.job import CodeChallengeJudgmentJob as Job
+
+
+class _FailingCall:
+    """처음 failures번은 error를 발생시키고, 이후에는 result를 반환하는 Redis 호출 대역"""
+
+    def __init__(self, error: BaseException = None, failures: int = 0, result="OK"):
+        self._error = error
+        self._failures = failures
+        self._result = result
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        if self.calls <= self._failures:
+            raise self._error
+        return self._result
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _retry_policy(circuit_breaker: CircuitBreaker = None, max_attempts: int = 5, deadline_seconds: float = 1.0) -> RetryPolicy:
+    return RetryPolicy(
+        "test", max_attempts=max_attempts, base_delay=0.001, max_delay=0.01,
+        deadline_seconds=deadline_seconds, circuit_breaker=circuit_breaker
+    )
+
+
+@pytest.mark.parametrize("error", [
+    redis.exceptions.ConnectionError("connection reset"),
+    redis.exceptions.TimeoutError("timeout"),
+    redis.exceptions.ReadOnlyError("readonly"),
+])
+def test_transient_errors_are_retried(error):
+    call = _FailingCall(error, failures=2)
+    assert _retry_policy().call(call) == "OK"
+    assert call.calls == 3
+
+
+@pytest.mark.parametrize("error", [
+    redis.exceptions.ResponseError("WRONGTYPE"),
+    redis.exceptions.AuthenticationError("invalid password"),
+    ValueError("decode error"),
+])
+def test_non_transient_errors_are_not_retried(error):
+    call = _FailingCall(error, failures=5)
+    with pytest.raises(type(error)):
+        _retry_policy().call(call)
+    assert call.calls == 1
+
+
+def test_retries_stop_at_request_deadline():
+    # 재시도 횟수가 남아 있어도 요청 단위 마감 시각이 지나면 RedisUnavailableError로 실패
+    call = _FailingCall(redis.exceptions.TimeoutError("timeout"), failures=10_000)
+    policy = RetryPolicy("test", max_attempts=10_000, base_delay=0.01, max_delay=0.01, deadline_seconds=60)
+    start_retry_deadline(0.1)
+    started_at = time.monotonic()
+    try:
+        with pytest.raises(RedisUnavailableError):
+            policy.call(call)
+    finally:
+        clear_retry_deadline()
+    assert time.monotonic() - started_at < 0.2
+    assert 1 < call.calls < 10_000
+
+
+def test_gives_up_after_max_attempts():
+    call = _FailingCall(redis.exceptions.ConnectionError("connection refused"), failures=10)
+    with pytest.raises(RedisUnavailableError):
+        _retry_policy(max_attempts=3).call(call)
+    assert call.calls == 3
+
+
+def test_circuit_opens_half_opens_and_closes():
+    clock = _Clock()
+    circuit_breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=5, clock=clock)
+    policy = _retry_policy(circuit_breaker, max_attempts=1)
+
+    failing = _FailingCall(redis.exceptions.ConnectionError("connection refused"), failures=10)
+    for _ in range(2):
+        with pytest.raises(RedisUnavailableError):
+            policy.call(failing)
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+
+    # open: reset_timeout 동안은 호출하지 않고 바로 실패
+    succeeding = _FailingCall()
+    with pytest.raises(RedisUnavailableError):
+        policy.call(succeeding)
+    assert succeeding.calls == 0
+
+    # half-open: 시험 호출 하나만 허용하고, 시험 호출이 실패하면 다시 open
+    clock.now = 5
+    with pytest.raises(RedisUnavailableError):
+        policy.call(failing)
+    assert circuit_breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 10
+    assert circuit_breaker.allow()
+    assert circuit_breaker.state == CircuitBreaker.HALF_OPEN
+    assert not circuit_breaker.allow()
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+    assert policy.call(succeeding) == "OK"
+
+
+def test_cancelled_probe_does_not_keep_circuit_open():
+    # 시험 호출이 취소되어도 다음 호출을 다시 시험으로 보내야 함 (프로세스를 재시작할 때까지 막히지 않아야 함)
+    clock = _Clock()
+    circuit_breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=5, clock=clock)
+    policy = _retry_policy(circuit_breaker, max_attempts=1)
+    with pytest.raises(RedisUnavailableError):
+        policy.call(_FailingCall(redis.exceptions.ConnectionError("connection refused"), failures=1))
+    clock.now = 5
+
+    async def _cancelled_probe():
+        raise asyncio.CancelledError()
+
+    async def _succeeding_call():
+        return "OK"
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(policy.call_async(_cancelled_probe))
+    assert circuit_breaker.state == CircuitBreaker.HALF_OPEN
+    assert asyncio.run(policy.call_async(_succeeding_call)) == "OK"
+    assert circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+def test_repository_retries_transient_script_failure(monkeypatch):
+    # 저장소 호출 중 연결이 끊겨도(장애 주입) 재시도로 저장과 조회가 성공해야 함
+    repository = CodeChallengeJudgmentJobRepository(
+        RedisConnection("localhost", 6379, "", 0, pool_name="test"), retry_policy=_retry_policy()
+    )
+    redis_client = repository._redis_client
+    execute_command = redis_client.execute_command
+    calls = []
+
+    def _execute_command(*args, **kwargs):
+        calls.append(args[0])
+        if len(calls) == 1:
+            raise redis.exceptions.ConnectionError("connection reset")
+        return execute_command(*args, **kwargs)
+
+    monkeypatch.setattr(redis_client, "execute_command", _execute_command)
+    job = Job.create(CodeLanguage.PYTHON3, "cHJpbnQoMSk=", 1, 1)
+    assert repository.save(7, job, 60) == 1
+    assert len(calls) > 1
+    assert repository.find_by_job_id(job.job_id).job_id == job.job_id
+
+
+def test_retried_append_after_lost_reply_is_not_duplicated(monkeypatch):
+    # 서버가 스크립트를 실행한 뒤 응답을 받지 못한 경우(타임아웃) 재시도해도 평가 결과가 중복 기록되지 않아야 함
+    repository = CodeChallengeJudgmentJobRepository(
+        RedisConnection("localhost", 6379, "", 0, pool_name="test"), retry_policy=_retry_policy()
+    )
+    job = Job.create(CodeLanguage.PYTHON3, "cHJpbnQoMSk=", 1, 2)
+    repository.save(7, job, 60)
+
+    redis_client = repository._redis_client
+    execute_command = redis_client.execute_command
+    lost_replies = []
+
+    def _execute_command(*args, **kwargs):
+        result = execute_command(*args, **kwargs)
+        if args[0] == "EVALSHA" and not lost_replies:
+            lost_replies.append(result)
+            raise redis.exceptions.TimeoutError("Timeout reading from socket")
+        return result
+
+    monkeypatch.setattr(redis_client, "execute_command", _execute_command)
+    assert repository.append_verdicts(job.job_id, [Verdict(True, 0), Verdict(False, 1)], 7) == 1
+    assert lost_replies == [1]
+    monkeypatch.undo()
+
+    assert [verdict["testCaseIndex"] for verdict in repository.find_by_job_id(job.job_id).verdicts] == [0, 1]
+    assert len(repository.read_verdict_stream(7, job.job_id).verdicts) == 2
@@ -0,0 +1,4 @@
+from .span import Span, SpanContext, SpanKind, SpanStatusCode
+from .exporter import SpanExporter, InMemorySpanExporter, FileSpanExporter
+from .tracer import Tracer, TRACEPARENT_HEADER
+from .client import tracer
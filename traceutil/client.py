@@ -0,0 +1,23 @@
+from typing import Optional
+
+from config import TracingConfig
+from .exporter import FileSpanExporter, InMemorySpanExporter, SpanExporter
+from .tracer import Tracer
+
+
+def _create_exporter(name: str) -> Optional[SpanExporter]:
+    if name == "none":
+        return None
+    if name == "memory":
+        return InMemorySpanExporter(max_spans=TracingConfig.MEMORY_MAX_SPANS)
+    if name == "file":
+        return FileSpanExporter(TracingConfig.FILE_PATH)
+    raise ValueError(f"TRACING_EXPORTER must be 'none', 'memory' or 'file', got '{name}'")
+
+
+# API 서버(동기/비동기 블루프린트, 저장소, 태스크 등록)가 공유하는 tracer
+tracer = Tracer(
+    TracingConfig.SERVICE_NAME,
+    exporter=_create_exporter(TracingConfig.EXPORTER),
+    sample_ratio=TracingConfig.SAMPLE_RATIO
+)
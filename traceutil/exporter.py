@@ -0,0 +1,64 @@
+import collections
+import json
+import threading
+from typing import Any, Optional
+
+
+class SpanExporter:
+    """
+    Description:
+        종료된 스팬(Span.as_dict() 형식)을 내보내는 클래스의 기본 클래스.
+        요청 처리 스레드에서 호출되므로, 외부 수집기(collector)로 전송하지 않고 로컬에 바로 기록하는 구현만 제공한다.
+    """
+
+    def export(self, span: dict[str, Any]):
+        raise NotImplementedError
+
+    def shutdown(self):
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """
+    Description:
+        종료된 스팬을 최근 max_spans개까지 메모리에 보관하는 exporter. (테스트, 로컬 확인용 /test/traces)
+    """
+
+    def __init__(self, max_spans: int = 10000):
+        self._spans: collections.deque = collections.deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, span: dict[str, Any]):
+        with self._lock:
+            self._spans.append(span)
+
+    def get_finished_spans(self, trace_id: Optional[str] = None) -> list[dict[str, Any]]:
+        """보관 중인 스팬을 종료 순서대로 반환한다. (trace_id를 지정하면 해당 트레이스의 스팬만 반환)"""
+        with self._lock:
+            return [span for span in self._spans if trace_id is None or span["traceId"] == trace_id]
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    Description:
+        종료된 스팬을 파일에 한 줄에 하나씩(JSON Lines) 추가하는 exporter.
+        여러 프로세스(gunicorn 워커 등)가 같은 파일에 기록할 수 있도록 추가 모드로 열고 줄 단위로 flush 한다.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+
+    def export(self, span: dict[str, Any]):
+        line = json.dumps(span, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def shutdown(self):
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,145 @@
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Optional
+
+
+class SpanKind(Enum):
+    """OpenTelemetry SpanKind"""
+    INTERNAL = "SPAN_KIND_INTERNAL"
+    SERVER = "SPAN_KIND_SERVER" # API 요청 처리
+    CLIENT = "SPAN_KIND_CLIENT" # Redis 호출
+    PRODUCER = "SPAN_KIND_PRODUCER" # Celery 태스크 등록
+    CONSUMER = "SPAN_KIND_CONSUMER" # 워커의 태스크 실행
+
+
+class SpanStatusCode(Enum):
+    """OpenTelemetry StatusCode"""
+    UNSET = "STATUS_CODE_UNSET"
+    OK = "STATUS_CODE_OK"
+    ERROR = "STATUS_CODE_ERROR"
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """
+    Description:
+        프로세스 경계를 넘어 전달되는 스팬 식별 정보. (W3C Trace Context의 traceparent 헤더로 전달)
+
+    Attributes:
+        trace_id (str): 32자리 16진수 트레이스 ID (요청 하나의 전체 흐름)
+        span_id (str): 16자리 16진수 스팬 ID
+        sampled (bool): 스팬을 기록(내보내기)할지 여부 (트레이스 시작 시 결정, 하위 스팬과 워커에 그대로 전달)
+    """
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+    def to_traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    @classmethod
+    def from_traceparent(cls, traceparent: str) -> Optional["SpanContext"]:
+        """traceparent 헤더 값을 SpanContext로 변환한다. (형식이 올바르지 않으면 None)"""
+        parts = traceparent.strip().split("-")
+        if len(parts) < 4 or len(parts[0]) != 2 or parts[0] == "ff" or len(parts[1]) != 32 or len(parts[2]) != 16:
+            return None
+        try:
+            trace_flags = int(parts[3][:2], 16)
+            if int(parts[1], 16) == 0 or int(parts[2], 16) == 0:
+                return None
+        except ValueError:
+            return None
+        return cls(trace_id=parts[1].lower(), span_id=parts[2].lower(), sampled=bool(trace_flags & 0x01))
+
+
+@dataclass
+class Span:
+    """
+    Description:
+        처리 구간 하나(API 요청, 저장소 메서드, 태스크 등록 등)의 시작/종료 시각과 속성.
+        end() 호출 시 샘플링된 스팬이면 exporter로 전달된다.
+
+    Attributes:
+        name (str): 스팬 이름 (ex. POST /job/create, JobRepository.save)
+        context (SpanContext): 스팬 식별 정보
+        parent_span_id (Optional[str]): 부모 스팬 ID (트레이스의 첫 스팬이면 None)
+        kind (SpanKind): 스팬 종류
+        attributes (dict[str, Any]): 스팬 속성 (OpenTelemetry semantic conventions 이름 사용, ex. http.route)
+        start_time_unix_nano (int): 시작 시각 (Unix time, 나노초)
+        end_time_unix_nano (int): 종료 시각 (Unix time, 나노초, 종료 전이면 0)
+        status_code (SpanStatusCode): 처리 결과
+        status_message (str): 오류 메시지 (status_code가 ERROR인 경우)
+    """
+    name: str
+    context: SpanContext
+    parent_span_id: Optional[str] = None
+    kind: SpanKind = SpanKind.INTERNAL
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_time_unix_nano: int = field(default_factory=time.time_ns)
+    end_time_unix_nano: int = 0
+    status_code: SpanStatusCode = SpanStatusCode.UNSET
+    status_message: str = ""
+    _on_end: Any = field(default=None, repr=False) # 종료 시 호출할 함수 (Tracer가 설정)
+
+    @property
+    def is_recording(self) -> bool:
+        return self.context.sampled
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_status(self, status_code: SpanStatusCode, message: str = ""):
+        self.status_code = status_code
+        self.status_message = message
+
+    def record_exception(self, ex: BaseException):
+        self.attributes["exception.type"] = type(ex).__name__
+        self.attributes["exception.message"] = str(ex)
+        self.set_status(SpanStatusCode.ERROR, str(ex))
+
+    def end(self):
+        if self.end_time_unix_nano:
+            return
+        self.end_time_unix_nano = time.time_ns()
+        if self._on_end is not None:
+            self._on_end(self)
+
+    def as_dict(self, resource: dict[str, Any] = None) -> dict:
+        """OTLP JSON의 span 필드 이름을 사용한 dict (attributes는 key-value 목록 대신 dict)"""
+        data = {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "name": self.name,
+            "kind": self.kind.value,
+            "startTimeUnixNano": self.start_time_unix_nano,
+            "endTimeUnixNano": self.end_time_unix_nano,
+            "attributes": self.attributes,
+            "status": {"code": self.status_code.value},
+        }
+        if self.parent_span_id:
+            data["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            data["status"]["message"] = self.status_message
+        if resource:
+            data["resource"] = resource
+        return data
+
+
+class _NonRecordingSpan(Span):
+    """트레이싱을 사용하지 않을 때 반환하는 스팬 (속성, 상태 변경과 종료를 모두 무시)"""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_status(self, status_code: SpanStatusCode, message: str = ""):
+        pass
+
+    def record_exception(self, ex: BaseException):
+        pass
+
+    def end(self):
+        pass
+
+
+NON_RECORDING_SPAN = _NonRecordingSpan(name="", context=SpanContext(trace_id="0" * 32, span_id="0" * 16, sampled=False))
@@ -0,0 +1,137 @@
+import contextlib
+import random
+from contextvars import ContextVar, Token
+from typing import Any, Iterator, Mapping, Optional
+
+from .exporter import SpanExporter
+from .span import NON_RECORDING_SPAN, Span, SpanContext, SpanKind
+
+
+# W3C Trace Context 헤더 이름 (HTTP 요청 헤더, Celery 태스크 메시지 헤더 공통)
+TRACEPARENT_HEADER = "traceparent"
+
+# 현재 실행 중인 스팬 (스레드, 코루틴 컨텍스트별)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    Description:
+        OpenTelemetry 트레이싱 API와 같은 방식(start_as_current_span, W3C traceparent 전파)으로 스팬을 기록하는 클래스.
+        - 부모를 지정하지 않으면 현재 스팬(없으면 새 트레이스)의 하위 스팬으로 생성
+        - 트레이스 시작 시 sample_ratio 비율로 기록 여부를 정하고, 하위 스팬과 전파된 워커 스팬은 같은 결정을 따름
+        - exporter가 없으면 모든 메서드가 아무 것도 기록하지 않는 스팬(NON_RECORDING_SPAN)을 사용 (트레이싱 미사용)
+    """
+
+    def __init__(self,
+        service_name: str,
+        exporter: Optional[SpanExporter] = None,
+        sample_ratio: float = 1.0
+    ):
+        self._resource = {"service.name": service_name}
+        self._exporter = exporter
+        self._sample_ratio = sample_ratio
+
+    @property
+    def enabled(self) -> bool:
+        return self._exporter is not None
+
+    @property
+    def exporter(self) -> Optional[SpanExporter]:
+        return self._exporter
+
+    def start_span(self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: dict[str, Any] = None,
+        parent: Optional[SpanContext] = None
+    ) -> Span:
+        """
+        스팬을 시작한다. (현재 스팬으로 설정하지 않음, 하위 스팬의 부모로 사용하려면 attach() 호출)
+        parent: 다른 프로세스에서 전달받은 부모 스팬 (None이면 현재 스팬)
+        """
+        if self._exporter is None:
+            return NON_RECORDING_SPAN
+
+        if parent is None:
+            current_span = _current_span.get()
+            parent = current_span.context if current_span is not None else None
+        if parent is None:
+            context = SpanContext(trace_id=f"{random.getrandbits(128):032x}", span_id=self._new_span_id(),
+                                  sampled=random.random() < self._sample_ratio)
+        else:
+            context = SpanContext(trace_id=parent.trace_id, span_id=self._new_span_id(), sampled=parent.sampled)
+
+        return Span(
+            name=name,
+            context=context,
+            parent_span_id=parent.span_id if parent is not None else None,
+            kind=kind,
+            attributes=dict(attributes) if attributes else {},
+            _on_end=self._export if context.sampled else None
+        )
+
+    @contextlib.contextmanager
+    def start_as_current_span(self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: dict[str, Any] = None,
+        parent: Optional[SpanContext] = None
+    ) -> Iterator[Span]:
+        """
+        스팬을 시작하여 블록 안에서 현재 스팬으로 사용하고, 블록이 끝나면 종료한다.
+        블록에서 예외가 발생하면 스팬에 예외를 기록하고 그대로 전달한다.
+        """
+        span = self.start_span(name, kind, attributes, parent)
+        if span is NON_RECORDING_SPAN:
+            yield span
+            return
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as ex:
+            span.record_exception(ex)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def attach(self, span: Span) -> Optional[Token]:
+        """span을 현재 스팬으로 설정한다. (반환한 토큰을 detach()에 전달하여 이전 스팬으로 되돌림)"""
+        if span is NON_RECORDING_SPAN:
+            return None
+        return _current_span.set(span)
+
+    @staticmethod
+    def detach(token: Optional[Token]):
+        if token is not None:
+            _current_span.reset(token)
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        return _current_span.get()
+
+    def inject(self, headers: dict[str, str]) -> dict[str, str]:
+        """현재 스팬의 traceparent를 headers(HTTP, Celery 메시지 헤더)에 추가한다. (현재 스팬이 없으면 그대로 반환)"""
+        span = _current_span.get()
+        if self._exporter is not None and span is not None:
+            headers[TRACEPARENT_HEADER] = span.context.to_traceparent()
+        return headers
+
+    def extract(self, headers: Optional[Mapping[str, Any]]) -> Optional[SpanContext]:
+        """
+        headers(HTTP 요청 헤더, Celery task.request 헤더)의 traceparent로 부모 스팬 정보를 만든다.
+        (헤더가 없거나 형식이 올바르지 않으면 None, 워커는 이 값을 start_as_current_span(parent=...)에 전달하여 트레이스를 이어감)
+        """
+        if self._exporter is None or not headers:
+            return None
+        traceparent = headers.get(TRACEPARENT_HEADER)
+        return SpanContext.from_traceparent(traceparent) if isinstance(traceparent, str) else None
+
+    def _export(self, span: Span):
+        self._exporter.export(span.as_dict(self._resource))
+
+    @staticmethod
+    def _new_span_id() -> str:
+        return f"{random.getrandbits(64):016x}"
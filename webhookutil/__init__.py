@@ -0,0 +1,3 @@
+from .outbox import CallbackDelivery, CallbackOutbox
+from .dispatcher import CallbackDispatcher, DELIVERY_ID_HEADER
+from .client import callback_outbox, callback_dispatcher
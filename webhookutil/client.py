@@ -0,0 +1,36 @@
+from common import CallbackEventType
+from config import WebhookConfig
+from redisutil.repository import job_repository
+from .dispatcher import CallbackDispatcher
+from .outbox import CallbackOutbox
+
+
+# 워커와 API 서버가 함께 사용하는 콜백 전송기 (전송 스레드는 첫 dispatch() 시점에 시작)
+# 아웃박스는 작업 저장소와 같은 Redis를 사용하므로, 어느 프로세스에서 저장한 콜백이든 다른 프로세스가 이어서 재전송할 수 있음
+# (별도 커넥션 풀을 만들지 않고 작업 저장소의 커넥션 풀을 함께 사용)
+callback_outbox = CallbackOutbox(
+    job_repository._redis_client,
+    key_prefix=WebhookConfig.OUTBOX_KEY_PREFIX,
+    max_dead_letters=WebhookConfig.MAX_DEAD_LETTERS
+)
+
+callback_dispatcher = CallbackDispatcher(
+    callback_outbox,
+    base_url=WebhookConfig.BASE_URL,
+    paths={
+        CallbackEventType.TEST_CASE_RESULT: WebhookConfig.TEST_CASE_RESULTS_PATH,
+        CallbackEventType.JUDGMENT_PASSED: WebhookConfig.JUDGMENT_PASSED_PATH,
+        CallbackEventType.JUDGMENT_UNPASSED: WebhookConfig.JUDGMENT_UNPASSED_PATH,
+        CallbackEventType.ERROR: WebhookConfig.ERROR_PATH,
+    },
+    batch_window_seconds=WebhookConfig.BATCH_WINDOW_SECONDS,
+    max_batch_size=WebhookConfig.MAX_BATCH_SIZE,
+    buffer_size=WebhookConfig.BUFFER_SIZE,
+    connect_timeout=WebhookConfig.CONNECT_TIMEOUT,
+    read_timeout=WebhookConfig.READ_TIMEOUT,
+    pool_maxsize=WebhookConfig.POOL_MAXSIZE,
+    max_attempts=WebhookConfig.MAX_ATTEMPTS,
+    retry_base_seconds=WebhookConfig.RETRY_BASE_SECONDS,
+    retry_max_seconds=WebhookConfig.RETRY_MAX_SECONDS,
+    retry_poll_interval=WebhookConfig.RETRY_POLL_INTERVAL
+)
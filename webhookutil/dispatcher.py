@@ -0,0 +1,277 @@
+import atexit
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from typing import Optional
+
+import redis
+import requests
+from requests.adapters import HTTPAdapter
+
+from common import CallbackEventType
+from schema import Verdict
+from .metrics import CALLBACK_BUFFER_SIZE, CALLBACK_DELIVERY_TOTAL, CALLBACK_EVENT_LATENCY_SECONDS, CALLBACK_BATCH_SIZE
+from .outbox import CallbackDelivery, CallbackOutbox
+
+
+DELIVERY_ID_HEADER = "X-Callback-Delivery-Id"
+
+
+class CallbackDispatcher:
+    """
+    Description:
+        채점 결과 콜백(웹훅)을 Spring Boot 백엔드로 전송하는 클래스. (워커와 API 서버에서 함께 사용)
+        - dispatch()는 전송 대기 버퍼에 넣기만 하며, 별도 스레드가 keep-alive 커넥션 풀(requests.Session)로 전송
+        - 테스트 케이스 별 평가 결과는 batch_window_seconds 동안 모아 하나의 요청({"results": [...]})으로 전송
+          채점 완료(통과/미통과), 에러 이벤트는 모으지 않고 바로 전송하며, 그 전에 모은 평가 결과를 먼저 전송하여 작업 내 순서 유지
+        - 전송에 실패하면(연결 실패, 타임아웃, 429, 5xx) 아웃박스(Redis)에 저장하고, 지터를 적용한 지수 백오프 간격으로 다시 전송
+          재시도할 수 없는 응답(그 외 4xx)을 받거나 max_attempts번 실패하면 dead letter 목록으로 이동
+        - 작업의 평가 결과 콜백이 아웃박스에 남아 있는 동안 해당 작업의 채점 완료, 에러 이벤트도 아웃박스를 거쳐 평가 결과 이후에 전송
+        - 첫 전송 전까지는 메모리에만 있으므로, 그 사이 프로세스가 종료되면 해당 이벤트는 유실될 수 있음
+        - 전송 스레드는 첫 dispatch() 시점에 프로세스마다 시작 (fork 이후 자식 프로세스에는 부모의 스레드와 커넥션이 없음)
+    """
+    _RETRY_CLAIM_SIZE = 10 # 아웃박스에서 한 번에 가져와 다시 전송할 최대 콜백 수
+
+    def __init__(self,
+        outbox: CallbackOutbox,
+        base_url: str,
+        paths: dict[CallbackEventType, str],
+        batch_window_seconds: float,
+        max_batch_size: int,
+        buffer_size: int,
+        connect_timeout: float,
+        read_timeout: float,
+        pool_maxsize: int,
+        max_attempts: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+        retry_poll_interval: float
+    ):
+        self._outbox = outbox
+        self._base_url = base_url.rstrip("/")
+        self._paths = paths
+        self._batch_window_seconds = batch_window_seconds
+        self._max_batch_size = max_batch_size
+        self._buffer_size = buffer_size
+        self._timeout = (connect_timeout, read_timeout)
+        self._pool_maxsize = pool_maxsize
+        self._max_attempts = max_attempts
+        self._retry_base_seconds = retry_base_seconds
+        self._retry_max_seconds = retry_max_seconds
+        self._retry_poll_interval = retry_poll_interval
+
+        self._buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+        self._session: Optional[requests.Session] = None
+        self._start_lock = threading.Lock()
+        self._pid: Optional[int] = None
+        CALLBACK_BUFFER_SIZE.set_function(lambda: self._buffer.qsize())
+
+    def dispatch(self, event_type: CallbackEventType, payload: dict):
+        """
+        콜백 이벤트를 전송 대기 버퍼에 넣는다. (전송 완료를 기다리지 않음)
+        버퍼가 가득 차면 아웃박스에 바로 저장하여 재전송 경로로 전송한다.
+        """
+        self._ensure_started()
+        event = (event_type, payload, time.time())
+        try:
+            self._buffer.put_nowait(event)
+        except queue.Full:
+            CALLBACK_DELIVERY_TOTAL.labels(result="overflow").inc()
+            for delivery in self._create_deliveries([event]):
+                self._save_to_outbox(delivery, time.time())
+
+    def dispatch_judgment(self, job_id: str, verdicts: list[Verdict]):
+        """
+        워커가 채점을 마쳤을 때와 같은 콜백(테스트 케이스 별 평가 결과, 이어서 채점 완료(통과/미통과))을 전송 대기 버퍼에 넣는다.
+        워커에 태스크를 등록하지 않고 채점 결과 캐시로 결과를 기록한 작업에 사용한다.
+        """
+        for verdict in verdicts:
+            self.dispatch(CallbackEventType.TEST_CASE_RESULT, {"jobId": job_id, **verdict.as_dict()})
+        passed = all(verdict.passed for verdict in verdicts)
+        self.dispatch(CallbackEventType.JUDGMENT_PASSED if passed else CallbackEventType.JUDGMENT_UNPASSED, {"jobId": job_id})
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        버퍼에 있는 이벤트의 첫 전송(실패 시 아웃박스 저장)이 끝날 때까지 기다린다.
+
+        Returns:
+            bool: timeout 이내에 모두 처리되었으면 True
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self._buffer.unfinished_tasks:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def _ensure_started(self):
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                # fork 이전 부모 프로세스의 버퍼(잠금 상태 포함)와 커넥션은 자식 프로세스에서 사용하지 않음
+                self._buffer = queue.Queue(maxsize=self._buffer_size)
+            self._session = self._create_session()
+            threading.Thread(target=self._run, name="callback-dispatcher", daemon=True).start()
+            atexit.register(self.flush, 5.0) # 종료 시 버퍼에 남은 이벤트 전송
+            self._pid = os.getpid()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        # 재시도는 아웃박스로 처리하므로 어댑터 자체 재시도는 사용하지 않음
+        adapter = HTTPAdapter(pool_maxsize=self._pool_maxsize, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _run(self):
+        next_retry_poll = time.monotonic()
+        while True:
+            try:
+                first = self._buffer.get(timeout=max(0.0, next_retry_poll - time.monotonic()))
+            except queue.Empty:
+                first = None
+            if first is not None:
+                events = self._collect_batch(first)
+                try:
+                    for delivery in self._create_deliveries(events):
+                        self._attempt(delivery, from_outbox=False)
+                finally:
+                    for _ in events:
+                        self._buffer.task_done()
+            # 버퍼에 이벤트가 계속 들어와도 재전송이 밀리지 않도록 묶음을 전송할 때마다 확인
+            if time.monotonic() >= next_retry_poll:
+                self._retry_due_deliveries()
+                next_retry_poll = time.monotonic() + self._retry_poll_interval
+
+    def _collect_batch(self, first: tuple) -> list[tuple]:
+        """
+        첫 이벤트가 평가 결과이면 batch_window_seconds 동안 평가 결과를 더 모은다.
+        평가 결과가 아닌 이벤트가 들어오면 그 이벤트까지 포함하여 바로 반환한다.
+        """
+        events = [first]
+        if first[0] != CallbackEventType.TEST_CASE_RESULT:
+            return events
+        deadline = time.perf_counter() + self._batch_window_seconds
+        while len(events) < self._max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                event = self._buffer.get(timeout=remaining) if remaining > 0 else self._buffer.get_nowait()
+            except queue.Empty:
+                break
+            events.append(event)
+            if event[0] != CallbackEventType.TEST_CASE_RESULT:
+                break
+        return events
+
+    def _create_deliveries(self, events: list[tuple]) -> list[CallbackDelivery]:
+        """연속된 평가 결과는 하나의 요청으로, 그 외 이벤트는 이벤트마다 하나의 요청으로 구성한다. (이벤트 순서 유지)"""
+        deliveries = []
+        results, results_created_at = [], None
+        for event_type, payload, dispatched_at in events:
+            if event_type == CallbackEventType.TEST_CASE_RESULT:
+                results.append(payload)
+                results_created_at = results_created_at or dispatched_at
+                continue
+            if results:
+                deliveries.append(self._create_results_delivery(results, results_created_at))
+                results, results_created_at = [], None
+            deliveries.append(CallbackDelivery(path=self._paths[event_type], body=payload, created_at=dispatched_at))
+        if results:
+            deliveries.append(self._create_results_delivery(results, results_created_at))
+        return deliveries
+
+    def _create_results_delivery(self, results: list[dict], created_at: float) -> CallbackDelivery:
+        return CallbackDelivery(
+            path=self._paths[CallbackEventType.TEST_CASE_RESULT], body={"results": results},
+            event_count=len(results), created_at=created_at,
+            result_job_ids=list(dict.fromkeys(result["jobId"] for result in results if "jobId" in result))
+        )
+
+    def _retry_due_deliveries(self):
+        try:
+            deliveries = self._outbox.claim_due(
+                self._RETRY_CLAIM_SIZE, lease_seconds=self._RETRY_CLAIM_SIZE * sum(self._timeout)
+            )
+        except redis.exceptions.RedisError:
+            logging.error("[Claiming callbacks from outbox failed]", exc_info=True)
+            return
+        for delivery in deliveries:
+            self._attempt(delivery, from_outbox=True)
+
+    def _attempt(self, delivery: CallbackDelivery, from_outbox: bool):
+        if self._has_pending_results(delivery):
+            # 평가 결과가 모두 전송(또는 dead letter 이동)될 때까지 아웃박스에서 기다림 (전송 시도 횟수에 포함하지 않음)
+            CALLBACK_DELIVERY_TOTAL.labels(result="deferred").inc()
+            self._save_to_outbox(delivery, time.time() + self._retry_poll_interval)
+            return
+        delivery.attempts += 1
+        result = self._send(delivery)
+        CALLBACK_DELIVERY_TOTAL.labels(result=result).inc()
+        try:
+            if result == "sent":
+                CALLBACK_BATCH_SIZE.observe(delivery.event_count)
+                CALLBACK_EVENT_LATENCY_SECONDS.observe(time.time() - delivery.created_at)
+                if from_outbox:
+                    self._outbox.complete(delivery)
+            elif result == "rejected" or delivery.attempts >= self._max_attempts:
+                logging.error(
+                    f"[Callback moved to dead letters. path={delivery.path}, delivery_id={delivery.delivery_id}, "
+                    f"attempts={delivery.attempts}]"
+                )
+                self._outbox.dead_letter(delivery)
+            else:
+                self._outbox.schedule(delivery, time.time() + self._backoff_seconds(delivery.attempts))
+        except redis.exceptions.RedisError:
+            # 아웃박스를 사용할 수 없으면 재전송할 수 없으므로 유실 처리 (아웃박스에서 가져온 콜백은 lease가 지나면 다시 전송됨)
+            CALLBACK_DELIVERY_TOTAL.labels(result="dropped").inc()
+            logging.error(f"[Updating callback outbox failed. delivery_id={delivery.delivery_id}]", exc_info=True)
+
+    def _has_pending_results(self, delivery: CallbackDelivery) -> bool:
+        """평가 결과가 아닌 작업 이벤트(채점 완료, 에러)이고, 같은 작업의 평가 결과 콜백이 아웃박스에 남아 있는지 확인한다."""
+        if delivery.result_job_ids or not isinstance(delivery.body, dict) or "jobId" not in delivery.body:
+            return False
+        try:
+            return self._outbox.has_pending_results(delivery.body["jobId"])
+        except redis.exceptions.RedisError:
+            # 아웃박스를 사용할 수 없으면 기다리지 않고 전송
+            logging.error(f"[Checking pending callbacks failed. delivery_id={delivery.delivery_id}]", exc_info=True)
+            return False
+
+    def _save_to_outbox(self, delivery: CallbackDelivery, due_at: float):
+        try:
+            self._outbox.schedule(delivery, due_at)
+        except redis.exceptions.RedisError:
+            CALLBACK_DELIVERY_TOTAL.labels(result="dropped").inc()
+            logging.error(f"[Saving callback to outbox failed. delivery_id={delivery.delivery_id}]", exc_info=True)
+
+    def _send(self, delivery: CallbackDelivery) -> str:
+        """
+        Returns:
+            str: sent (2xx) | retry (연결 실패, 타임아웃, 429, 5xx) | rejected (그 외 응답, 다시 보내도 실패)
+        """
+        try:
+            response = self._session.post(
+                self._base_url + delivery.path,
+                json=delivery.body,
+                headers={DELIVERY_ID_HEADER: delivery.delivery_id},
+                timeout=self._timeout
+            )
+        except requests.RequestException as ex:
+            logging.warning(f"[Callback delivery failed. path={delivery.path}, attempt={delivery.attempts}: {ex}]")
+            return "retry"
+        if response.status_code < 300:
+            return "sent"
+        logging.warning(
+            f"[Callback delivery failed. path={delivery.path}, attempt={delivery.attempts}, status={response.status_code}]"
+        )
+        return "retry" if response.status_code == 429 or response.status_code >= 500 else "rejected"
+
+    def _backoff_seconds(self, attempts: int) -> float:
+        """지수 백오프 상한 안에서 균등 분포로 고른 대기 시간 (full jitter, 여러 프로세스의 재전송이 한 시점에 몰리지 않도록 함)"""
+        return random.uniform(0, min(self._retry_max_seconds, self._retry_base_seconds * 2 ** (attempts - 1)))
@@ -0,0 +1,18 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# 채점 결과 콜백 전송 메트릭
+CALLBACK_BUFFER_SIZE = Gauge(
+    "callback_buffer_size", "Number of callback events waiting in the in-process dispatch buffer"
+)
+CALLBACK_DELIVERY_TOTAL = Counter(
+    "callback_delivery_total", "Number of callback HTTP deliveries by result", ["result"]
+)
+CALLBACK_EVENT_LATENCY_SECONDS = Histogram(
+    "callback_event_latency_seconds", "Time from dispatching the first event of a callback delivery until it is delivered",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0, 120.0)
+)
+CALLBACK_BATCH_SIZE = Histogram(
+    "callback_batch_size", "Number of callback events sent in one HTTP delivery",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200)
+)
@@ -0,0 +1,155 @@
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Union
+
+import redis
+
+from common import JsonCodec
+
+
+@dataclass
+class CallbackDelivery:
+    """
+    Description:
+        한 번의 HTTP 요청으로 전송할 콜백.
+
+    Attributes:
+        path (str): 콜백 경로 (WebhookConfig.BASE_URL 기준)
+        body (Any): 요청 본문 (JSON)
+        event_count (int): 본문에 포함된 이벤트 수 (묶어서 전송한 평가 결과 수)
+        delivery_id (str): 콜백 식별자 (재전송 시에도 같은 값, 수신 측 중복 처리용 X-Callback-Delivery-Id 헤더로 전달)
+        attempts (int): 전송 시도 횟수
+        created_at (float): 이벤트 발생 시각 (Unix timestamp)
+        result_job_ids (list[str]): 본문에 포함된 평가 결과의 작업 ID 목록 (평가 결과 콜백만 해당)
+            아웃박스에 남아 있는 동안 해당 작업의 채점 완료, 에러 이벤트를 평가 결과 이후로 미루는 데 사용
+    """
+    path: str
+    body: Any
+    event_count: int = 1
+    delivery_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+    created_at: float = field(default_factory=time.time)
+    result_job_ids: list[str] = field(default_factory=list)
+
+
+# 아웃박스 키
+# - "{prefix}:due" (sorted set): delivery_id -> 다음 전송 시각 (ms)
+# - "{prefix}:deliveries" (hash): delivery_id -> 인코딩된 CallbackDelivery
+# - "{prefix}:dead" (list): 최대 시도 횟수를 넘었거나 재시도할 수 없는 응답을 받은 콜백 (최근 항목이 앞)
+# - "{prefix}:pending-jobs" (hash): job_id -> 아웃박스에 있는 해당 작업의 평가 결과 콜백 수 (0이 되면 필드 삭제)
+
+# 콜백을 저장(또는 갱신)하고 다음 전송 시각을 정함. 처음 저장하는 평가 결과 콜백이면 작업별 대기 중인 평가 결과 콜백 수를 늘림
+# - KEYS[1]: due, KEYS[2]: deliveries, KEYS[3]: pending-jobs
+# - ARGV[1]: delivery_id, ARGV[2]: 인코딩된 콜백, ARGV[3]: 다음 전송 시각 (ms), ARGV[4...]: 평가 결과의 작업 ID 목록
+_SCHEDULE_SCRIPT = """
+if redis.call('HSET', KEYS[2], ARGV[1], ARGV[2]) == 1 then
+    for i = 4, #ARGV do
+        redis.call('HINCRBY', KEYS[3], ARGV[i], 1)
+    end
+end
+redis.call('ZADD', KEYS[1], tonumber(ARGV[3]), ARGV[1])
+"""
+
+# 콜백을 아웃박스에서 제거(전송 완료 또는 dead letter 이동)하고, 작업별 대기 중인 평가 결과 콜백 수를 줄임
+# - KEYS[1]: due, KEYS[2]: deliveries, KEYS[3]: pending-jobs, KEYS[4]: dead
+# - ARGV[1]: delivery_id, ARGV[2]: dead letter로 저장할 인코딩된 콜백 (빈 문자열: 전송 완료), ARGV[3]: 최대 dead letter 수,
+#   ARGV[4...]: 평가 결과의 작업 ID 목록
+_RELEASE_SCRIPT = """
+redis.call('ZREM', KEYS[1], ARGV[1])
+if redis.call('HDEL', KEYS[2], ARGV[1]) == 1 then
+    for i = 4, #ARGV do
+        if redis.call('HINCRBY', KEYS[3], ARGV[i], -1) <= 0 then
+            redis.call('HDEL', KEYS[3], ARGV[i])
+        end
+    end
+end
+if ARGV[2] ~= '' then
+    redis.call('LPUSH', KEYS[4], ARGV[2])
+    redis.call('LTRIM', KEYS[4], 0, tonumber(ARGV[3]) - 1)
+end
+"""
+
+# 전송 시각이 된 콜백을 가져오면서 다음 전송 시각을 lease 이후로 미뤄, 다른 프로세스가 같은 콜백을 동시에 가져가지 않도록 함
+# (가져간 프로세스가 종료되어 완료/재시도 처리를 하지 못해도 lease가 지나면 다시 전송됨)
+# - KEYS[1]: due, KEYS[2]: deliveries
+# - ARGV[1]: 현재 시각 (ms), ARGV[2]: 최대 개수, ARGV[3]: lease (ms)
+_CLAIM_DUE_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+if #ids == 0 then
+    return {}
+end
+local lease_until = tonumber(ARGV[1]) + tonumber(ARGV[3])
+local deliveries = redis.call('HMGET', KEYS[2], unpack(ids))
+local result = {}
+for i, id in ipairs(ids) do
+    if deliveries[i] then
+        redis.call('ZADD', KEYS[1], lease_until, id)
+        table.insert(result, deliveries[i])
+    else
+        redis.call('ZREM', KEYS[1], id)
+    end
+end
+return result
+"""
+
+
+class CallbackOutbox:
+    """
+    Description:
+        전송에 실패한 콜백을 Redis에 저장하고, 다음 전송 시각이 된 콜백을 꺼내주는 아웃박스 클래스.
+        프로세스가 종료되어도 저장된 콜백은 남아 있으므로, 같은 아웃박스를 사용하는 어느 프로세스(워커, API 서버)에서든 다시 전송된다.
+        작업별로 아웃박스에 남아 있는 평가 결과 콜백 수를 함께 관리하여, 전송기가 채점 완료 이벤트를 평가 결과보다 먼저 보내지 않도록 한다.
+    """
+
+    def __init__(self, redis_client: redis.StrictRedis, key_prefix: str, max_dead_letters: int = 10000):
+        self._redis_client = redis_client
+        self._due_key = f"{key_prefix}:due"
+        self._deliveries_key = f"{key_prefix}:deliveries"
+        self._dead_key = f"{key_prefix}:dead"
+        self._pending_jobs_key = f"{key_prefix}:pending-jobs"
+        self._max_dead_letters = max_dead_letters
+        self._codec = JsonCodec()
+        self._claim_due_script = redis_client.register_script(_CLAIM_DUE_SCRIPT)
+        self._schedule_script = redis_client.register_script(_SCHEDULE_SCRIPT)
+        self._release_script = redis_client.register_script(_RELEASE_SCRIPT)
+
+    def schedule(self, delivery: CallbackDelivery, due_at: float):
+        """콜백을 저장(또는 갱신)하고 due_at(Unix timestamp)에 다시 전송되도록 한다."""
+        self._schedule_script(
+            keys=[self._due_key, self._deliveries_key, self._pending_jobs_key],
+            args=[delivery.delivery_id, self._encode(delivery), int(due_at * 1000), *delivery.result_job_ids]
+        )
+
+    def claim_due(self, limit: int, lease_seconds: float) -> list[CallbackDelivery]:
+        """전송 시각이 된 콜백을 최대 limit개 가져온다. (lease_seconds 동안 다른 프로세스는 가져가지 않음)"""
+        deliveries = self._claim_due_script(
+            keys=[self._due_key, self._deliveries_key],
+            args=[int(time.time() * 1000), limit, int(lease_seconds * 1000)]
+        )
+        return [self._decode(delivery) for delivery in deliveries]
+
+    def complete(self, delivery: CallbackDelivery):
+        self._release(delivery, dead_letter=b"")
+
+    def dead_letter(self, delivery: CallbackDelivery):
+        self._release(delivery, dead_letter=self._encode(delivery))
+
+    def pending_count(self) -> int:
+        return self._redis_client.zcard(self._due_key)
+
+    def has_pending_results(self, job_id: str) -> bool:
+        """작업의 평가 결과 콜백이 아웃박스에서 재전송을 기다리고 있는지 확인한다."""
+        return bool(self._redis_client.hexists(self._pending_jobs_key, job_id))
+
+    def _release(self, delivery: CallbackDelivery, dead_letter: bytes):
+        self._release_script(
+            keys=[self._due_key, self._deliveries_key, self._pending_jobs_key, self._dead_key],
+            args=[delivery.delivery_id, dead_letter, self._max_dead_letters, *delivery.result_job_ids]
+        )
+
+    def _encode(self, delivery: CallbackDelivery) -> bytes:
+        return self._codec.encode(delivery.__dict__)
+
+    def _decode(self, data: Union[str, bytes]) -> CallbackDelivery:
+        return CallbackDelivery(**self._codec.decode(data))